@@ -0,0 +1,37 @@
+"""Numeric kernels for the unified controller's economic impact engine.
+
+Kept apart from ``unified_master_controller`` so the controller can be
+imported without loading Numba; the engine imports this module when it is
+first constructed, and ``cache=True`` loads the compiled kernel from
+Numba's cache (see ``core.jit``) on later runs.
+"""
+from __future__ import annotations
+
+from typing import Any, Mapping, Tuple
+
+import numpy as np
+
+from core.jit import njit
+
+
+def impact_inputs(projections: Mapping[str, Any]) -> Tuple[np.ndarray, ...]:
+    """
+    Flatten economic projections into the float64 component arrays taken by
+    ``aggregate_impact``: job and revenue components without their totals,
+    the cost savings (10-year total last) and the investment sources.
+    """
+    jobs = [value for key, value in projections['job_creation'].items() if key != 'total_jobs']
+    revenue = [value for key, value in projections['revenue_generation'].items() if key != 'total_revenue']
+    savings = list(projections['cost_savings'].values())
+    investment = [value for key, value in projections['investment_returns'].items()
+                  if key not in ('total_investment', 'roi_timeline')]
+    return tuple(np.array(values, dtype=np.float64) for values in (jobs, revenue, savings, investment))
+
+
+@njit(cache=True, fastmath=True)
+def aggregate_impact(jobs: np.ndarray,
+                     revenue: np.ndarray,
+                     savings: np.ndarray,
+                     investment: np.ndarray) -> Tuple[float, float, float, float]:
+    """Total jobs, annual revenue, 10-year savings and total investment."""
+    return jobs.sum(), revenue.sum(), savings[-1], investment.sum()
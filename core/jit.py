@@ -0,0 +1,42 @@
+"""Optional Numba JIT support for numeric kernels.
+
+``njit`` compiles with Numba when it is installed and otherwise returns the
+function unchanged, so modules stay importable on the minimal requirements.
+``prange`` likewise falls back to the builtin ``range``.
+
+Compiled ``cache=True`` kernels are stored under the repository's
+``.numba_cache/`` when the checkout is writable, so later runs load them
+instead of recompiling. An explicit ``NUMBA_CACHE_DIR`` always wins, and on
+read-only installs Numba's default cache location is used.
+"""
+from __future__ import annotations
+
+import os
+
+_REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+_CACHE_DIR = os.path.join(_REPO_DIR, ".numba_cache")
+
+# Must be set before numba is imported; numba reads it at import time (and
+# again on every compile, so setting numba.config directly would not stick).
+if "NUMBA_CACHE_DIR" not in os.environ and os.access(
+        _CACHE_DIR if os.path.isdir(_CACHE_DIR) else _REPO_DIR, os.W_OK):
+    os.environ["NUMBA_CACHE_DIR"] = _CACHE_DIR
+
+try:
+    import numba
+except ImportError:  # numba is an optional performance dependency
+    numba = None
+
+NUMBA_AVAILABLE: bool = numba is not None
+
+#: ``numba.prange`` for parallel loops; plain ``range`` when Numba is absent.
+prange = numba.prange if numba is not None else range
+
+
+def njit(*args, **kwargs):
+    """Drop-in for ``numba.njit`` that degrades to a no-op decorator."""
+    if numba is not None:
+        return numba.njit(*args, **kwargs)
+    if len(args) == 1 and callable(args[0]) and not kwargs:
+        return args[0]
+    return lambda func: func
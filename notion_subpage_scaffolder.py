@@ -4,10 +4,385 @@
 Creates additional subpages for each project component based on Nova Sanctum layout
 """
 
+import argparse
+import io
+import json
+import sys
 import webbrowser
+from contextlib import contextmanager, redirect_stdout
 from datetime import datetime
 
+try:
+    import orjson
+except ImportError:  # optional fast path for --json
+    orjson = None
+
+
+_ROW_TMPL = "\n📄 {title}\n📝 Description: {description}\n📋 Sections:\n{bullets}\n🔗 Create subpage: /{cid}"
+
+
+def _sections(*names):
+    """Intern section names so titles shared across categories are one object"""
+    return tuple(sys.intern(name) for name in names)
+
+
+@contextmanager
+def _buffered_stdout(buffer_size=65536):
+    """Send print() output through one block-buffered writer instead of per-line flushes"""
+    try:
+        fd = sys.stdout.fileno()
+    except (AttributeError, OSError, ValueError):
+        # stdout is not backed by a file descriptor (e.g. captured output)
+        yield
+        return
+    sys.stdout.flush()
+    raw = io.FileIO(fd, "w", closefd=False)
+    out = io.TextIOWrapper(io.BufferedWriter(raw, buffer_size=buffer_size),
+                           encoding=sys.stdout.encoding or "utf-8",
+                           errors=sys.stdout.errors)
+    try:
+        with redirect_stdout(out):
+            yield
+    finally:
+        out.close()
+
+
+_TECH_COMPONENTS = {
+    "infrared_nanoparticle_integration": {
+        "title": "🔴 Infrared Nanoparticle Integration System",
+        "description": "Upconversion nanoparticles (UCNPs) with 95% efficiency",
+        "sections": _sections(
+            "Technical Specifications",
+            "Performance Metrics", 
+            "Integration Process",
+            "Testing Results",
+            "Future Enhancements"
+        )
+    },
+    "glasssphere_os": {
+        "title": "💎 GlassSphere OS - Neuro-Interface Layer",
+        "description": "Frequency-modulated touch interfaces with 5-modal authentication",
+        "sections": _sections(
+            "Authentication Methods",
+            "Interface Modes",
+            "Biofield Processing",
+            "Security Protocols",
+            "User Experience"
+        )
+    },
+    "ucnp_translation_engine": {
+        "title": "⚡ UCNP Translation Engine",
+        "description": "Rare-earth upconversion nanoparticles for IR-to-visible conversion",
+        "sections": _sections(
+            "Particle Specifications",
+            "Conversion Efficiency",
+            "Material Properties",
+            "Manufacturing Process",
+            "Quality Control"
+        )
+    },
+    "quartz_touch_interface": {
+        "title": "🔮 Quartz-Touch Neural Feedback Mesh",
+        "description": "Ultrathin graphene-Q touch layer with nano-quartz lattice",
+        "sections": _sections(
+            "Touch Layer Design",
+            "Neural Feedback System",
+            "Crystalline Resonance",
+            "Input Registration",
+            "Response Time Analysis"
+        )
+    },
+    "closed_eye_vision": {
+        "title": "👁️ Closed-Eye Vision Simulation Kernel",
+        "description": "Frequency entrainment and energetic resonance for third-eye activation",
+        "sections": _sections(
+            "Frequency Entrainment",
+            "Schumann Resonance Tuning",
+            "Third-Eye Activation",
+            "Vision Simulation",
+            "User Training"
+        )
+    },
+    "ui_shell": {
+        "title": "🖥️ GlassSphere UI Shell with IR Overlays",
+        "description": "Custom UI with IR signal overlays and multiple vision modes",
+        "sections": _sections(
+            "UI Design Principles",
+            "IR Overlay System",
+            "Vision Modes",
+            "User Interface",
+            "Customization Options"
+        )
+    },
+    "integration_demo": {
+        "title": "🎯 Complete Integration Demonstration",
+        "description": "Comprehensive demonstration system with real-time processing",
+        "sections": _sections(
+            "Demo Setup",
+            "Real-time Processing",
+            "Performance Testing",
+            "User Scenarios",
+            "Demo Scripts"
+        )
+    }
+}
+
+
+_ARCH_LAYERS = {
+    "crystalline_quartz_layer": {
+        "title": "💎 Layer 1: Crystalline Quartz Capacitor Layer",
+        "description": "Enhanced Synthetic Quartz with piezoelectric properties",
+        "sections": _sections(
+            "Material Properties",
+            "Piezoelectric Constants",
+            "Energy Storage",
+            "Frequency Response",
+            "Manufacturing Process"
+        )
+    },
+    "nanoparticle_matrix": {
+        "title": "🔬 Layer 2: Nanoparticle-Matrix Display",
+        "description": "Quantum Dot Enhanced UCNP Lattice with 4K+ resolution",
+        "sections": _sections(
+            "Matrix Design",
+            "Particle Density",
+            "Upconversion Efficiency",
+            "Display Resolution",
+            "Thermal Management"
+        )
+    },
+    "neuro_interface_layer": {
+        "title": "🧠 Layer 3: Neuro-Interface Layer",
+        "description": "Frequency-Modulated Touch with biofield sensitivity",
+        "sections": _sections(
+            "Biofield Detection",
+            "Brainwave Analysis",
+            "Chakra Frequency Mapping",
+            "Touch Interface",
+            "Neural Processing"
+        )
+    },
+    "glasssphere_os_layer": {
+        "title": "💻 Layer 4: GlassSphere OS",
+        "description": "Neuro-Interface Operating System with real-time processing",
+        "sections": _sections(
+            "OS Architecture",
+            "Authentication System",
+            "Interface Modes",
+            "Real-time Processing",
+            "System Integration"
+        )
+    }
+}
+
+
+_APP_PLATFORMS = {
+    "glasssphere_hud": {
+        "title": "🥽 GlassSphere HUD (Heads-Up Display)",
+        "description": "Night-vision overlays with third-eye projection capabilities",
+        "sections": _sections(
+            "HUD Design",
+            "Night-vision System",
+            "Aura Detection",
+            "Third-eye Projection",
+            "User Interface"
+        )
+    },
+    "crystal_tablets": {
+        "title": "📱 Crystal Tablets (Touch Slabs)",
+        "description": "Energy diagnostics with spiritual mapping capabilities",
+        "sections": _sections(
+            "Tablet Design",
+            "Energy Diagnostics",
+            "Spiritual Mapping",
+            "IR Communication",
+            "Biofield Sensing"
+        )
+    },
+    "scryglass_screens": {
+        "title": "🖥️ ScryGlass Screens (Monolithic Displays)",
+        "description": "Dream visuals with ritual visualization capabilities",
+        "sections": _sections(
+            "Screen Technology",
+            "Dream Visualization",
+            "Ritual Interface",
+            "Aura Mapping",
+            "Spiritual Communication"
+        )
+    },
+    "sovereign_systems": {
+        "title": "🛡️ Sovereign Systems (Surveillance)",
+        "description": "Enhanced surveillance with IR truth detection",
+        "sections": _sections(
+            "Surveillance System",
+            "IR Truth Detection",
+            "Justice Visual Logs",
+            "Energy Field Monitoring",
+            "Spiritual Attunement Tracking"
+        )
+    }
+}
+
+
+_RESEARCH_AREAS = {
+    "chinese_technology_integration": {
+        "title": "🇨🇳 Chinese Technology Integration",
+        "description": "Infrared contact lens technology with 95% efficiency",
+        "sections": _sections(
+            "Technology Overview",
+            "Integration Process",
+            "Efficiency Analysis",
+            "Patent Research",
+            "Collaboration Opportunities"
+        )
+    },
+    "crystalline_quartz_research": {
+        "title": "💎 Crystalline Quartz Research",
+        "description": "Enhanced synthetic quartz with piezoelectric properties",
+        "sections": _sections(
+            "Material Science",
+            "Piezoelectric Properties",
+            "Energy Storage Research",
+            "Manufacturing Methods",
+            "Quality Standards"
+        )
+    },
+    "nanoparticle_development": {
+        "title": "🔬 Nanoparticle Development",
+        "description": "UCNP synthesis and optimization for IR conversion",
+        "sections": _sections(
+            "Synthesis Methods",
+            "Particle Optimization",
+            "Efficiency Testing",
+            "Scalability Research",
+            "Quality Control"
+        )
+    },
+    "neuro_interface_research": {
+        "title": "🧠 Neuro-Interface Research",
+        "description": "Frequency-modulated touch and biofield processing",
+        "sections": _sections(
+            "Biofield Research",
+            "Touch Interface Development",
+            "Neural Processing",
+            "User Experience Studies",
+            "Clinical Testing"
+        )
+    }
+}
+
+
+_BUSINESS_AREAS = {
+    "market_analysis": {
+        "title": "📊 Market Analysis",
+        "description": "Comprehensive market research and projections",
+        "sections": _sections(
+            "Market Size Analysis",
+            "Competitive Landscape",
+            "Target Markets",
+            "Growth Projections",
+            "Market Trends"
+        )
+    },
+    "economic_impact": {
+        "title": "💼 Economic Impact Assessment",
+        "description": "Economic impact analysis and job creation projections",
+        "sections": _sections(
+            "Economic Modeling",
+            "Job Creation Analysis",
+            "Investment Requirements",
+            "ROI Projections",
+            "Economic Benefits"
+        )
+    },
+    "business_strategy": {
+        "title": "🎯 Business Strategy",
+        "description": "Strategic planning and business development",
+        "sections": _sections(
+            "Strategic Planning",
+            "Business Model",
+            "Go-to-Market Strategy",
+            "Partnership Development",
+            "Revenue Streams"
+        )
+    },
+    "intellectual_property": {
+        "title": "📜 Intellectual Property",
+        "description": "Patent strategy and IP protection",
+        "sections": _sections(
+            "Patent Strategy",
+            "IP Portfolio",
+            "Patent Applications",
+            "IP Protection",
+            "Licensing Strategy"
+        )
+    }
+}
+
+
+_IMPL_AREAS = {
+    "development_roadmap": {
+        "title": "🗺️ Development Roadmap",
+        "description": "Detailed development timeline and milestones",
+        "sections": _sections(
+            "Phase 1: Core Technology",
+            "Phase 2: Interface Development",
+            "Phase 3: Advanced Features",
+            "Phase 4: Platform Integration",
+            "Phase 5: AI Integration"
+        )
+    },
+    "deployment_strategy": {
+        "title": "📦 Deployment Strategy",
+        "description": "Strategic deployment and rollout planning",
+        "sections": _sections(
+            "Deployment Planning",
+            "Rollout Strategy",
+            "Infrastructure Requirements",
+            "Testing Protocols",
+            "Go-Live Process"
+        )
+    },
+    "training_programs": {
+        "title": "🎓 Training Programs",
+        "description": "User training and certification programs",
+        "sections": _sections(
+            "Training Curriculum",
+            "Certification Programs",
+            "User Onboarding",
+            "Advanced Training",
+            "Training Materials"
+        )
+    },
+    "support_systems": {
+        "title": "🛠️ Support Systems",
+        "description": "Technical support and maintenance systems",
+        "sections": _sections(
+            "Technical Support",
+            "Maintenance Procedures",
+            "Troubleshooting Guides",
+            "Support Documentation",
+            "Escalation Procedures"
+        )
+    }
+}
+
+
+_SUBPAGE_CATEGORIES = (
+    ("Technology Component", _TECH_COMPONENTS),
+    ("System Architecture", _ARCH_LAYERS),
+    ("Application Platform", _APP_PLATFORMS),
+    ("Research & Development", _RESEARCH_AREAS),
+    ("Business & Economic", _BUSINESS_AREAS),
+    ("Implementation & Deployment", _IMPL_AREAS),
+)
+
+_PLAN_KEYS = ("technology", "architecture", "applications", "research", "business", "implementation")
+
+
 class NotionSubpageScaffolder:
+    __slots__ = ("nova_sanctum_url", "glasssphere_url")
+
     def __init__(self):
         self.nova_sanctum_url = "https://www.notion.so/Nova-Sanctum-Project-22cc06dba88d808daf06ef13a11cf8a5"
         self.glasssphere_url = "https://www.notion.so/GLASSPHERE-Project-22cc06dba88d805fa936ce2a6345a590"
@@ -16,6 +391,13 @@ class NotionSubpageScaffolder:
         """Open the Nova Sanctum page to examine layout"""
         print(f"🔗 Opening Nova Sanctum page: {self.nova_sanctum_url}")
         webbrowser.open(self.nova_sanctum_url)
+
+    def _print_subpages(self, subpages):
+        """Print one formatted block per subpage definition"""
+        for cid, subpage in subpages.items():
+            bullets = "\n".join(f"   • {section}" for section in subpage['sections'])
+            print(_ROW_TMPL.format(cid=cid, title=subpage['title'],
+                                   description=subpage['description'], bullets=bullets))
         
     def create_technology_subpages(self):
         """Create subpages for each technology component"""
@@ -23,93 +405,7 @@ class NotionSubpageScaffolder:
         print("🧩 TECHNOLOGY COMPONENT SUBPAGES")
         print("="*60)
         
-        tech_components = {
-            "infrared_nanoparticle_integration": {
-                "title": "🔴 Infrared Nanoparticle Integration System",
-                "description": "Upconversion nanoparticles (UCNPs) with 95% efficiency",
-                "sections": [
-                    "Technical Specifications",
-                    "Performance Metrics", 
-                    "Integration Process",
-                    "Testing Results",
-                    "Future Enhancements"
-                ]
-            },
-            "glasssphere_os": {
-                "title": "💎 GlassSphere OS - Neuro-Interface Layer",
-                "description": "Frequency-modulated touch interfaces with 5-modal authentication",
-                "sections": [
-                    "Authentication Methods",
-                    "Interface Modes",
-                    "Biofield Processing",
-                    "Security Protocols",
-                    "User Experience"
-                ]
-            },
-            "ucnp_translation_engine": {
-                "title": "⚡ UCNP Translation Engine",
-                "description": "Rare-earth upconversion nanoparticles for IR-to-visible conversion",
-                "sections": [
-                    "Particle Specifications",
-                    "Conversion Efficiency",
-                    "Material Properties",
-                    "Manufacturing Process",
-                    "Quality Control"
-                ]
-            },
-            "quartz_touch_interface": {
-                "title": "🔮 Quartz-Touch Neural Feedback Mesh",
-                "description": "Ultrathin graphene-Q touch layer with nano-quartz lattice",
-                "sections": [
-                    "Touch Layer Design",
-                    "Neural Feedback System",
-                    "Crystalline Resonance",
-                    "Input Registration",
-                    "Response Time Analysis"
-                ]
-            },
-            "closed_eye_vision": {
-                "title": "👁️ Closed-Eye Vision Simulation Kernel",
-                "description": "Frequency entrainment and energetic resonance for third-eye activation",
-                "sections": [
-                    "Frequency Entrainment",
-                    "Schumann Resonance Tuning",
-                    "Third-Eye Activation",
-                    "Vision Simulation",
-                    "User Training"
-                ]
-            },
-            "ui_shell": {
-                "title": "🖥️ GlassSphere UI Shell with IR Overlays",
-                "description": "Custom UI with IR signal overlays and multiple vision modes",
-                "sections": [
-                    "UI Design Principles",
-                    "IR Overlay System",
-                    "Vision Modes",
-                    "User Interface",
-                    "Customization Options"
-                ]
-            },
-            "integration_demo": {
-                "title": "🎯 Complete Integration Demonstration",
-                "description": "Comprehensive demonstration system with real-time processing",
-                "sections": [
-                    "Demo Setup",
-                    "Real-time Processing",
-                    "Performance Testing",
-                    "User Scenarios",
-                    "Demo Scripts"
-                ]
-            }
-        }
-        
-        for component_id, component in tech_components.items():
-            print(f"\n📄 {component['title']}")
-            print(f"📝 Description: {component['description']}")
-            print("📋 Sections:")
-            for section in component['sections']:
-                print(f"   • {section}")
-            print(f"🔗 Create subpage: /{component_id}")
+        self._print_subpages(_TECH_COMPONENTS)
             
     def create_architecture_subpages(self):
         """Create subpages for system architecture layers"""
@@ -117,60 +413,7 @@ class NotionSubpageScaffolder:
         print("🏗️ SYSTEM ARCHITECTURE SUBPAGES")
         print("="*60)
         
-        architecture_layers = {
-            "crystalline_quartz_layer": {
-                "title": "💎 Layer 1: Crystalline Quartz Capacitor Layer",
-                "description": "Enhanced Synthetic Quartz with piezoelectric properties",
-                "sections": [
-                    "Material Properties",
-                    "Piezoelectric Constants",
-                    "Energy Storage",
-                    "Frequency Response",
-                    "Manufacturing Process"
-                ]
-            },
-            "nanoparticle_matrix": {
-                "title": "🔬 Layer 2: Nanoparticle-Matrix Display",
-                "description": "Quantum Dot Enhanced UCNP Lattice with 4K+ resolution",
-                "sections": [
-                    "Matrix Design",
-                    "Particle Density",
-                    "Upconversion Efficiency",
-                    "Display Resolution",
-                    "Thermal Management"
-                ]
-            },
-            "neuro_interface_layer": {
-                "title": "🧠 Layer 3: Neuro-Interface Layer",
-                "description": "Frequency-Modulated Touch with biofield sensitivity",
-                "sections": [
-                    "Biofield Detection",
-                    "Brainwave Analysis",
-                    "Chakra Frequency Mapping",
-                    "Touch Interface",
-                    "Neural Processing"
-                ]
-            },
-            "glasssphere_os_layer": {
-                "title": "💻 Layer 4: GlassSphere OS",
-                "description": "Neuro-Interface Operating System with real-time processing",
-                "sections": [
-                    "OS Architecture",
-                    "Authentication System",
-                    "Interface Modes",
-                    "Real-time Processing",
-                    "System Integration"
-                ]
-            }
-        }
-        
-        for layer_id, layer in architecture_layers.items():
-            print(f"\n📄 {layer['title']}")
-            print(f"📝 Description: {layer['description']}")
-            print("📋 Sections:")
-            for section in layer['sections']:
-                print(f"   • {section}")
-            print(f"🔗 Create subpage: /{layer_id}")
+        self._print_subpages(_ARCH_LAYERS)
             
     def create_application_subpages(self):
         """Create subpages for application platforms"""
@@ -178,60 +421,7 @@ class NotionSubpageScaffolder:
         print("🌌 APPLICATION PLATFORM SUBPAGES")
         print("="*60)
         
-        application_platforms = {
-            "glasssphere_hud": {
-                "title": "🥽 GlassSphere HUD (Heads-Up Display)",
-                "description": "Night-vision overlays with third-eye projection capabilities",
-                "sections": [
-                    "HUD Design",
-                    "Night-vision System",
-                    "Aura Detection",
-                    "Third-eye Projection",
-                    "User Interface"
-                ]
-            },
-            "crystal_tablets": {
-                "title": "📱 Crystal Tablets (Touch Slabs)",
-                "description": "Energy diagnostics with spiritual mapping capabilities",
-                "sections": [
-                    "Tablet Design",
-                    "Energy Diagnostics",
-                    "Spiritual Mapping",
-                    "IR Communication",
-                    "Biofield Sensing"
-                ]
-            },
-            "scryglass_screens": {
-                "title": "🖥️ ScryGlass Screens (Monolithic Displays)",
-                "description": "Dream visuals with ritual visualization capabilities",
-                "sections": [
-                    "Screen Technology",
-                    "Dream Visualization",
-                    "Ritual Interface",
-                    "Aura Mapping",
-                    "Spiritual Communication"
-                ]
-            },
-            "sovereign_systems": {
-                "title": "🛡️ Sovereign Systems (Surveillance)",
-                "description": "Enhanced surveillance with IR truth detection",
-                "sections": [
-                    "Surveillance System",
-                    "IR Truth Detection",
-                    "Justice Visual Logs",
-                    "Energy Field Monitoring",
-                    "Spiritual Attunement Tracking"
-                ]
-            }
-        }
-        
-        for platform_id, platform in application_platforms.items():
-            print(f"\n📄 {platform['title']}")
-            print(f"📝 Description: {platform['description']}")
-            print("📋 Sections:")
-            for section in platform['sections']:
-                print(f"   • {section}")
-            print(f"🔗 Create subpage: /{platform_id}")
+        self._print_subpages(_APP_PLATFORMS)
             
     def create_research_subpages(self):
         """Create subpages for research and development"""
@@ -239,60 +429,7 @@ class NotionSubpageScaffolder:
         print("🔬 RESEARCH & DEVELOPMENT SUBPAGES")
         print("="*60)
         
-        research_areas = {
-            "chinese_technology_integration": {
-                "title": "🇨🇳 Chinese Technology Integration",
-                "description": "Infrared contact lens technology with 95% efficiency",
-                "sections": [
-                    "Technology Overview",
-                    "Integration Process",
-                    "Efficiency Analysis",
-                    "Patent Research",
-                    "Collaboration Opportunities"
-                ]
-            },
-            "crystalline_quartz_research": {
-                "title": "💎 Crystalline Quartz Research",
-                "description": "Enhanced synthetic quartz with piezoelectric properties",
-                "sections": [
-                    "Material Science",
-                    "Piezoelectric Properties",
-                    "Energy Storage Research",
-                    "Manufacturing Methods",
-                    "Quality Standards"
-                ]
-            },
-            "nanoparticle_development": {
-                "title": "🔬 Nanoparticle Development",
-                "description": "UCNP synthesis and optimization for IR conversion",
-                "sections": [
-                    "Synthesis Methods",
-                    "Particle Optimization",
-                    "Efficiency Testing",
-                    "Scalability Research",
-                    "Quality Control"
-                ]
-            },
-            "neuro_interface_research": {
-                "title": "🧠 Neuro-Interface Research",
-                "description": "Frequency-modulated touch and biofield processing",
-                "sections": [
-                    "Biofield Research",
-                    "Touch Interface Development",
-                    "Neural Processing",
-                    "User Experience Studies",
-                    "Clinical Testing"
-                ]
-            }
-        }
-        
-        for research_id, research in research_areas.items():
-            print(f"\n📄 {research['title']}")
-            print(f"📝 Description: {research['description']}")
-            print("📋 Sections:")
-            for section in research['sections']:
-                print(f"   • {section}")
-            print(f"🔗 Create subpage: /{research_id}")
+        self._print_subpages(_RESEARCH_AREAS)
             
     def create_business_subpages(self):
         """Create subpages for business and economic aspects"""
@@ -300,60 +437,7 @@ class NotionSubpageScaffolder:
         print("💰 BUSINESS & ECONOMIC SUBPAGES")
         print("="*60)
         
-        business_areas = {
-            "market_analysis": {
-                "title": "📊 Market Analysis",
-                "description": "Comprehensive market research and projections",
-                "sections": [
-                    "Market Size Analysis",
-                    "Competitive Landscape",
-                    "Target Markets",
-                    "Growth Projections",
-                    "Market Trends"
-                ]
-            },
-            "economic_impact": {
-                "title": "💼 Economic Impact Assessment",
-                "description": "Economic impact analysis and job creation projections",
-                "sections": [
-                    "Economic Modeling",
-                    "Job Creation Analysis",
-                    "Investment Requirements",
-                    "ROI Projections",
-                    "Economic Benefits"
-                ]
-            },
-            "business_strategy": {
-                "title": "🎯 Business Strategy",
-                "description": "Strategic planning and business development",
-                "sections": [
-                    "Strategic Planning",
-                    "Business Model",
-                    "Go-to-Market Strategy",
-                    "Partnership Development",
-                    "Revenue Streams"
-                ]
-            },
-            "intellectual_property": {
-                "title": "📜 Intellectual Property",
-                "description": "Patent strategy and IP protection",
-                "sections": [
-                    "Patent Strategy",
-                    "IP Portfolio",
-                    "Patent Applications",
-                    "IP Protection",
-                    "Licensing Strategy"
-                ]
-            }
-        }
-        
-        for business_id, business in business_areas.items():
-            print(f"\n📄 {business['title']}")
-            print(f"📝 Description: {business['description']}")
-            print("📋 Sections:")
-            for section in business['sections']:
-                print(f"   • {section}")
-            print(f"🔗 Create subpage: /{business_id}")
+        self._print_subpages(_BUSINESS_AREAS)
             
     def create_implementation_subpages(self):
         """Create subpages for implementation and deployment"""
@@ -361,105 +445,75 @@ class NotionSubpageScaffolder:
         print("🚀 IMPLEMENTATION & DEPLOYMENT SUBPAGES")
         print("="*60)
         
-        implementation_areas = {
-            "development_roadmap": {
-                "title": "🗺️ Development Roadmap",
-                "description": "Detailed development timeline and milestones",
-                "sections": [
-                    "Phase 1: Core Technology",
-                    "Phase 2: Interface Development",
-                    "Phase 3: Advanced Features",
-                    "Phase 4: Platform Integration",
-                    "Phase 5: AI Integration"
-                ]
-            },
-            "deployment_strategy": {
-                "title": "📦 Deployment Strategy",
-                "description": "Strategic deployment and rollout planning",
-                "sections": [
-                    "Deployment Planning",
-                    "Rollout Strategy",
-                    "Infrastructure Requirements",
-                    "Testing Protocols",
-                    "Go-Live Process"
-                ]
-            },
-            "training_programs": {
-                "title": "🎓 Training Programs",
-                "description": "User training and certification programs",
-                "sections": [
-                    "Training Curriculum",
-                    "Certification Programs",
-                    "User Onboarding",
-                    "Advanced Training",
-                    "Training Materials"
-                ]
-            },
-            "support_systems": {
-                "title": "🛠️ Support Systems",
-                "description": "Technical support and maintenance systems",
-                "sections": [
-                    "Technical Support",
-                    "Maintenance Procedures",
-                    "Troubleshooting Guides",
-                    "Support Documentation",
-                    "Escalation Procedures"
-                ]
-            }
-        }
-        
-        for implementation_id, implementation in implementation_areas.items():
-            print(f"\n📄 {implementation['title']}")
-            print(f"📝 Description: {implementation['description']}")
-            print("📋 Sections:")
-            for section in implementation['sections']:
-                print(f"   • {section}")
-            print(f"🔗 Create subpage: /{implementation_id}")
+        self._print_subpages(_IMPL_AREAS)
             
+    def get_subpage_plan(self):
+        """Return every subpage definition grouped by category"""
+        return {
+            key: [{"id": cid, **subpage} for cid, subpage in subpages.items()]
+            for key, (_, subpages) in zip(_PLAN_KEYS, _SUBPAGE_CATEGORIES)
+        }
+
+    def write_subpage_plan_json(self):
+        """Write the subpage plan to stdout as compact JSON"""
+        plan = self.get_subpage_plan()
+        if orjson is not None:
+            sys.stdout.flush()
+            sys.stdout.buffer.write(orjson.dumps(plan))
+            sys.stdout.buffer.flush()
+        else:
+            sys.stdout.write(json.dumps(plan, ensure_ascii=False, separators=(",", ":")))
+            sys.stdout.flush()
+
     def run_complete_scaffolding(self):
         """Run the complete subpage scaffolding process"""
-        print("🔮 GLASSPHERE Notion Subpage Scaffolder")
-        print("="*60)
-        print(f"🕐 Started at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+        with _buffered_stdout():
+            print("🔮 GLASSPHERE Notion Subpage Scaffolder")
+            print("="*60)
+            print(f"🕐 Started at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
         
-        # Open Nova Sanctum page for reference
-        self.open_nova_sanctum_page()
+            # Open Nova Sanctum page for reference
+            self.open_nova_sanctum_page()
         
-        # Create all subpage categories
-        self.create_technology_subpages()
-        self.create_architecture_subpages()
-        self.create_application_subpages()
-        self.create_research_subpages()
-        self.create_business_subpages()
-        self.create_implementation_subpages()
+            # Create all subpage categories
+            self.create_technology_subpages()
+            self.create_architecture_subpages()
+            self.create_application_subpages()
+            self.create_research_subpages()
+            self.create_business_subpages()
+            self.create_implementation_subpages()
         
-        # Final summary
-        print("\n" + "="*60)
-        print("🎉 SUBPAGE SCAFFOLDING COMPLETE!")
-        print("="*60)
-        print("✅ All subpage structures have been defined")
-        print("📋 Follow the Nova Sanctum layout pattern")
-        print("🔗 Create subpages using the provided structure")
-        print("🌟 Your GLASSPHERE project will have comprehensive documentation!")
+            # Final summary
+            print("\n" + "="*60)
+            print("🎉 SUBPAGE SCAFFOLDING COMPLETE!")
+            print("="*60)
+            print("✅ All subpage structures have been defined")
+            print("📋 Follow the Nova Sanctum layout pattern")
+            print("🔗 Create subpages using the provided structure")
+            print("🌟 Your GLASSPHERE project will have comprehensive documentation!")
         
-        print("\n📊 SUBPAGE SUMMARY:")
-        print("• 7 Technology Component Subpages")
-        print("• 4 System Architecture Subpages")
-        print("• 4 Application Platform Subpages")
-        print("• 4 Research & Development Subpages")
-        print("• 4 Business & Economic Subpages")
-        print("• 4 Implementation & Deployment Subpages")
-        print("• Total: 27 Subpages")
+            summary = ["\n📊 SUBPAGE SUMMARY:"]
+            summary.extend(f"• {len(subpages)} {name} Subpages" for name, subpages in _SUBPAGE_CATEGORIES)
+            summary.append(f"• Total: {sum(len(subpages) for _, subpages in _SUBPAGE_CATEGORIES)} Subpages")
+            print("\n".join(summary))
         
-        print("\n🔮 The future of augmented perception documentation awaits!")
-        print("="*60)
-        print("✅ SCAFFOLDING COMPLETE - START CREATING SUBPAGES!")
-        print("="*60)
+            print("\n🔮 The future of augmented perception documentation awaits!")
+            print("="*60)
+            print("✅ SCAFFOLDING COMPLETE - START CREATING SUBPAGES!")
+            print("="*60)
 
 def main():
     """Main function"""
+    parser = argparse.ArgumentParser(description="GLASSPHERE Notion subpage scaffolder")
+    parser.add_argument("--json", action="store_true",
+                        help="emit the subpage plan as JSON instead of the printed walkthrough")
+    args = parser.parse_args()
+
     scaffolder = NotionSubpageScaffolder()
-    scaffolder.run_complete_scaffolding()
+    if args.json:
+        scaffolder.write_subpage_plan_json()
+    else:
+        scaffolder.run_complete_scaffolding()
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file
@@ -17,11 +17,15 @@ Version: 1.0.0 - Quantum Fusion Technology
 
 import numpy as np
 import logging
+import random
 import time
 from datetime import datetime
-from typing import Dict, List, Tuple, Optional, Any
+from typing import Dict, List, NamedTuple, Tuple, Optional, Any
 from dataclasses import dataclass
 import math
+from collections import deque
+
+from core.jit import njit
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -38,9 +42,10 @@ class FusionSystemSpecs:
     quantum_enhancement_factor: float
     total_output: float  # W
     safety_parameters: Dict[str, Any]
+    tesla_output_cached: float = 0.0  # W, enhanced Tesla output fixed at creation
+    solar_output_cached: float = 0.0  # W, enhanced solar output fixed at creation
 
-@dataclass
-class FusionPerformance:
+class FusionPerformance(NamedTuple):
     """Performance metrics for fusion system"""
     timestamp: datetime
     tesla_output: float  # W
@@ -51,6 +56,73 @@ class FusionPerformance:
     efficiency: float  # 0-1
     resonance_stability: float  # 0-1
 
+@njit(cache=True, fastmath=True)
+def _fusion_efficiency_kernel(tesla_efficiency: float,
+                              solar_efficiency: float,
+                              crystal_amplification: float,
+                              quantum_enhancement: float) -> float:
+    """Weighted Tesla/solar/crystal/quantum efficiency, capped at 99%"""
+    # Crystal resonance efficiency
+    crystal_efficiency = crystal_amplification / 1000
+    crystal_efficiency = crystal_efficiency if crystal_efficiency < 0.98 else 0.98
+    
+    # Quantum enhancement efficiency
+    quantum_efficiency = quantum_enhancement / 10
+    quantum_efficiency = quantum_efficiency if quantum_efficiency < 0.99 else 0.99
+    
+    # Fusion efficiency calculation
+    fusion_efficiency = (
+        tesla_efficiency * 0.3 +
+        solar_efficiency * 0.4 +
+        crystal_efficiency * 0.2 +
+        quantum_efficiency * 0.1
+    )
+    
+    return fusion_efficiency if fusion_efficiency < 0.99 else 0.99
+
+@njit(cache=True, fastmath=True)
+def _total_output_kernel(tesla_power: float,
+                         solar_capacity: float,
+                         solar_efficiency: float,
+                         crystal_amplification: float,
+                         quantum_enhancement: float,
+                         tesla_enhancement: float) -> float:
+    """Total fusion output in W from the four stacked contributions"""
+    # Tesla output with enhancement
+    tesla_output = tesla_power * tesla_enhancement
+    
+    # Solar output with enhancements
+    solar_output = solar_capacity * solar_efficiency
+    
+    # Crystal amplification output
+    crystal_output = solar_output * (crystal_amplification / 100)
+    
+    # Quantum enhancement output
+    quantum_output = (tesla_output + solar_output + crystal_output) * (quantum_enhancement - 1)
+    
+    return tesla_output + solar_output + crystal_output + quantum_output
+
+class TeslaParams(NamedTuple):
+    """Tesla energy parameters"""
+    base_frequency: float  # Hz
+    enhancement_factor: float
+    scalar_wave_velocity: float  # m/s
+    field_strength: float  # V/m
+
+class SolarParams(NamedTuple):
+    """Solar technology parameters"""
+    perovskite_efficiency: float  # 0-1
+    bifacial_gain: float  # 0-1
+    quantum_dot_boost: float  # 0-1
+    manufacturing_cost: float  # $/W
+
+class CrystalParams(NamedTuple):
+    """Crystal resonance parameters"""
+    resonance_frequency: float  # Hz
+    amplification_factor: float
+    quantum_coherence_time: float  # s
+    field_strength: float  # V/m
+
 class QuantumCrystalSolarFusion:
     """
     🌟 Quantum-Crystal-Solar Fusion System
@@ -60,6 +132,15 @@ class QuantumCrystalSolarFusion:
     the most efficient energy generation system ever developed.
     """
     
+    # Crystal-specific amplification factors (keys are lowercase)
+    _CRYSTAL_FACTORS = {
+        'quartz': 1.0,
+        'amethyst': 1.2,
+        'diamond': 1.5,
+        'sapphire': 1.3,
+        'emerald': 1.1
+    }
+    
     def __init__(self):
         """Initialize the quantum-crystal-solar fusion system"""
         self.logger = logging.getLogger(__name__)
@@ -69,33 +150,59 @@ class QuantumCrystalSolarFusion:
         self.GOLDEN_RATIO = 1.618033988749895
         self.QUANTUM_ENHANCEMENT_BASE = 1.5
         self.CRYSTAL_AMPLIFICATION_BASE = 100.0
+        self.PERFORMANCE_HISTORY_LIMIT = 10_000  # most recent runs kept in memory
         
         # System components
         self.fusion_systems = {}
-        self.performance_history = []
+        self.performance_history = deque(maxlen=self.PERFORMANCE_HISTORY_LIMIT)
+        
+        # Per-system report columns (SoA), row i belongs to _system_index's i-th name
+        self._system_index = {}
+        self._total_output_arr = np.empty(0)
+        self._efficiency_arr = np.empty(0)
+        self._qenh_arr = np.empty(0)
+        self._solar_capacity_arr = np.empty(0)
+        self._rng = np.random.default_rng()
         
         # Tesla energy parameters
-        self.tesla_parameters = {
-            'base_frequency': 7.83,
-            'enhancement_factor': 850,
-            'scalar_wave_velocity': 1.5e9,  # m/s
-            'field_strength': 2000  # V/m
-        }
+        self.tesla_parameters = TeslaParams(
+            base_frequency=7.83,
+            enhancement_factor=850,
+            scalar_wave_velocity=1.5e9,  # m/s
+            field_strength=2000  # V/m
+        )
         
         # Solar technology parameters
-        self.solar_parameters = {
-            'perovskite_efficiency': 0.471,  # 47.1%
-            'bifacial_gain': 0.20,  # 20%
-            'quantum_dot_boost': 0.15,  # 15%
-            'manufacturing_cost': 0.15  # $0.15/W
-        }
+        self.solar_parameters = SolarParams(
+            perovskite_efficiency=0.471,  # 47.1%
+            bifacial_gain=0.20,  # 20%
+            quantum_dot_boost=0.15,  # 15%
+            manufacturing_cost=0.15  # $0.15/W
+        )
         
         # Crystal resonance parameters
-        self.crystal_parameters = {
-            'resonance_frequency': 7.83,
-            'amplification_factor': 100,
-            'quantum_coherence_time': 1e-6,  # s
-            'field_strength': 1000  # V/m
+        self.crystal_parameters = CrystalParams(
+            resonance_frequency=7.83,
+            amplification_factor=100,
+            quantum_coherence_time=1e-6,  # s
+            field_strength=1000  # V/m
+        )
+        
+        # Derived constants, fixed once the parameter blocks above are set
+        self._solar_eff = (
+            self.solar_parameters.perovskite_efficiency *
+            (1 + self.solar_parameters.bifacial_gain) *
+            (1 + self.solar_parameters.quantum_dot_boost)
+        )
+        self._quantum_enhancement = (
+            self.QUANTUM_ENHANCEMENT_BASE *
+            (1.0 + self.crystal_parameters.quantum_coherence_time * 1e6) *
+            self.GOLDEN_RATIO
+        )
+        base_amplification = self.crystal_parameters.amplification_factor
+        self._crystal_amp_table = {
+            crystal: base_amplification * factor
+            for crystal, factor in self._CRYSTAL_FACTORS.items()
         }
         
         self.logger.info("Quantum-Crystal-Solar Fusion System initialized")
@@ -147,46 +254,50 @@ class QuantumCrystalSolarFusion:
             system_name=name,
             tesla_coil_power=tesla_power,
             solar_capacity=solar_capacity,
-            crystal_resonance_frequency=self.crystal_parameters['resonance_frequency'],
+            crystal_resonance_frequency=self.crystal_parameters.resonance_frequency,
             fusion_efficiency=fusion_efficiency,
             quantum_enhancement_factor=quantum_enhancement,
             total_output=total_output,
-            safety_parameters=safety_params
+            safety_parameters=safety_params,
+            tesla_output_cached=tesla_power * self.tesla_parameters.enhancement_factor,
+            solar_output_cached=solar_capacity * self._solar_eff
         )
         
         self.fusion_systems[name] = fusion_specs
+        self._store_system_columns(name, fusion_specs)
         self.logger.info(f"Created fusion system: {name}")
         
         return fusion_specs
     
+    def _store_system_columns(self, name: str, fusion_specs: FusionSystemSpecs) -> None:
+        """Write a system's report scalars into the SoA columns"""
+        row = self._system_index.get(name)
+        if row is None:
+            row = self._system_index[name] = len(self._system_index)
+            if row == len(self._total_output_arr):
+                # Grow all columns geometrically so appends stay amortized O(1)
+                capacity = max(8, 2 * row)
+                for attr in ('_total_output_arr', '_efficiency_arr', '_qenh_arr', '_solar_capacity_arr'):
+                    column = np.empty(capacity)
+                    column[:row] = getattr(self, attr)[:row]
+                    setattr(self, attr, column)
+        
+        self._total_output_arr[row] = fusion_specs.total_output
+        self._efficiency_arr[row] = fusion_specs.fusion_efficiency
+        self._qenh_arr[row] = fusion_specs.quantum_enhancement_factor
+        self._solar_capacity_arr[row] = fusion_specs.solar_capacity
+    
     def _calculate_crystal_amplification(self, crystal_type: str) -> float:
         """Calculate crystal resonance amplification factor"""
-        base_amplification = self.crystal_parameters['amplification_factor']
-        
-        # Crystal-specific amplification factors
-        crystal_factors = {
-            'quartz': 1.0,
-            'amethyst': 1.2,
-            'diamond': 1.5,
-            'sapphire': 1.3,
-            'emerald': 1.1
-        }
-        
-        factor = crystal_factors.get(crystal_type.lower(), 1.0)
-        return base_amplification * factor
+        if not crystal_type.islower():
+            crystal_type = crystal_type.lower()
+        return self._crystal_amp_table.get(
+            crystal_type, self.crystal_parameters.amplification_factor
+        )
     
     def _calculate_quantum_enhancement(self) -> float:
-        """Calculate quantum enhancement factor"""
-        # Base quantum enhancement
-        base_enhancement = self.QUANTUM_ENHANCEMENT_BASE
-        
-        # Quantum coherence enhancement
-        coherence_enhancement = 1.0 + (self.crystal_parameters['quantum_coherence_time'] * 1e6)
-        
-        # Golden ratio enhancement
-        golden_enhancement = self.GOLDEN_RATIO
-        
-        return base_enhancement * coherence_enhancement * golden_enhancement
+        """Calculate quantum enhancement factor (base x coherence x golden ratio)"""
+        return self._quantum_enhancement
     
     def _calculate_fusion_efficiency(self, 
                                    tesla_power: float,
@@ -194,32 +305,9 @@ class QuantumCrystalSolarFusion:
                                    crystal_amplification: float,
                                    quantum_enhancement: float) -> float:
         """Calculate overall fusion system efficiency"""
-        
-        # Tesla efficiency
-        tesla_efficiency = 0.95
-        
-        # Solar efficiency with enhancements
-        solar_efficiency = (
-            self.solar_parameters['perovskite_efficiency'] *
-            (1 + self.solar_parameters['bifacial_gain']) *
-            (1 + self.solar_parameters['quantum_dot_boost'])
-        )
-        
-        # Crystal resonance efficiency
-        crystal_efficiency = min(0.98, crystal_amplification / 1000)
-        
-        # Quantum enhancement efficiency
-        quantum_efficiency = min(0.99, quantum_enhancement / 10)
-        
-        # Fusion efficiency calculation
-        fusion_efficiency = (
-            tesla_efficiency * 0.3 +
-            solar_efficiency * 0.4 +
-            crystal_efficiency * 0.2 +
-            quantum_efficiency * 0.1
+        return _fusion_efficiency_kernel(
+            0.95, self._solar_eff, float(crystal_amplification), float(quantum_enhancement)
         )
-        
-        return min(0.99, fusion_efficiency)
     
     def _calculate_total_output(self,
                               tesla_power: float,
@@ -227,30 +315,12 @@ class QuantumCrystalSolarFusion:
                               crystal_amplification: float,
                               quantum_enhancement: float) -> float:
         """Calculate total fusion system output"""
-        
-        # Tesla output with enhancement
-        tesla_output = tesla_power * self.tesla_parameters['enhancement_factor']
-        
-        # Solar output with enhancements
-        solar_output = (
-            solar_capacity *
-            self.solar_parameters['perovskite_efficiency'] *
-            (1 + self.solar_parameters['bifacial_gain']) *
-            (1 + self.solar_parameters['quantum_dot_boost'])
+        return _total_output_kernel(
+            float(tesla_power), float(solar_capacity), self._solar_eff, float(crystal_amplification),
+            float(quantum_enhancement), float(self.tesla_parameters.enhancement_factor)
         )
-        
-        # Crystal amplification output
-        crystal_output = solar_output * (crystal_amplification / 100)
-        
-        # Quantum enhancement output
-        quantum_output = (tesla_output + solar_output + crystal_output) * (quantum_enhancement - 1)
-        
-        # Total output
-        total_output = tesla_output + solar_output + crystal_output + quantum_output
-        
-        return total_output
     
-    async def run_fusion_system(self, system_name: str, duration: float = 3600.0) -> FusionPerformance:
+    def run_fusion_system(self, system_name: str, duration: float = 3600.0) -> FusionPerformance:
         """
         Run a fusion system and collect performance data
         
@@ -269,23 +339,14 @@ class QuantumCrystalSolarFusion:
         
         self.logger.info(f"Starting fusion system: {system_name}")
         
-        # Simulate system operation
-        start_time = datetime.now()
-        
         # Calculate outputs
-        tesla_output = fusion_specs.tesla_coil_power * self.tesla_parameters['enhancement_factor']
+        tesla_output = fusion_specs.tesla_output_cached
+        solar_output = fusion_specs.solar_output_cached
         
-        solar_output = (
-            fusion_specs.solar_capacity *
-            self.solar_parameters['perovskite_efficiency'] *
-            (1 + self.solar_parameters['bifacial_gain']) *
-            (1 + self.solar_parameters['quantum_dot_boost'])
-        )
-        
-        crystal_amplification = self._calculate_crystal_amplification("quartz")
+        crystal_amplification = self._crystal_amp_table['quartz']
         crystal_output = solar_output * (crystal_amplification / 100)
         
-        quantum_enhancement = self._calculate_quantum_enhancement()
+        quantum_enhancement = self._quantum_enhancement
         quantum_output = (tesla_output + solar_output + crystal_output) * (quantum_enhancement - 1)
         
         total_output = tesla_output + solar_output + crystal_output + quantum_output
@@ -294,7 +355,7 @@ class QuantumCrystalSolarFusion:
         efficiency = fusion_specs.fusion_efficiency
         
         # Calculate resonance stability
-        resonance_stability = 0.95 + (0.05 * np.random.random())  # 95-100%
+        resonance_stability = 0.95 + (0.05 * random.random())  # 95-100%
         
         # Create performance record
         performance = FusionPerformance(
@@ -316,18 +377,63 @@ class QuantumCrystalSolarFusion:
         
         return performance
     
+    def run_fusion_systems_batch(self, system_names: List[str], steps: int = 1) -> Dict[str, np.ndarray]:
+        """
+        Simulate several fusion systems over several timesteps in one vectorized pass
+        
+        Args:
+            system_names: Names of the fusion systems to run
+            steps: Number of timesteps to sample resonance stability for
+            
+        Returns:
+            Dict of arrays; output and efficiency arrays have shape (N,),
+            'resonance_stability' has shape (N, steps). Unlike
+            run_fusion_system, nothing is appended to performance_history.
+        """
+        missing = [name for name in system_names if name not in self.fusion_systems]
+        if missing:
+            raise ValueError(f"Fusion system {missing[0]} not found")
+        
+        specs = [self.fusion_systems[name] for name in system_names]
+        tesla_output = np.fromiter((spec.tesla_output_cached for spec in specs), dtype=np.float64, count=len(specs))
+        solar_output = np.fromiter((spec.solar_output_cached for spec in specs), dtype=np.float64, count=len(specs))
+        efficiency = np.fromiter((spec.fusion_efficiency for spec in specs), dtype=np.float64, count=len(specs))
+        
+        # Same stack as run_fusion_system, evaluated for all systems at once
+        crystal_output = solar_output * (self._crystal_amp_table['quartz'] / 100)
+        quantum_output = (tesla_output + solar_output + crystal_output) * (self._quantum_enhancement - 1)
+        total_output = tesla_output + solar_output + crystal_output + quantum_output
+        
+        resonance_stability = 0.95 + 0.05 * self._rng.random((len(specs), steps))  # 95-100%
+        
+        return {
+            'tesla_output': tesla_output,
+            'solar_output': solar_output,
+            'crystal_amplification': crystal_output,
+            'quantum_enhancement': quantum_output,
+            'total_fusion_output': total_output,
+            'efficiency': efficiency,
+            'resonance_stability': resonance_stability
+        }
+    
     def get_fusion_system_status(self, system_name: str) -> Dict[str, Any]:
         """Get status of a fusion system"""
         if system_name not in self.fusion_systems:
             raise ValueError(f"Fusion system {system_name} not found")
         
-        fusion_specs = self.fusion_systems[system_name]
-        
-        # Get latest performance
-        latest_performance = None
-        if self.performance_history:
-            latest_performance = self.performance_history[-1]
-        
+        return self._build_system_status(
+            system_name, self.fusion_systems[system_name], self._latest_performance()
+        )
+    
+    def _latest_performance(self) -> Optional[FusionPerformance]:
+        """The most recent performance record, if any"""
+        return self.performance_history[-1] if self.performance_history else None
+    
+    def _build_system_status(self,
+                             system_name: str,
+                             fusion_specs: FusionSystemSpecs,
+                             latest_performance: Optional[FusionPerformance]) -> Dict[str, Any]:
+        """Assemble the status dict for one system; each gets its own performance dict"""
         status = {
             'system_name': system_name,
             'specifications': {
@@ -339,7 +445,7 @@ class QuantumCrystalSolarFusion:
                 'total_output': fusion_specs.total_output
             },
             'safety_parameters': fusion_specs.safety_parameters,
-            'latest_performance': asdict(latest_performance) if latest_performance else None,
+            'latest_performance': latest_performance._asdict() if latest_performance is not None else None,
             'status': 'ACTIVE'
         }
         
@@ -347,20 +453,23 @@ class QuantumCrystalSolarFusion:
     
     def get_all_fusion_systems(self) -> Dict[str, Dict[str, Any]]:
         """Get status of all fusion systems"""
-        all_systems = {}
-        
-        for system_name in self.fusion_systems:
-            all_systems[system_name] = self.get_fusion_system_status(system_name)
-        
-        return all_systems
+        latest_performance = self._latest_performance()
+        return {
+            system_name: self._build_system_status(system_name, fusion_specs, latest_performance)
+            for system_name, fusion_specs in self.fusion_systems.items()
+        }
     
     def calculate_economic_impact(self, system_name: str) -> Dict[str, Any]:
         """Calculate economic impact of a fusion system"""
         if system_name not in self.fusion_systems:
             raise ValueError(f"Fusion system {system_name} not found")
         
-        fusion_specs = self.fusion_systems[system_name]
-        
+        return self._economic_impact_from_spec(system_name, self.fusion_systems[system_name])
+    
+    def _economic_impact_from_spec(self,
+                                   system_name: str,
+                                   fusion_specs: FusionSystemSpecs) -> Dict[str, Any]:
+        """Economic impact of an already resolved system spec"""
         # Economic calculations
         annual_output = fusion_specs.total_output * 8760  # hours per year
         energy_value = annual_output * 0.05  # $0.05/kWh
@@ -387,44 +496,76 @@ class QuantumCrystalSolarFusion:
     
     def generate_fusion_report(self) -> Dict[str, Any]:
         """Generate comprehensive fusion system report"""
+        n_systems = len(self._system_index)
+        
+        latest_performance = self._latest_performance()
+        build_status = self._build_system_status
+        fusion_systems = {
+            system_name: build_status(system_name, fusion_specs, latest_performance)
+            for system_name, fusion_specs in self.fusion_systems.items()
+        }
+        
+        # Economic impact for every system at once, same formulas as _economic_impact_from_spec
+        outputs = self._total_output_arr[:n_systems]
+        capacities = self._solar_capacity_arr[:n_systems]
+        annual_output = outputs * 8760
+        energy_value = annual_output * 0.05
+        cost_savings = (capacities * 0.30 - capacities * 0.15) * 8760
+        jobs_created = outputs / 1000000
+        economic_impact = {
+            system_name: {
+                'system_name': system_name,
+                'annual_energy_output': annual,  # kWh
+                'energy_value': value,  # $
+                'cost_savings': savings,  # $
+                'jobs_created': jobs,
+                'roi_timeline': 5,  # years
+                'payback_period': 3  # years
+            }
+            for system_name, annual, value, savings, jobs in zip(
+                self._system_index, annual_output.tolist(), energy_value.tolist(),
+                cost_savings.tolist(), jobs_created.tolist()
+            )
+        }
+        
         report = {
             'report_metadata': {
                 'generated': datetime.now().isoformat(),
                 'total_systems': len(self.fusion_systems),
                 'total_performance_records': len(self.performance_history)
             },
-            'fusion_systems': self.get_all_fusion_systems(),
+            'fusion_systems': fusion_systems,
+            # Reductions run on the preexisting SoA columns; never wrap lists in NumPy here
             'performance_summary': {
-                'total_output': sum(spec.total_output for spec in self.fusion_systems.values()),
-                'average_efficiency': np.mean([spec.fusion_efficiency for spec in self.fusion_systems.values()]),
-                'total_quantum_enhancement': sum(spec.quantum_enhancement_factor for spec in self.fusion_systems.values())
-            },
-            'economic_impact': {
-                system_name: self.calculate_economic_impact(system_name)
-                for system_name in self.fusion_systems
+                'total_output': float(self._total_output_arr[:n_systems].sum()),
+                'average_efficiency': (
+                    float(self._efficiency_arr[:n_systems].sum()) / n_systems if n_systems else 0.0
+                ),
+                'total_quantum_enhancement': float(self._qenh_arr[:n_systems].sum())
             },
+            'economic_impact': economic_impact,
             'technology_breakdown': {
                 'tesla_technology': {
-                    'enhancement_factor': self.tesla_parameters['enhancement_factor'],
-                    'scalar_wave_velocity': self.tesla_parameters['scalar_wave_velocity'],
-                    'field_strength': self.tesla_parameters['field_strength']
+                    'enhancement_factor': self.tesla_parameters.enhancement_factor,
+                    'scalar_wave_velocity': self.tesla_parameters.scalar_wave_velocity,
+                    'field_strength': self.tesla_parameters.field_strength
                 },
                 'solar_technology': {
-                    'perovskite_efficiency': self.solar_parameters['perovskite_efficiency'],
-                    'bifacial_gain': self.solar_parameters['bifacial_gain'],
-                    'quantum_dot_boost': self.solar_parameters['quantum_dot_boost']
+                    'perovskite_efficiency': self.solar_parameters.perovskite_efficiency,
+                    'bifacial_gain': self.solar_parameters.bifacial_gain,
+                    'quantum_dot_boost': self.solar_parameters.quantum_dot_boost
                 },
                 'crystal_resonance': {
-                    'resonance_frequency': self.crystal_parameters['resonance_frequency'],
-                    'amplification_factor': self.crystal_parameters['amplification_factor'],
-                    'quantum_coherence_time': self.crystal_parameters['quantum_coherence_time']
+                    'resonance_frequency': self.crystal_parameters.resonance_frequency,
+                    'amplification_factor': self.crystal_parameters.amplification_factor,
+                    'quantum_coherence_time': self.crystal_parameters.quantum_coherence_time
                 }
             }
         }
         
         return report
 
-async def main():
+def main():
     """Main function to demonstrate quantum-crystal-solar fusion technology"""
     logger.info("🌟 Starting Quantum-Crystal-Solar Fusion Technology Demonstration")
     
@@ -447,8 +588,8 @@ async def main():
     )
     
     # Run fusion systems
-    performance_1 = await fusion_tech.run_fusion_system("fusion_system_01", duration=3600)
-    performance_2 = await fusion_tech.run_fusion_system("fusion_system_02", duration=3600)
+    performance_1 = fusion_tech.run_fusion_system("fusion_system_01", duration=3600)
+    performance_2 = fusion_tech.run_fusion_system("fusion_system_02", duration=3600)
     
     # Generate report
     fusion_report = fusion_tech.generate_fusion_report()
@@ -474,4 +615,4 @@ async def main():
     logger.info("🌟 Quantum-Crystal-Solar Fusion Technology demonstration complete!")
 
 if __name__ == "__main__":
-    asyncio.run(main()) 
\ No newline at end of file
+    main() 
\ No newline at end of file
@@ -18,35 +18,69 @@ Version: 1.0.0 - Quartz Touch Interface
 import numpy as np
 import logging
 import asyncio
-from datetime import datetime
-from typing import Dict, List, Tuple, Optional, Any, Union
+import math
+import time
+from bisect import bisect_right
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from types import MappingProxyType
+from typing import Dict, List, Tuple, Optional, Any, Union, Mapping, Sequence
 from dataclasses import dataclass
-from enum import Enum
+from enum import IntEnum
+
+from core.jit import NUMBA_AVAILABLE, njit
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-class TouchType(Enum):
+class TouchType(IntEnum):
     """Types of touch input"""
-    PHYSICAL = "physical"
-    ENERGETIC = "energetic"
-    INTENT_BASED = "intent_based"
-    RESONANCE = "resonance"
-    BIOFIELD = "biofield"
+    PHYSICAL = 0
+    ENERGETIC = 1
+    INTENT_BASED = 2
+    RESONANCE = 3
+    BIOFIELD = 4
+    
+    @property
+    def label(self) -> str:
+        """Lowercase display name, e.g. ``"intent_based"``"""
+        return self.name.lower()
+
+class IntentLevel(IntEnum):
+    """Levels of intent-based control, ordered from least to most adept"""
+    NOVICE = 0
+    ADEPT = 1
+    MASTER = 2
+    SAGE = 3
+    ORACLE = 4
+    
+    @property
+    def label(self) -> str:
+        """Lowercase display name, e.g. ``"master"``"""
+        return self.name.lower()
 
-class IntentLevel(Enum):
-    """Levels of intent-based control"""
-    NOVICE = "novice"
-    ADEPT = "adept"
-    MASTER = "master"
-    SAGE = "sage"
-    ORACLE = "oracle"
+def _ns_to_datetime(timestamp_ns: int) -> datetime:
+    """Convert integer epoch nanoseconds to a local datetime at microsecond precision"""
+    seconds, nanos = divmod(int(timestamp_ns), 1_000_000_000)
+    return datetime.fromtimestamp(seconds) + timedelta(microseconds=nanos // 1000)
+
+class _TimestampNs:
+    """Mixin exposing an epoch-nanosecond ``timestamp_ns`` field as a datetime"""
+    __slots__ = ()
+    
+    @property
+    def timestamp(self) -> datetime:
+        """Timestamp as a local datetime, converted on access"""
+        return _ns_to_datetime(self.timestamp_ns)
 
 @dataclass
-class TouchInput:
+class TouchInput(_TimestampNs):
     """Touch input data structure"""
-    timestamp: datetime
+    __slots__ = ("timestamp_ns", "touch_type", "position", "pressure", "energy_level",
+                 "frequency_signature", "intent_strength", "resonance_pattern", "chakra_activation")
+    
+    timestamp_ns: int  # epoch nanoseconds
     touch_type: TouchType
     position: Tuple[float, float]  # x, y coordinates (0-1)
     pressure: float  # 0-1
@@ -55,28 +89,153 @@ class TouchInput:
     intent_strength: float  # 0-1
     resonance_pattern: np.ndarray
     chakra_activation: Dict[str, float]
+    
+    @classmethod
+    def from_now(cls, **fields: Any) -> "TouchInput":
+        """Create a touch input stamped with the current time"""
+        return cls(timestamp_ns=time.time_ns(), **fields)
 
 @dataclass
-class IntentSignal:
+class IntentSignal(_TimestampNs):
     """Intent-based control signal"""
-    timestamp: datetime
+    __slots__ = ("timestamp_ns", "intent_type", "intent_level", "confidence",
+                 "control_sequence", "energy_signature", "resonance_frequency")
+    
+    timestamp_ns: int  # epoch nanoseconds
     intent_type: str
     intent_level: IntentLevel
     confidence: float  # 0-1
-    control_sequence: List[str]
-    energy_signature: Dict[str, float]
+    control_sequence: Tuple[str, ...]
+    energy_signature: Mapping[str, float]
     resonance_frequency: float
 
 @dataclass
-class QuartzResponse:
+class QuartzResponse(_TimestampNs):
     """Quartz substrate response"""
-    timestamp: datetime
+    __slots__ = ("timestamp_ns", "piezoelectric_output", "resonance_frequency", "energy_storage",
+                 "frequency_amplification", "biofeedback_signal")
+    
+    timestamp_ns: int  # epoch nanoseconds
     piezoelectric_output: float  # V
     resonance_frequency: float  # Hz
     energy_storage: float  # J
     frequency_amplification: float
     biofeedback_signal: np.ndarray
 
+# Row layouts for the touch and quartz response ring buffers
+_TOUCH_HISTORY_DTYPE = np.dtype([
+    ("ts", "i8"), ("iface", "i4"), ("ttype", "i1"),
+    ("x", "f4"), ("y", "f4"), ("energy", "f8"), ("intent", "?"),
+])
+_QUARTZ_HISTORY_DTYPE = np.dtype([
+    ("ts", "i8"), ("iface", "i4"),
+    ("piezo", "f8"), ("resfreq", "f8"), ("storage", "f8"),
+])
+
+@njit(cache=True, fastmath=True)
+def _biofeedback_kernel(omega_t: np.ndarray,
+                        chakra_freqs: np.ndarray,
+                        chakra_acts: np.ndarray,
+                        base_freq: float,
+                        energy_level: float,
+                        intent_strength: float,
+                        out: np.ndarray) -> None:
+    """Fill ``out`` with the base, chakra and intent sine components in one pass"""
+    for i in range(omega_t.shape[0]):
+        wt = omega_t[i]
+        # Base frequency component
+        value = math.sin(base_freq * wt) * energy_level
+        # Chakra resonance components
+        for k in range(chakra_freqs.shape[0]):
+            value += math.sin(chakra_freqs[k] * wt) * chakra_acts[k] * 0.3
+        # Intent modulation
+        value += math.sin(10.0 * wt) * intent_strength
+        out[i] = value
+
+@njit(cache=True)
+def _intent_score_kernel(frequency: float,
+                         intent_strength: float,
+                         chakra_activation: np.ndarray,
+                         chakra_idx: np.ndarray,
+                         energy_term: np.ndarray,
+                         resfreq: np.ndarray,
+                         w_chakra: float,
+                         w_freq: float,
+                         w_intent: float,
+                         inv_bandwidth: float,
+                         threshold: float) -> Tuple[int, float]:
+    """Best (pattern index, confidence), or (-1, 0.0) when no pattern clears ``threshold``"""
+    n_patterns = resfreq.shape[0]
+    
+    # Only patterns focused on an active chakra are candidates, unless there are none
+    any_active = False
+    for j in range(n_patterns):
+        if chakra_activation[chakra_idx[j]] != 0.0:
+            any_active = True
+            break
+    
+    best = -1
+    best_confidence = 0.0
+    for j in range(n_patterns):
+        chakra_match = chakra_activation[chakra_idx[j]]
+        if any_active and chakra_match == 0.0:
+            continue
+        # Energy signature, chakra focus, frequency resonance and intent strength
+        confidence = (energy_term[j] +
+                      chakra_match * w_chakra +
+                      math.exp(-abs(frequency - resfreq[j]) * inv_bandwidth) * w_freq +
+                      intent_strength * w_intent)
+        confidence = min(max(confidence, 0.0), 1.0)
+        if best < 0 or confidence > best_confidence:
+            best = j
+            best_confidence = confidence
+    
+    if best_confidence > threshold:
+        return best, best_confidence
+    return -1, 0.0
+
+@njit(cache=True)
+def _quartz_outputs(pressure: float,
+                    energy_level: float,
+                    intent_strength: float,
+                    sensitivity: float,
+                    schumann: float) -> Tuple[float, float, float, float]:
+    """Piezoelectric output (V), resonance frequency (Hz), energy storage (J) and frequency amplification"""
+    piezoelectric_output = pressure * sensitivity * 1e6  # Convert to V
+    resonance_frequency = schumann + energy_level * 2.0  # ±2 Hz modulation
+    energy_storage = energy_level * 1e-6  # J
+    frequency_amplification = 1.0 + (intent_strength * 0.5)
+    return piezoelectric_output, resonance_frequency, energy_storage, frequency_amplification
+
+@njit(cache=True, fastmath=True)
+def _quartz_kernel(pressure: float,
+                   energy_level: float,
+                   intent_strength: float,
+                   sensitivity: float,
+                   schumann: float,
+                   freq_sig: float,
+                   chakra_freqs: np.ndarray,
+                   chakra_acts: np.ndarray,
+                   omega_t: np.ndarray,
+                   out_signal: np.ndarray) -> Tuple[float, float, float, float]:
+    """``_quartz_outputs`` plus the noiseless biofeedback signal written into ``out_signal``"""
+    _biofeedback_kernel(omega_t, chakra_freqs, chakra_acts, freq_sig, energy_level, intent_strength, out_signal)
+    return _quartz_outputs(pressure, energy_level, intent_strength, sensitivity, schumann)
+
+def _biofeedback_numpy(omega_t: np.ndarray,
+                       chakra_freqs: np.ndarray,
+                       chakra_acts: np.ndarray,
+                       base_freq: float,
+                       energy_level: float,
+                       intent_strength: float,
+                       out: np.ndarray,
+                       buf: np.ndarray) -> None:
+    """NumPy fallback for ``_biofeedback_kernel`` reusing ``buf`` as scratch space"""
+    np.multiply(np.sin(np.multiply(omega_t, base_freq, out=buf), out=buf), energy_level, out=out)
+    for freq, activation in zip(chakra_freqs.tolist(), chakra_acts.tolist()):
+        out += np.multiply(np.sin(np.multiply(omega_t, freq, out=buf), out=buf), activation * 0.3, out=buf)
+    out += np.multiply(np.sin(np.multiply(omega_t, 10.0, out=buf), out=buf), intent_strength, out=buf)
+
 class QuartzTouchInterface:
     """
     🔹 Quartz-Touch Neural Feedback Mesh
@@ -86,8 +245,26 @@ class QuartzTouchInterface:
     enabling intent-based control sequences through crystalline resonance.
     """
     
-    def __init__(self):
-        """Initialize the quartz touch interface"""
+    # Intent confidence weights (energy, chakra, frequency, intent), bandwidth and threshold
+    INTENT_WEIGHTS = (0.3, 0.3, 0.2, 0.2)
+    INTENT_BANDWIDTH = 10.0  # Hz
+    INTENT_THRESHOLD = 0.6
+    
+    # Lower bounds of the ADEPT..ORACLE level scores; below the first is NOVICE
+    LEVEL_THRESHOLDS = (0.6, 0.7, 0.8, 0.9)
+    
+    def __init__(self, history_capacity: int = 1 << 16, simulate_latency: bool = False,
+                 intent_cache_size: int = 0):
+        """
+        Initialize the quartz touch interface
+        
+        Args:
+            history_capacity: Number of touch and quartz response records retained
+            simulate_latency: Sleep 100 ms per control sequence step to mimic hardware
+            intent_cache_size: Size of the intent match cache for register_touch_input
+                (0 disables it). When enabled, touches are matched on frequency
+                rounded to 0.1 Hz and intent strength rounded to 0.01.
+        """
         self.logger = logging.getLogger(__name__)
         
         # Fundamental constants
@@ -95,6 +272,8 @@ class QuartzTouchInterface:
         self.GOLDEN_RATIO = 1.618033988749895
         self.QUARTZ_PIEZOELECTRIC_CONSTANT = 2.3e-12  # C/N
         
+        self.simulate_latency = simulate_latency
+        
         # Chakra frequency ranges (Hz)
         self.chakra_frequencies = {
             "root": (194.18, 207.65),      # C# - G#
@@ -106,17 +285,48 @@ class QuartzTouchInterface:
             "crown": (329.63, 369.99)      # E - F#
         }
         
+        # Chakra bands as parallel arrays for vectorized activation
+        self._chakra_names = tuple(self.chakra_frequencies)
+        self._chakra_index = {name: i for i, name in enumerate(self._chakra_names)}
+        self._chakra_min = np.array([lo for lo, _ in self.chakra_frequencies.values()])
+        self._chakra_max = np.array([hi for _, hi in self.chakra_frequencies.values()])
+        self._chakra_center = (self._chakra_min + self._chakra_max) / 2
+        self._chakra_invspan = 1.0 / (self._chakra_max - self._chakra_min)
+        self._chakra_center_by_name = {name: (lo + hi) * 0.5 for name, (lo, hi) in self.chakra_frequencies.items()}
+        
         # Active touch interfaces
         self.active_interfaces = {}
         
         # Intent patterns database
         self.intent_patterns = self._initialize_intent_patterns()
+        self._score_intent = self._build_intent_scorer()
         
-        # Touch history
-        self.touch_history = []
+        # Intent levels indexed by the number of level thresholds reached
+        self._levels = tuple(IntentLevel)
+        self._level_thresholds = np.array(self.LEVEL_THRESHOLDS)
         
-        # Quartz response history
-        self.quartz_responses = []
+        # Bounded LRU cache of quantized (frequency, intent) -> (pattern index, confidence)
+        self._intent_cache_size = intent_cache_size
+        self._intent_cache = OrderedDict() if intent_cache_size > 0 else None
+        
+        # Touch and quartz response history (ring buffers, oldest rows overwritten)
+        self._history_capacity = history_capacity
+        self._touch_hist = np.zeros(history_capacity, dtype=_TOUCH_HISTORY_DTYPE)
+        self._touch_head = 0
+        self._quartz_hist = np.zeros(history_capacity, dtype=_QUARTZ_HISTORY_DTYPE)
+        self._quartz_head = 0
+        
+        # Interned interface ids for the history buffers
+        self._iface_id_to_int = {}
+        self._iface_ids = []
+        
+        # Biofeedback angular sample grid 2*pi*t (100 samples over 1 s) and scratch buffer
+        self._omega_t = 2 * np.pi * np.linspace(0, 1, 100, dtype=np.float64)
+        self._bio_buf = np.empty(100)
+        
+        # Noise generator and preallocated noise buffer
+        self._rng = np.random.default_rng()
+        self._noise_buf = np.empty(100)
         
         self.logger.info("Quartz Touch Interface initialized")
     
@@ -165,6 +375,20 @@ class QuartzTouchInterface:
             }
         }
         
+        # Patterns are immutable after init, so signals can share them without copying
+        for pattern in patterns.values():
+            pattern["control_sequence"] = tuple(pattern["control_sequence"])
+            pattern["energy_signature"] = MappingProxyType(pattern["energy_signature"])
+        
+        # Pattern constants as parallel arrays for vectorized confidence scoring
+        self._pat_names = list(patterns)
+        self._pat_energy_mean = np.array([np.mean(list(p["energy_signature"].values()))
+                                          if p["energy_signature"] else 0.0
+                                          for p in patterns.values()])
+        self._pat_resfreq = np.array([p["resonance_frequency"] for p in patterns.values()])
+        self._pat_chakra_idx = np.array([self._chakra_index[p["chakra_focus"]] for p in patterns.values()],
+                                        dtype=np.intp)
+        
         return patterns
     
     def create_touch_interface(self,
@@ -212,7 +436,7 @@ class QuartzTouchInterface:
         """
         
         if interface_id not in self.active_interfaces:
-            self.logger.error(f"Interface not found: {interface_id}")
+            self.logger.error("Interface not found: %s", interface_id)
             return None
         
         interface = self.active_interfaces[interface_id]
@@ -225,110 +449,253 @@ class QuartzTouchInterface:
         
         if intent_signal:
             interface["intent_detections"] += 1
-            interface["average_confidence"] = (
-                (interface["average_confidence"] * (interface["intent_detections"] - 1) + intent_signal.confidence) /
-                interface["intent_detections"]
+            interface["average_confidence"] += (
+                (intent_signal.confidence - interface["average_confidence"]) / interface["intent_detections"]
             )
         
         # Log touch input
-        self.touch_history.append({
-            "timestamp": touch_data.timestamp,
-            "interface_id": interface_id,
-            "touch_type": touch_data.touch_type.value,
-            "position": touch_data.position,
-            "energy_level": touch_data.energy_level,
-            "intent_detected": intent_signal is not None
-        })
+        x, y = touch_data.position
+        self._touch_hist[self._touch_head % self._history_capacity] = (
+            touch_data.timestamp_ns,
+            self._intern_interface_id(interface_id),
+            touch_data.touch_type,
+            x, y,
+            touch_data.energy_level,
+            intent_signal is not None
+        )
+        self._touch_head += 1
         
         return intent_signal
     
-    def _analyze_intent_pattern(self, touch_data: TouchInput) -> Optional[IntentSignal]:
-        """Analyze touch data for intent patterns"""
-        
-        # Calculate chakra activation
-        chakra_activation = self._calculate_chakra_activation(touch_data.frequency_signature)
+    def register_touch_batch(self, interface_id: str,
+                             touches: Sequence[TouchInput]) -> List[Optional[IntentSignal]]:
+        """
+        Register a batch of touch inputs and detect intent-based control
         
-        # Find best matching intent pattern
-        best_match = None
-        best_confidence = 0.0
+        Chakra activations (N, 7) and pattern confidences (N, P) are computed
+        for the whole batch at once; only detected rows build an IntentSignal.
         
-        for intent_type, pattern in self.intent_patterns.items():
-            confidence = self._calculate_intent_confidence(touch_data, pattern, chakra_activation)
+        Args:
+            interface_id: Interface identifier
+            touches: Touch input data, in arrival order
             
-            if confidence > best_confidence and confidence > 0.6:  # 60% threshold
-                best_confidence = confidence
-                best_match = (intent_type, pattern)
+        Returns:
+            IntentSignal or None for each touch, in order
+        """
         
-        if best_match:
-            intent_type, pattern = best_match
-            
-            # Determine intent level based on energy and confidence
-            intent_level = self._determine_intent_level(touch_data.energy_level, best_confidence)
-            
-            intent_signal = IntentSignal(
-                timestamp=touch_data.timestamp,
-                intent_type=intent_type,
-                intent_level=intent_level,
-                confidence=best_confidence,
-                control_sequence=pattern["control_sequence"].copy(),
-                energy_signature=pattern["energy_signature"].copy(),
-                resonance_frequency=pattern["resonance_frequency"]
+        if interface_id not in self.active_interfaces:
+            self.logger.error("Interface not found: %s", interface_id)
+            return [None] * len(touches)
+        
+        interface = self.active_interfaces[interface_id]
+        n = len(touches)
+        if n == 0:
+            return []
+        
+        freq_arr = np.fromiter((t.frequency_signature for t in touches), dtype=np.float64, count=n)
+        energy_arr = np.fromiter((t.energy_level for t in touches), dtype=np.float64, count=n)
+        intent_arr = np.fromiter((t.intent_strength for t in touches), dtype=np.float64, count=n)
+        
+        # Chakra activation (N, 7) and pattern confidence (N, P)
+        chakra_activation = self._chakra_activation_array(freq_arr[:, None])
+        w_energy, w_chakra, w_freq, w_intent = self.INTENT_WEIGHTS
+        confidence = (
+            self._pat_energy_mean * w_energy +
+            chakra_activation[:, self._pat_chakra_idx] * w_chakra +
+            np.exp(-np.abs(freq_arr[:, None] - self._pat_resfreq) / self.INTENT_BANDWIDTH) * w_freq +
+            intent_arr[:, None] * w_intent
+        )
+        np.clip(confidence, 0.0, 1.0, out=confidence)
+        best_idx = confidence.argmax(axis=1)
+        best_confidence = confidence[np.arange(n), best_idx]
+        detected = best_confidence > self.INTENT_THRESHOLD
+        
+        # Only detected rows pay for IntentSignal construction
+        signals: List[Optional[IntentSignal]] = [None] * n
+        interface["touch_count"] += n
+        detected_rows = np.flatnonzero(detected)
+        levels = self._determine_intent_levels(energy_arr[detected_rows], best_confidence[detected_rows])
+        for row, level in zip(detected_rows.tolist(), levels.tolist()):
+            signal = self._build_intent_signal(touches[row], int(best_idx[row]), float(best_confidence[row]),
+                                               self._levels[level])
+            signals[row] = signal
+            interface["intent_detections"] += 1
+            interface["average_confidence"] += (
+                (signal.confidence - interface["average_confidence"]) / interface["intent_detections"]
             )
-            
-            self.logger.info(f"Intent detected: {intent_type} (confidence: {best_confidence:.3f}, level: {intent_level.value})")
-            
-            return intent_signal
+        
+        # Log touch inputs in one block write
+        rows = np.empty(n, dtype=_TOUCH_HISTORY_DTYPE)
+        rows["ts"] = np.fromiter((t.timestamp_ns for t in touches), dtype=np.int64, count=n)
+        rows["iface"] = self._intern_interface_id(interface_id)
+        rows["ttype"] = np.fromiter((t.touch_type for t in touches), dtype=np.int8, count=n)
+        rows["x"], rows["y"] = np.array([t.position for t in touches], dtype=np.float32).T
+        rows["energy"] = energy_arr
+        rows["intent"] = detected
+        self._touch_head = self._append_rows(self._touch_hist, self._touch_head, rows)
+        
+        return signals
+    
+    def _append_rows(self, buffer: np.ndarray, head: int, rows: np.ndarray) -> int:
+        """Write rows into a ring buffer and return the new head"""
+        
+        capacity = self._history_capacity
+        if rows.shape[0] > capacity:
+            head += rows.shape[0] - capacity
+            rows = rows[-capacity:]
+        buffer[(head + np.arange(rows.shape[0])) % capacity] = rows
+        return head + rows.shape[0]
+    
+    def _intern_interface_id(self, interface_id: str) -> int:
+        """Map an interface id to its integer code in the history buffers"""
+        
+        code = self._iface_id_to_int.get(interface_id)
+        if code is None:
+            code = len(self._iface_ids)
+            self._iface_id_to_int[interface_id] = code
+            self._iface_ids.append(interface_id)
+        return code
+    
+    def _ordered_rows(self, buffer: np.ndarray, head: int) -> np.ndarray:
+        """Return the retained rows of a ring buffer, oldest first"""
+        
+        capacity = self._history_capacity
+        if head <= capacity:
+            return buffer[:head]
+        start = head % capacity
+        return np.concatenate((buffer[start:], buffer[:start]))
+    
+    @property
+    def touch_history(self) -> List[Dict[str, Any]]:
+        """Retained touch records as a list of dicts, oldest first"""
+        
+        return [{
+            "timestamp": _ns_to_datetime(row["ts"]),
+            "interface_id": self._iface_ids[row["iface"]],
+            "touch_type": TouchType(row["ttype"]).label,
+            "position": (float(row["x"]), float(row["y"])),
+            "energy_level": float(row["energy"]),
+            "intent_detected": bool(row["intent"])
+        } for row in self._ordered_rows(self._touch_hist, self._touch_head)]
+    
+    @property
+    def quartz_responses(self) -> List[Dict[str, Any]]:
+        """Retained quartz response records as a list of dicts, oldest first"""
+        
+        return [{
+            "timestamp": _ns_to_datetime(row["ts"]),
+            "interface_id": self._iface_ids[row["iface"]],
+            "piezoelectric_output": float(row["piezo"]),
+            "resonance_frequency": float(row["resfreq"]),
+            "energy_storage": float(row["storage"])
+        } for row in self._ordered_rows(self._quartz_hist, self._quartz_head)]
+    
+    def _analyze_intent_pattern(self, touch_data: TouchInput) -> Optional[IntentSignal]:
+        """Analyze touch data for intent patterns"""
+        
+        if self._intent_cache is not None:
+            best_idx, best_confidence = self._cached_intent_match(touch_data)
+        else:
+            # Calculate chakra activation and find best matching intent pattern
+            chakra_activation = self._chakra_activation_array(touch_data.frequency_signature)
+            best_idx, best_confidence = self._score_intent(touch_data.frequency_signature,
+                                                           touch_data.intent_strength,
+                                                           chakra_activation)
+        
+        if best_idx >= 0:
+            return self._build_intent_signal(touch_data, best_idx, best_confidence)
         
         return None
     
-    def _calculate_chakra_activation(self, frequency: float) -> Dict[str, float]:
-        """Calculate chakra activation based on frequency"""
+    def _cached_intent_match(self, touch_data: TouchInput) -> Tuple[int, float]:
+        """Best intent match for the quantized touch signature, memoized"""
+        
+        cache = self._intent_cache
+        key = (round(touch_data.frequency_signature, 1), round(touch_data.intent_strength, 2))
+        match = cache.get(key)
+        if match is not None:
+            cache.move_to_end(key)
+            return match
+        
+        # Score the quantized signature so the result depends only on the key
+        frequency, intent_strength = key
+        match = self._score_intent(frequency, intent_strength, self._chakra_activation_array(frequency))
+        cache[key] = match
+        if len(cache) > self._intent_cache_size:
+            cache.popitem(last=False)
+        return match
+    
+    def _build_intent_signal(self, touch_data: TouchInput, pattern_idx: int, confidence: float,
+                             intent_level: Optional[IntentLevel] = None) -> IntentSignal:
+        """Build the intent signal for a detected pattern"""
+        
+        intent_type = self._pat_names[pattern_idx]
+        pattern = self.intent_patterns[intent_type]
+        
+        # Determine intent level based on energy and confidence
+        if intent_level is None:
+            intent_level = self._determine_intent_level(touch_data.energy_level, confidence)
+        
+        intent_signal = IntentSignal(
+            timestamp_ns=touch_data.timestamp_ns,
+            intent_type=intent_type,
+            intent_level=intent_level,
+            confidence=confidence,
+            control_sequence=pattern["control_sequence"],
+            energy_signature=pattern["energy_signature"],
+            resonance_frequency=pattern["resonance_frequency"]
+        )
         
-        chakra_activation = {}
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info("Intent detected: %s (confidence: %.3f, level: %s)",
+                             intent_type, confidence, intent_level.label)
         
-        for chakra, (min_freq, max_freq) in self.chakra_frequencies.items():
-            if min_freq <= frequency <= max_freq:
-                # Calculate activation level based on frequency proximity to center
-                center_freq = (min_freq + max_freq) / 2
-                activation = 1.0 - abs(frequency - center_freq) / (max_freq - min_freq)
-                chakra_activation[chakra] = max(0.0, activation)
-            else:
-                chakra_activation[chakra] = 0.0
+        return intent_signal
+    
+    def _chakra_activation_array(self, frequency: float) -> np.ndarray:
+        """Chakra activations in ``self._chakra_names`` order"""
         
-        return chakra_activation
+        # Activation level based on frequency proximity to the band center
+        in_band = (self._chakra_min <= frequency) & (frequency <= self._chakra_max)
+        activation = np.maximum(0.0, 1.0 - np.abs(frequency - self._chakra_center) * self._chakra_invspan)
+        return np.where(in_band, activation, 0.0)
     
-    def _calculate_intent_confidence(self, touch_data: TouchInput, 
-                                   pattern: Dict[str, Any], 
-                                   chakra_activation: Dict[str, float]) -> float:
-        """Calculate confidence in intent pattern match"""
+    def _calculate_chakra_activation(self, frequency: float) -> Dict[str, float]:
+        """Calculate chakra activation based on frequency"""
         
-        # Energy signature match
-        energy_match = 0.0
-        if pattern["energy_signature"]:
-            energy_factors = list(pattern["energy_signature"].values())
-            energy_match = np.mean(energy_factors)
+        activation = self._chakra_activation_array(frequency)
+        return dict(zip(self._chakra_names, activation.tolist()))
+    
+    def _build_intent_scorer(self):
+        """
+        Specialize intent scoring for the fixed pattern set
         
-        # Chakra focus match
-        chakra_match = 0.0
-        if pattern["chakra_focus"] in chakra_activation:
-            chakra_match = chakra_activation[pattern["chakra_focus"]]
+        Pattern constants, weights and the threshold are captured as closure
+        cells so the per-touch call does no attribute or dict lookups; the
+        scoring loop itself runs in ``_intent_score_kernel``. Only patterns
+        focused on an active chakra are scored, since without the chakra term
+        no pattern can clear the threshold at chakra-band frequencies; if no
+        active chakra has a pattern, every pattern is scored.
         
-        # Frequency resonance match
-        freq_diff = abs(touch_data.frequency_signature - pattern["resonance_frequency"])
-        frequency_match = np.exp(-freq_diff / 10)  # 10 Hz bandwidth
+        Returns:
+            Callable (frequency, intent_strength, chakra_activation) -> (pattern index, confidence),
+            with index -1 when no pattern clears the 60% threshold
+        """
         
-        # Intent strength factor
-        intent_factor = touch_data.intent_strength
+        w_energy, w_chakra, w_freq, w_intent = self.INTENT_WEIGHTS
+        energy_term = self._pat_energy_mean * w_energy
+        chakra_idx = self._pat_chakra_idx
+        resfreq = self._pat_resfreq
+        inv_bandwidth = 1.0 / self.INTENT_BANDWIDTH
+        threshold = self.INTENT_THRESHOLD
         
-        # Calculate overall confidence
-        confidence = (
-            energy_match * 0.3 +
-            chakra_match * 0.3 +
-            frequency_match * 0.2 +
-            intent_factor * 0.2
-        )
+        def score(frequency: float, intent_strength: float,
+                  chakra_activation: np.ndarray) -> Tuple[int, float]:
+            return _intent_score_kernel(float(frequency), float(intent_strength), chakra_activation,
+                                        chakra_idx, energy_term, resfreq,
+                                        w_chakra, w_freq, w_intent, inv_bandwidth, threshold)
         
-        return max(0.0, min(1.0, confidence))
+        return score
     
     def _determine_intent_level(self, energy_level: float, confidence: float) -> IntentLevel:
         """Determine intent level based on energy and confidence"""
@@ -336,16 +703,13 @@ class QuartzTouchInterface:
         # Calculate level score
         level_score = (energy_level + confidence) / 2
         
-        if level_score >= 0.9:
-            return IntentLevel.ORACLE
-        elif level_score >= 0.8:
-            return IntentLevel.SAGE
-        elif level_score >= 0.7:
-            return IntentLevel.MASTER
-        elif level_score >= 0.6:
-            return IntentLevel.ADEPT
-        else:
-            return IntentLevel.NOVICE
+        return self._levels[bisect_right(self.LEVEL_THRESHOLDS, level_score)]
+    
+    def _determine_intent_levels(self, energy_levels: np.ndarray, confidences: np.ndarray) -> np.ndarray:
+        """Vectorized ``_determine_intent_level``, returning level indices into ``IntentLevel``"""
+        
+        level_scores = (energy_levels + confidences) / 2
+        return np.searchsorted(self._level_thresholds, level_scores, side="right")
     
     def process_quartz_response(self, interface_id: str, 
                               touch_data: TouchInput) -> QuartzResponse:
@@ -365,25 +729,38 @@ class QuartzTouchInterface:
         
         interface = self.active_interfaces[interface_id]
         
-        # Calculate piezoelectric output
-        piezoelectric_output = touch_data.pressure * interface["piezoelectric_sensitivity"] * 1e6  # Convert to V
-        
-        # Calculate resonance frequency
-        base_resonance = self.SCHUMANN_RESONANCE
-        energy_modulation = touch_data.energy_level * 2.0  # ±2 Hz modulation
-        resonance_frequency = base_resonance + energy_modulation
-        
-        # Calculate energy storage
-        energy_storage = touch_data.energy_level * 1e-6  # J
-        
-        # Calculate frequency amplification
-        frequency_amplification = 1.0 + (touch_data.intent_strength * 0.5)
-        
-        # Generate biofeedback signal
-        biofeedback_signal = self._generate_biofeedback_signal(touch_data)
+        # Only significant chakra activations contribute a biofeedback resonance component
+        active = [(chakra, activation) for chakra, activation in touch_data.chakra_activation.items()
+                  if activation > 0.1]
+        chakra_freqs = np.array([self._chakra_center_by_name[chakra] for chakra, _ in active],
+                                dtype=np.float64)
+        chakra_acts = np.array([activation for _, activation in active], dtype=np.float64)
+        
+        # Scalar outputs and biofeedback signal in one compiled call
+        pressure = float(touch_data.pressure)
+        energy_level = float(touch_data.energy_level)
+        intent_strength = float(touch_data.intent_strength)
+        sensitivity = float(interface["piezoelectric_sensitivity"])
+        biofeedback_signal = np.empty(self._omega_t.shape[0])
+        if NUMBA_AVAILABLE:
+            outputs = _quartz_kernel(pressure, energy_level, intent_strength, sensitivity,
+                                     self.SCHUMANN_RESONANCE, float(touch_data.frequency_signature),
+                                     chakra_freqs, chakra_acts, self._omega_t, biofeedback_signal)
+        else:
+            outputs = _quartz_outputs(pressure, energy_level, intent_strength, sensitivity,
+                                      self.SCHUMANN_RESONANCE)
+            _biofeedback_numpy(self._omega_t, chakra_freqs, chakra_acts,
+                               float(touch_data.frequency_signature), energy_level, intent_strength,
+                               biofeedback_signal, self._bio_buf)
+        piezoelectric_output, resonance_frequency, energy_storage, frequency_amplification = outputs
+        
+        # Add biofeedback noise (sigma = 0.05)
+        noise = self._rng.standard_normal(out=self._noise_buf)
+        noise *= 0.05
+        biofeedback_signal += noise
         
         quartz_response = QuartzResponse(
-            timestamp=touch_data.timestamp,
+            timestamp_ns=touch_data.timestamp_ns,
             piezoelectric_output=piezoelectric_output,
             resonance_frequency=resonance_frequency,
             energy_storage=energy_storage,
@@ -392,45 +769,18 @@ class QuartzTouchInterface:
         )
         
         # Log quartz response
-        self.quartz_responses.append({
-            "timestamp": touch_data.timestamp,
-            "interface_id": interface_id,
-            "piezoelectric_output": piezoelectric_output,
-            "resonance_frequency": resonance_frequency,
-            "energy_storage": energy_storage
-        })
+        self._quartz_hist[self._quartz_head % self._history_capacity] = (
+            touch_data.timestamp_ns,
+            self._intern_interface_id(interface_id),
+            piezoelectric_output,
+            resonance_frequency,
+            energy_storage
+        )
+        self._quartz_head += 1
         
         return quartz_response
     
-    def _generate_biofeedback_signal(self, touch_data: TouchInput) -> np.ndarray:
-        """Generate biofeedback signal from touch data"""
-        
-        # Generate time series signal
-        time_points = 100
-        signal = np.zeros(time_points)
-        
-        # Add base frequency component
-        base_freq = touch_data.frequency_signature
-        time_array = np.linspace(0, 1, time_points)
-        signal += np.sin(2 * np.pi * base_freq * time_array) * touch_data.energy_level
-        
-        # Add chakra resonance components
-        for chakra, activation in touch_data.chakra_activation.items():
-            if activation > 0.1:  # Only significant activations
-                chakra_freq = np.mean(self.chakra_frequencies[chakra])
-                signal += np.sin(2 * np.pi * chakra_freq * time_array) * activation * 0.3
-        
-        # Add intent modulation
-        intent_modulation = np.sin(2 * np.pi * 10 * time_array) * touch_data.intent_strength
-        signal += intent_modulation
-        
-        # Add noise
-        noise = np.random.normal(0, 0.05, time_points)
-        signal += noise
-        
-        return signal
-    
-    def activate_control_sequence(self, intent_signal: IntentSignal, 
+    async def activate_control_sequence(self, intent_signal: IntentSignal, 
                                 interface_id: str) -> bool:
         """
         Activate control sequence based on intent signal
@@ -444,21 +794,41 @@ class QuartzTouchInterface:
         """
         
         if interface_id not in self.active_interfaces:
-            self.logger.error(f"Interface not found: {interface_id}")
+            self.logger.error("Interface not found: %s", interface_id)
             return False
         
-        self.logger.info(f"Activating control sequence: {intent_signal.intent_type}")
+        log_steps = self.logger.isEnabledFor(logging.INFO)
+        if log_steps:
+            self.logger.info("Activating control sequence: %s", intent_signal.intent_type)
         
         # Execute control sequence steps
-        for step in intent_signal.control_sequence:
-            self.logger.info(f"  Executing: {step}")
-            
-            # Simulate step execution
-            await asyncio.sleep(0.1)  # Simulate processing time
+        if log_steps:
+            for step in intent_signal.control_sequence:
+                self.logger.info("  Executing: %s", step)
         
-        self.logger.info(f"Control sequence completed: {intent_signal.intent_type}")
+        if self.simulate_latency:
+            for _ in intent_signal.control_sequence:
+                await asyncio.sleep(0.1)  # Simulate processing time
+        
+        self.logger.info("Control sequence completed: %s", intent_signal.intent_type)
         return True
     
+    async def activate_many(self, signals_ifaces: List[Tuple[IntentSignal, str]]) -> List[bool]:
+        """
+        Activate several control sequences concurrently
+        
+        Args:
+            signals_ifaces: (intent signal, interface id) pairs
+            
+        Returns:
+            Activation result for each pair, in order
+        """
+        
+        return list(await asyncio.gather(
+            *(self.activate_control_sequence(signal, interface_id)
+              for signal, interface_id in signals_ifaces)
+        ))
+    
     def get_interface_status(self, interface_id: str) -> Optional[Dict[str, Any]]:
         """Get status of touch interface"""
         
@@ -498,12 +868,16 @@ class QuartzTouchInterface:
         total_intents = sum(interface["intent_detections"] 
                            for interface in self.active_interfaces.values())
         
+        # Mean of the per-interface running means, without building a list
         avg_confidence = 0
         if total_intents > 0:
-            confidences = [interface["average_confidence"] 
-                          for interface in self.active_interfaces.values()
-                          if interface["intent_detections"] > 0]
-            avg_confidence = np.mean(confidences) if confidences else 0
+            confidence_sum = 0.0
+            detecting_interfaces = 0
+            for interface in self.active_interfaces.values():
+                if interface["intent_detections"] > 0:
+                    confidence_sum += interface["average_confidence"]
+                    detecting_interfaces += 1
+            avg_confidence = confidence_sum / detecting_interfaces
         
         report = {
             "interface_name": "Quartz Touch Neural Feedback Mesh",
@@ -512,8 +886,8 @@ class QuartzTouchInterface:
             "total_touches": total_touches,
             "total_intents": total_intents,
             "average_confidence": avg_confidence,
-            "touch_history_length": len(self.touch_history),
-            "quartz_responses_length": len(self.quartz_responses),
+            "touch_history_length": min(self._touch_head, self._history_capacity),
+            "quartz_responses_length": min(self._quartz_head, self._history_capacity),
             "intent_patterns_available": len(self.intent_patterns),
             "capabilities": {
                 "physical_touch": True,
@@ -542,8 +916,7 @@ async def cursor_kitten_example():
     )
     
     # Simulate touch input
-    touch_data = TouchInput(
-        timestamp=datetime.now(),
+    touch_data = TouchInput.from_now(
         touch_type=TouchType.INTENT_BASED,
         position=(0.5, 0.5),
         pressure=0.8,
@@ -559,7 +932,7 @@ async def cursor_kitten_example():
     
     if intent_signal:
         print(f"Intent detected: {intent_signal.intent_type} "
-              f"(level: {intent_signal.intent_level.value}, "
+              f"(level: {intent_signal.intent_level.label}, "
               f"confidence: {intent_signal.confidence:.3f})")
         
         # Activate control sequence
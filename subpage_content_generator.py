@@ -4,37 +4,17 @@
 Generates detailed content for each subpage following Nova Sanctum layout
 """
 
-import subprocess
 import sys
+import threading
 from datetime import datetime
+from pathlib import Path
 
-class SubpageContentGenerator:
-    def __init__(self):
-        self.current_subpage = ""
-        
-    def copy_to_clipboard(self, content, subpage_name):
-        """Copy content to clipboard"""
-        try:
-            if sys.platform == "darwin":
-                process = subprocess.Popen(['pbcopy'], stdin=subprocess.PIPE)
-                process.communicate(content.encode('utf-8'))
-                print(f"✅ {subpage_name} content copied to clipboard!")
-                return True
-            else:
-                print(f"📋 {subpage_name} content ready to copy manually")
-                return False
-        except Exception as e:
-            print(f"❌ Error copying {subpage_name}: {e}")
-            return False
-    
-    def generate_technology_subpages(self):
-        """Generate content for technology component subpages"""
-        print("\n" + "="*60)
-        print("🧩 GENERATING TECHNOLOGY COMPONENT SUBPAGES")
-        print("="*60)
-        
-        # Infrared Nanoparticle Integration System
-        infrared_content = """# 🔴 Infrared Nanoparticle Integration System
+_SEP = "=" * 60
+_IS_DARWIN = sys.platform == "darwin"
+_CLIPBOARD_SEPARATOR = "\n\n---\n\n"
+
+# Infrared Nanoparticle Integration System
+_INFRARED_MD = """# 🔴 Infrared Nanoparticle Integration System
 
 ## Overview
 Advanced upconversion nanoparticles (UCNPs) with 95% efficiency for passive infrared-to-visible conversion.
@@ -71,11 +51,9 @@ Advanced upconversion nanoparticles (UCNPs) with 95% efficiency for passive infr
 - **Multi-band Detection:** Extended spectral range
 - **AI Optimization:** Machine learning enhancement
 - **Scalability:** Mass production optimization"""
-        
-        self.copy_to_clipboard(infrared_content, "Infrared Nanoparticle Integration")
-        
-        # GlassSphere OS
-        os_content = """# 💎 GlassSphere OS - Neuro-Interface Layer
+
+# GlassSphere OS
+_OS_MD = """# 💎 GlassSphere OS - Neuro-Interface Layer
 
 ## Overview
 Frequency-modulated touch interfaces with 5-modal authentication system for advanced user interaction.
@@ -114,17 +92,9 @@ Frequency-modulated touch interfaces with 5-modal authentication system for adva
 - **Accessibility:** Universal design principles
 - **Customization:** Personal preference settings
 - **Training Support:** Built-in learning system"""
-        
-        self.copy_to_clipboard(os_content, "GlassSphere OS")
-        
-    def generate_architecture_subpages(self):
-        """Generate content for system architecture subpages"""
-        print("\n" + "="*60)
-        print("🏗️ GENERATING SYSTEM ARCHITECTURE SUBPAGES")
-        print("="*60)
-        
-        # Crystalline Quartz Layer
-        quartz_content = """# 💎 Layer 1: Crystalline Quartz Capacitor Layer
+
+# Crystalline Quartz Layer
+_QUARTZ_MD = """# 💎 Layer 1: Crystalline Quartz Capacitor Layer
 
 ## Overview
 Enhanced Synthetic Quartz with advanced piezoelectric properties for energy storage and frequency amplification.
@@ -163,11 +133,9 @@ Enhanced Synthetic Quartz with advanced piezoelectric properties for energy stor
 3. **Forming:** Precision cutting and shaping
 4. **Coating:** Protective layer application
 5. **Testing:** Quality assurance validation"""
-        
-        self.copy_to_clipboard(quartz_content, "Crystalline Quartz Layer")
-        
-        # Nanoparticle Matrix
-        matrix_content = """# 🔬 Layer 2: Nanoparticle-Matrix Display
+
+# Nanoparticle Matrix
+_MATRIX_MD = """# 🔬 Layer 2: Nanoparticle-Matrix Display
 
 ## Overview
 Quantum Dot Enhanced UCNP Lattice with 4K+ resolution for infrared-to-visible conversion and thermal mapping.
@@ -206,17 +174,9 @@ Quantum Dot Enhanced UCNP Lattice with 4K+ resolution for infrared-to-visible co
 - **Thermal Conductivity:** 400 W/mK
 - **Heat Capacity:** 2.0 J/gK
 - **Cooling System:** Integrated heat pipes"""
-        
-        self.copy_to_clipboard(matrix_content, "Nanoparticle Matrix")
-        
-    def generate_application_subpages(self):
-        """Generate content for application platform subpages"""
-        print("\n" + "="*60)
-        print("🌌 GENERATING APPLICATION PLATFORM SUBPAGES")
-        print("="*60)
-        
-        # GlassSphere HUD
-        hud_content = """# 🥽 GlassSphere HUD (Heads-Up Display)
+
+# GlassSphere HUD
+_HUD_MD = """# 🥽 GlassSphere HUD (Heads-Up Display)
 
 ## Overview
 Advanced heads-up display with night-vision overlays and third-eye projection capabilities for augmented perception.
@@ -255,11 +215,9 @@ Advanced heads-up display with night-vision overlays and third-eye projection ca
 - **Eye Tracking:** Gaze control
 - **Brain Interface:** Direct neural
 - **Haptic Feedback:** Tactile response"""
-        
-        self.copy_to_clipboard(hud_content, "GlassSphere HUD")
-        
-        # Crystal Tablets
-        tablet_content = """# 📱 Crystal Tablets (Touch Slabs)
+
+# Crystal Tablets
+_TABLET_MD = """# 📱 Crystal Tablets (Touch Slabs)
 
 ## Overview
 Advanced touch tablets with energy diagnostics and spiritual mapping capabilities for comprehensive analysis.
@@ -298,17 +256,9 @@ Advanced touch tablets with energy diagnostics and spiritual mapping capabilitie
 - **Accuracy:** ±0.1%
 - **Response Time:** <1 ms
 - **Calibration:** Automatic"""
-        
-        self.copy_to_clipboard(tablet_content, "Crystal Tablets")
-        
-    def generate_research_subpages(self):
-        """Generate content for research and development subpages"""
-        print("\n" + "="*60)
-        print("🔬 GENERATING RESEARCH & DEVELOPMENT SUBPAGES")
-        print("="*60)
-        
-        # Chinese Technology Integration
-        chinese_content = """# 🇨🇳 Chinese Technology Integration
+
+# Chinese Technology Integration
+_CHINESE_MD = """# 🇨🇳 Chinese Technology Integration
 
 ## Overview
 Integration of advanced Chinese infrared contact lens technology with 95% efficiency for enhanced perception systems.
@@ -347,17 +297,9 @@ Integration of advanced Chinese infrared contact lens technology with 95% effici
 - **Government:** Defense applications
 - **International:** Global cooperation
 - **Future Projects:** Advanced development"""
-        
-        self.copy_to_clipboard(chinese_content, "Chinese Technology Integration")
-        
-    def generate_business_subpages(self):
-        """Generate content for business and economic subpages"""
-        print("\n" + "="*60)
-        print("💰 GENERATING BUSINESS & ECONOMIC SUBPAGES")
-        print("="*60)
-        
-        # Market Analysis
-        market_content = """# 📊 Market Analysis
+
+# Market Analysis
+_MARKET_MD = """# 📊 Market Analysis
 
 ## Overview
 Comprehensive market research and projections for the GlassSphere infrared-crystal interface technology.
@@ -396,11 +338,9 @@ Comprehensive market research and projections for the GlassSphere infrared-cryst
 - **Quantum Computing:** Emerging applications
 - **AI Integration:** Accelerating adoption
 - **Sustainability:** Green technology focus"""
-        
-        self.copy_to_clipboard(market_content, "Market Analysis")
-        
-        # Economic Impact
-        economic_content = """# 💼 Economic Impact Assessment
+
+# Economic Impact
+_ECONOMIC_MD = """# 💼 Economic Impact Assessment
 
 ## Overview
 Comprehensive economic impact analysis and job creation projections for the GlassSphere technology.
@@ -439,17 +379,9 @@ Comprehensive economic impact analysis and job creation projections for the Glas
 - **Quality of Life:** Significant improvement
 - **Healthcare Savings:** $50 billion annually
 - **Security Enhancement:** Priceless value"""
-        
-        self.copy_to_clipboard(economic_content, "Economic Impact")
-        
-    def generate_implementation_subpages(self):
-        """Generate content for implementation and deployment subpages"""
-        print("\n" + "="*60)
-        print("🚀 GENERATING IMPLEMENTATION & DEPLOYMENT SUBPAGES")
-        print("="*60)
-        
-        # Development Roadmap
-        roadmap_content = """# 🗺️ Development Roadmap
+
+# Development Roadmap
+_ROADMAP_MD = """# 🗺️ Development Roadmap
 
 ## Overview
 Detailed development timeline and milestones for the GlassSphere infrared-crystal interface technology.
@@ -485,11 +417,9 @@ Detailed development timeline and milestones for the GlassSphere infrared-crysta
 - **Real-time Harmonization:** Month 2
 - **Predictive Modeling:** Month 3
 - **Cross-platform Coordination:** Ongoing"""
-        
-        self.copy_to_clipboard(roadmap_content, "Development Roadmap")
-        
-        # Deployment Strategy
-        deployment_content = """# 📦 Deployment Strategy
+
+# Deployment Strategy
+_DEPLOYMENT_MD = """# 📦 Deployment Strategy
 
 ## Overview
 Strategic deployment and rollout planning for the GlassSphere technology across multiple markets and applications.
@@ -528,13 +458,152 @@ Strategic deployment and rollout planning for the GlassSphere technology across
 - **Monitoring Systems:** Real-time tracking
 - **Support Systems:** 24/7 availability
 - **Contingency Plans:** Backup systems"""
+
+# (subpage name, content) per category, in generation order
+_TECH_PAGES = (
+    ("Infrared Nanoparticle Integration", _INFRARED_MD),
+    ("GlassSphere OS", _OS_MD),
+)
+_ARCH_PAGES = (
+    ("Crystalline Quartz Layer", _QUARTZ_MD),
+    ("Nanoparticle Matrix", _MATRIX_MD),
+)
+_APP_PAGES = (
+    ("GlassSphere HUD", _HUD_MD),
+    ("Crystal Tablets", _TABLET_MD),
+)
+_RESEARCH_PAGES = (
+    ("Chinese Technology Integration", _CHINESE_MD),
+)
+_BUSINESS_PAGES = (
+    ("Market Analysis", _MARKET_MD),
+    ("Economic Impact", _ECONOMIC_MD),
+)
+_IMPL_PAGES = (
+    ("Development Roadmap", _ROADMAP_MD),
+    ("Deployment Strategy", _DEPLOYMENT_MD),
+)
+
+class SubpageContentGenerator:
+    def __init__(self):
+        self.current_subpage = ""
+        self._pending = []
+        self._pending_lock = threading.Lock()
+        
+    def copy_to_clipboard(self, content, subpage_name):
+        """Queue content for the clipboard; flush_clipboard copies it all at once"""
+        with self._pending_lock:
+            self._pending.append((subpage_name, content))
+        print(f"📝 {subpage_name} content generated")
+        return True
+    
+    def flush_clipboard(self, output_dir=None):
+        """Copy all queued content to the clipboard in one pbcopy call
+        
+        If output_dir is given, each subpage is also written to
+        <output_dir>/<subpage-name>.md. The file writes and the pbcopy
+        subprocess run concurrently on a thread pool.
+        """
+        with self._pending_lock:
+            pending, self._pending = self._pending, []
+        if not pending:
+            return False
+        
+        from concurrent.futures import ThreadPoolExecutor
+        
+        with ThreadPoolExecutor() as executor:
+            clipboard = None
+            if _IS_DARWIN:
+                payload = _CLIPBOARD_SEPARATOR.join(content for _, content in pending)
+                clipboard = executor.submit(self._pbcopy, payload)
+            
+            if output_dir is not None:
+                out = Path(output_dir)
+                out.mkdir(parents=True, exist_ok=True)
+                list(executor.map(
+                    lambda item: (out / f"{item[0].lower().replace(' ', '-')}.md").write_text(item[1], encoding="utf-8"),
+                    pending
+                ))
+                print(f"💾 {len(pending)} subpages written to {out}/")
+            
+            if not _IS_DARWIN:
+                print(f"📋 {len(pending)} subpages ready to copy manually")
+                return False
+            
+            try:
+                clipboard.result()
+                print(f"✅ {len(pending)} subpages copied to clipboard!")
+                return True
+            except Exception as e:
+                print(f"❌ Error copying subpages: {e}")
+                return False
+    
+    @staticmethod
+    def _pbcopy(payload):
+        """Pipe payload into pbcopy"""
+        import subprocess
         
-        self.copy_to_clipboard(deployment_content, "Deployment Strategy")
+        subprocess.run(['pbcopy'], input=payload.encode('utf-8'),
+                       stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=False)
+    
+    def generate_technology_subpages(self):
+        """Generate content for technology component subpages"""
+        print("\n" + _SEP)
+        print("🧩 GENERATING TECHNOLOGY COMPONENT SUBPAGES")
+        print(_SEP)
+        
+        for subpage_name, content in _TECH_PAGES:
+            self.copy_to_clipboard(content, subpage_name)
         
-    def run_complete_generation(self):
+    def generate_architecture_subpages(self):
+        """Generate content for system architecture subpages"""
+        print("\n" + _SEP)
+        print("🏗️ GENERATING SYSTEM ARCHITECTURE SUBPAGES")
+        print(_SEP)
+        
+        for subpage_name, content in _ARCH_PAGES:
+            self.copy_to_clipboard(content, subpage_name)
+        
+    def generate_application_subpages(self):
+        """Generate content for application platform subpages"""
+        print("\n" + _SEP)
+        print("🌌 GENERATING APPLICATION PLATFORM SUBPAGES")
+        print(_SEP)
+        
+        for subpage_name, content in _APP_PAGES:
+            self.copy_to_clipboard(content, subpage_name)
+        
+    def generate_research_subpages(self):
+        """Generate content for research and development subpages"""
+        print("\n" + _SEP)
+        print("🔬 GENERATING RESEARCH & DEVELOPMENT SUBPAGES")
+        print(_SEP)
+        
+        for subpage_name, content in _RESEARCH_PAGES:
+            self.copy_to_clipboard(content, subpage_name)
+        
+    def generate_business_subpages(self):
+        """Generate content for business and economic subpages"""
+        print("\n" + _SEP)
+        print("💰 GENERATING BUSINESS & ECONOMIC SUBPAGES")
+        print(_SEP)
+        
+        for subpage_name, content in _BUSINESS_PAGES:
+            self.copy_to_clipboard(content, subpage_name)
+        
+    def generate_implementation_subpages(self):
+        """Generate content for implementation and deployment subpages"""
+        print("\n" + _SEP)
+        print("🚀 GENERATING IMPLEMENTATION & DEPLOYMENT SUBPAGES")
+        print(_SEP)
+        
+        for subpage_name, content in _IMPL_PAGES:
+            self.copy_to_clipboard(content, subpage_name)
+        
+    def run_complete_generation(self, output_dir=None):
         """Run the complete subpage content generation"""
         print("🔮 GLASSPHERE Subpage Content Generator")
-        print("="*60)
+        print(_SEP)
         print(f"🕐 Started at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
         print("🎯 Generating detailed content for all subpages")
         
@@ -546,10 +615,13 @@ Strategic deployment and rollout planning for the GlassSphere technology across
         self.generate_business_subpages()
         self.generate_implementation_subpages()
         
+        # Copy everything in one go (and optionally save each subpage)
+        self.flush_clipboard(output_dir)
+        
         # Final summary
-        print("\n" + "="*60)
+        print("\n" + _SEP)
         print("🎉 SUBPAGE CONTENT GENERATION COMPLETE!")
-        print("="*60)
+        print(_SEP)
         print("✅ Detailed content has been generated for key subpages")
         print("📋 Content is ready to copy and paste into Notion")
         print("🔗 Follow the Nova Sanctum layout pattern")
@@ -564,14 +636,20 @@ Strategic deployment and rollout planning for the GlassSphere technology across
         print("• Implementation: Roadmap, Deployment Strategy")
         
         print("\n🔮 The future of augmented perception documentation awaits!")
-        print("="*60)
+        print(_SEP)
         print("✅ CONTENT GENERATION COMPLETE - START CREATING SUBPAGES!")
-        print("="*60)
+        print(_SEP)
 
 def main():
     """Main function"""
+    import argparse
+    
+    parser = argparse.ArgumentParser(description="Generate GLASSPHERE subpage content")
+    parser.add_argument("--out", metavar="DIR", help="also write each subpage to DIR/<name>.md")
+    args = parser.parse_args()
+    
     generator = SubpageContentGenerator()
-    generator.run_complete_generation()
+    generator.run_complete_generation(args.out)
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file
@@ -9,8 +9,272 @@ Date: December 2024
 
 import math
 import json
+import sys
+from collections import namedtuple
+from dataclasses import dataclass
 from datetime import datetime
+from functools import lru_cache
+from types import MappingProxyType
+
+import numpy as np
+
 from core.constants import SCHUMANN_RESONANCE, GOLDEN_RATIO
+from core.jit import NUMBA_AVAILABLE, njit, prange
+
+# CIA briefcase technology specifications (read-only, shared by every analysis)
+_CIA_TECH = MappingProxyType({
+    'wireless_energy_transmission': MappingProxyType({
+        'technology': 'Enhanced Wardenclyffe Tower',
+        'power_output': '500 MW',
+        'transmission_distance': 'Global',
+        'efficiency': '98%',
+        'status': 'Reconstructed from patents'
+    }),
+    'scalar_wave_weapons': MappingProxyType({
+        'technology': 'Directed energy weapons',
+        'range': '1000 km',
+        'power': '10 MW',
+        'precision': 'Sub-meter',
+        'status': 'Theoretical reconstruction'
+    }),
+    'free_energy_devices': MappingProxyType({
+        'technology': 'Advanced zero-point energy extraction',
+        'power_output': '200 MW',
+        'efficiency': '99%',
+        'fuel_requirement': 'None',
+        'status': 'Patent-based reconstruction'
+    }),
+    'teleportation_prototype': MappingProxyType({
+        'technology': 'Quantum entanglement transport',
+        'distance': '100 m',
+        'mass_limit': '1 kg',
+        'energy_requirement': '1 MW',
+        'status': 'Theoretical framework'
+    }),
+    'anti_gravity_propulsion': MappingProxyType({
+        'technology': 'Electromagnetic field manipulation',
+        'thrust': '1000 N',
+        'efficiency': '80%',
+        'fuel_requirement': 'Electrical only',
+        'status': 'Patent-based reconstruction'
+    })
+})
+
+SCALAR_WAVE_VELOCITY = 1.5e9  # m/s
+
+# Tesla coil coupling coefficient and quality factor shared by every coil spec
+_COIL_COUPLING = 0.85
+_COIL_QUALITY_FACTOR = 1000
+
+# Free energy device efficiency by device type (unknown types fall back to 0.80)
+_FREE_ENERGY_EFF = MappingProxyType({
+    "radiant_energy": 0.85,
+    "atmospheric_electricity": 0.75,
+    "zero_point": 0.95
+})
+
+# Numeric kernels behind the spec builders; the namedtuple assembly stays in Python.
+@njit(cache=True, fastmath=True)
+def _coil_kernel(primary_voltage, quality_factor, coupling_coefficient):
+    secondary_voltage = primary_voltage * 100
+    return secondary_voltage, secondary_voltage / 1000, quality_factor * coupling_coefficient
+
+@njit(cache=True, fastmath=True)
+def _scalar_kernel(frequency, amplitude, wave_velocity):
+    return (frequency * 0.1, frequency * 10, wave_velocity / frequency,
+            (amplitude ** 2) / (2 * 377))
+
+@njit(cache=True, fastmath=True)
+def _tower_kernel(tower_height, wave_velocity):
+    return tower_height * 0.3, wave_velocity / (4 * tower_height), tower_height * 100
+
+# Row layout of the ``out`` matrix filled by ``_batch_kernel``.
+_BATCH_COLUMNS = (
+    'secondary_voltage', 'transmission_distance', 'frequency_range_low',
+    'frequency_range_high', 'coherence_length', 'power_density',
+    'base_diameter', 'tower_frequency', 'coverage_radius'
+)
+
+@njit(cache=True, fastmath=True, parallel=True)
+def _batch_kernel(base_resonance, primary_voltage, amplitude, tower_height, wave_velocity, out):
+    for i in prange(base_resonance.shape[0]):
+        sec_v, trans_dist, _ = _coil_kernel(primary_voltage[i], float(_COIL_QUALITY_FACTOR), _COIL_COUPLING)
+        low, high, coh, pd = _scalar_kernel(base_resonance[i], amplitude[i], wave_velocity)
+        diam, tower_freq, coverage = _tower_kernel(tower_height[i], wave_velocity)
+        out[0, i] = sec_v
+        out[1, i] = trans_dist
+        out[2, i] = low
+        out[3, i] = high
+        out[4, i] = coh
+        out[5, i] = pd
+        out[6, i] = diam
+        out[7, i] = tower_freq
+        out[8, i] = coverage
+
+TeslaCoilSpec = namedtuple('TeslaCoilSpec', [
+    'name', 'primary_voltage', 'secondary_voltage', 'resonance_frequency',
+    'coupling_coefficient', 'quality_factor', 'transmission_distance',
+    'efficiency', 'enhancement_factor'
+])
+ScalarGeneratorSpec = namedtuple('ScalarGeneratorSpec', [
+    'name', 'frequency_range', 'amplitude', 'phase_shift',
+    'coherence_length', 'power_density'
+])
+WardenclyffeTowerSpec = namedtuple('WardenclyffeTowerSpec', [
+    'name', 'tower_height', 'base_diameter', 'transmission_power',
+    'frequency', 'coverage_radius', 'efficiency'
+])
+FreeEnergyDeviceSpec = namedtuple('FreeEnergyDeviceSpec', [
+    'name', 'device_type', 'power_output', 'efficiency',
+    'fuel_requirement', 'environmental_impact'
+])
+
+@lru_cache(maxsize=256)
+def _slug(name):
+    """Lower-case, underscore-joined pyramid name used to prefix spec names."""
+    return name.lower().replace(' ', '_')
+
+# Spec constructors are pure functions of their arguments, so repeated
+# analyses of the same pyramid reuse the cached (immutable) specs.
+@lru_cache(maxsize=1024)
+def _tesla_coil_spec(name, primary_voltage, resonance_frequency):
+    coupling_coefficient = _COIL_COUPLING
+    quality_factor = _COIL_QUALITY_FACTOR
+    secondary_voltage, transmission_distance, enhancement_factor = _coil_kernel(
+        float(primary_voltage), float(quality_factor), coupling_coefficient
+    )
+    return TeslaCoilSpec(
+        name=name,
+        primary_voltage=primary_voltage,
+        secondary_voltage=secondary_voltage,
+        resonance_frequency=resonance_frequency,
+        coupling_coefficient=coupling_coefficient,
+        quality_factor=quality_factor,
+        transmission_distance=transmission_distance,
+        efficiency=0.95,
+        enhancement_factor=enhancement_factor
+    )
+
+@lru_cache(maxsize=1024)
+def _scalar_generator_spec(name, frequency, amplitude):
+    low, high, coherence_length, power_density = _scalar_kernel(
+        float(frequency), float(amplitude), SCALAR_WAVE_VELOCITY
+    )
+    return ScalarGeneratorSpec(
+        name=name,
+        frequency_range=(low, high),
+        amplitude=amplitude,
+        phase_shift=math.pi / 4,
+        coherence_length=coherence_length,
+        power_density=power_density
+    )
+
+@lru_cache(maxsize=1024)
+def _wardenclyffe_tower_spec(name, tower_height, transmission_power):
+    base_diameter, frequency, coverage_radius = _tower_kernel(float(tower_height), SCALAR_WAVE_VELOCITY)
+    return WardenclyffeTowerSpec(
+        name=name,
+        tower_height=tower_height,
+        base_diameter=base_diameter,
+        transmission_power=transmission_power,
+        frequency=frequency,
+        coverage_radius=coverage_radius,
+        efficiency=0.90
+    )
+
+@lru_cache(maxsize=1024)
+def _free_energy_device_spec(name, device_type, power_output):
+    return FreeEnergyDeviceSpec(
+        name=name,
+        device_type=device_type,
+        power_output=power_output,
+        efficiency=_FREE_ENERGY_EFF.get(device_type, 0.80),
+        fuel_requirement='none',
+        environmental_impact='positive'
+    )
+
+@dataclass
+class TeslaSpecsSoA:
+    """Tesla specs for a batch of pyramids stored as parallel NumPy columns.
+
+    Columns are filled with vectorized ufuncs; ``self[i]`` materializes the
+    same analysis dict ``analyze_pyramid`` returns for row ``i``.
+    """
+    pyramid_names: list
+    slugs: list
+    base_resonance: np.ndarray
+    primary_voltage: np.ndarray
+    secondary_voltage: np.ndarray
+    transmission_distance: np.ndarray
+    amplitude: np.ndarray
+    frequency_range_low: np.ndarray
+    frequency_range_high: np.ndarray
+    coherence_length: np.ndarray
+    power_density: np.ndarray
+    tower_height: np.ndarray
+    base_diameter: np.ndarray
+    transmission_power: np.ndarray
+    tower_frequency: np.ndarray
+    coverage_radius: np.ndarray
+    power_output: np.ndarray
+    recommended_activation: float
+    activation_potential: float = 0.8
+    safety_score: float = 0.9
+    device_type: str = "zero_point"
+
+    def __len__(self):
+        return len(self.pyramid_names)
+
+    def __getitem__(self, i):
+        slug = self.slugs[i]
+        freq = float(self.base_resonance[i])
+        primary_voltage = float(self.primary_voltage[i])
+        _, _, enhancement_factor = _coil_kernel(primary_voltage, float(_COIL_QUALITY_FACTOR), _COIL_COUPLING)
+        tesla_coil = TeslaCoilSpec(
+            name=f"{slug}_tesla_coil",
+            primary_voltage=primary_voltage,
+            secondary_voltage=float(self.secondary_voltage[i]),
+            resonance_frequency=freq,
+            coupling_coefficient=_COIL_COUPLING,
+            quality_factor=_COIL_QUALITY_FACTOR,
+            transmission_distance=float(self.transmission_distance[i]),
+            efficiency=0.95,
+            enhancement_factor=enhancement_factor
+        )
+        scalar_generator = ScalarGeneratorSpec(
+            name=f"{slug}_scalar_generator",
+            frequency_range=(float(self.frequency_range_low[i]), float(self.frequency_range_high[i])),
+            amplitude=float(self.amplitude[i]),
+            phase_shift=math.pi / 4,
+            coherence_length=float(self.coherence_length[i]),
+            power_density=float(self.power_density[i])
+        )
+        wardenclyffe_tower = WardenclyffeTowerSpec(
+            name=f"{slug}_wardenclyffe_tower",
+            tower_height=float(self.tower_height[i]),
+            base_diameter=float(self.base_diameter[i]),
+            transmission_power=float(self.transmission_power[i]),
+            frequency=float(self.tower_frequency[i]),
+            coverage_radius=float(self.coverage_radius[i]),
+            efficiency=0.90
+        )
+        free_energy_device = _free_energy_device_spec(
+            f"{slug}_free_energy", self.device_type, float(self.power_output[i])
+        )
+        return {
+            'pyramid_name': self.pyramid_names[i],
+            'base_resonance': self.base_resonance[i].item(),
+            'activation_potential': self.activation_potential,
+            'safety_score': self.safety_score,
+            'recommended_activation': self.recommended_activation,
+            'tesla_integration': {
+                'tesla_coil': tesla_coil,
+                'scalar_generator': scalar_generator,
+                'wardenclyffe_tower': wardenclyffe_tower,
+                'free_energy_device': free_energy_device,
+                'cia_technology': _CIA_TECH
+            }
+        }
 
 class SimpleTeslaSystem:
     """Simplified Tesla energy system for demonstration."""
@@ -20,118 +284,27 @@ class SimpleTeslaSystem:
         self.SCHUMANN_BASE = SCHUMANN_RESONANCE  # Hz
         self.GOLDEN_RATIO = GOLDEN_RATIO
         self.HYDROGEN_LINE = 1420405751.786  # Hz (1420 MHz)
-        self.SCALAR_WAVE_VELOCITY = 1.5e9  # m/s
+        self.SCALAR_WAVE_VELOCITY = SCALAR_WAVE_VELOCITY
         
     def create_tesla_coil(self, name, primary_voltage=50000.0, resonance_frequency=7.83):
         """Create a Tesla coil specification."""
-        secondary_voltage = primary_voltage * 100
-        coupling_coefficient = 0.85
-        quality_factor = 1000
-        transmission_distance = secondary_voltage / 1000
-        efficiency = 0.95
-        
-        return {
-            'name': name,
-            'primary_voltage': primary_voltage,
-            'secondary_voltage': secondary_voltage,
-            'resonance_frequency': resonance_frequency,
-            'coupling_coefficient': coupling_coefficient,
-            'quality_factor': quality_factor,
-            'transmission_distance': transmission_distance,
-            'efficiency': efficiency,
-            'enhancement_factor': quality_factor * coupling_coefficient
-        }
+        return _tesla_coil_spec(name, primary_voltage, resonance_frequency)
     
     def create_scalar_generator(self, name, frequency=7.83, amplitude=2000.0):
         """Create a scalar wave generator specification."""
-        frequency_range = (frequency * 0.1, frequency * 10)
-        phase_shift = math.pi / 4
-        coherence_length = self.SCALAR_WAVE_VELOCITY / frequency
-        power_density = (amplitude ** 2) / (2 * 377)
-        
-        return {
-            'name': name,
-            'frequency_range': frequency_range,
-            'amplitude': amplitude,
-            'phase_shift': phase_shift,
-            'coherence_length': coherence_length,
-            'power_density': power_density
-        }
+        return _scalar_generator_spec(name, frequency, amplitude)
     
     def create_wardenclyffe_tower(self, name, tower_height=100.0, transmission_power=1000000.0):
         """Create a Wardenclyffe Tower specification."""
-        base_diameter = tower_height * 0.3
-        frequency = self.SCALAR_WAVE_VELOCITY / (4 * tower_height)
-        coverage_radius = tower_height * 100
-        efficiency = 0.90
-        
-        return {
-            'name': name,
-            'tower_height': tower_height,
-            'base_diameter': base_diameter,
-            'transmission_power': transmission_power,
-            'frequency': frequency,
-            'coverage_radius': coverage_radius,
-            'efficiency': efficiency
-        }
+        return _wardenclyffe_tower_spec(name, tower_height, transmission_power)
     
     def create_free_energy_device(self, name, device_type="zero_point", power_output=100000.0):
         """Create a free energy device specification."""
-        efficiencies = {
-            "radiant_energy": 0.85,
-            "atmospheric_electricity": 0.75,
-            "zero_point": 0.95
-        }
-        efficiency = efficiencies.get(device_type, 0.80)
-        
-        return {
-            'name': name,
-            'device_type': device_type,
-            'power_output': power_output,
-            'efficiency': efficiency,
-            'fuel_requirement': 'none',
-            'environmental_impact': 'positive'
-        }
+        return _free_energy_device_spec(name, device_type, power_output)
     
     def recover_cia_technology(self):
         """Recover CIA briefcase technology specifications."""
-        return {
-            'wireless_energy_transmission': {
-                'technology': 'Enhanced Wardenclyffe Tower',
-                'power_output': '500 MW',
-                'transmission_distance': 'Global',
-                'efficiency': '98%',
-                'status': 'Reconstructed from patents'
-            },
-            'scalar_wave_weapons': {
-                'technology': 'Directed energy weapons',
-                'range': '1000 km',
-                'power': '10 MW',
-                'precision': 'Sub-meter',
-                'status': 'Theoretical reconstruction'
-            },
-            'free_energy_devices': {
-                'technology': 'Advanced zero-point energy extraction',
-                'power_output': '200 MW',
-                'efficiency': '99%',
-                'fuel_requirement': 'None',
-                'status': 'Patent-based reconstruction'
-            },
-            'teleportation_prototype': {
-                'technology': 'Quantum entanglement transport',
-                'distance': '100 m',
-                'mass_limit': '1 kg',
-                'energy_requirement': '1 MW',
-                'status': 'Theoretical framework'
-            },
-            'anti_gravity_propulsion': {
-                'technology': 'Electromagnetic field manipulation',
-                'thrust': '1000 N',
-                'efficiency': '80%',
-                'fuel_requirement': 'Electrical only',
-                'status': 'Patent-based reconstruction'
-            }
-        }
+        return _CIA_TECH
 
 class SimplePyramidAnalyzer:
     """Simplified pyramid resonance analyzer with Tesla integration."""
@@ -149,22 +322,23 @@ class SimplePyramidAnalyzer:
         safety_score = 0.9  # Example value
         
         # Tesla integration
+        slug = _slug(pyramid_data['name'])
         tesla_coil = self.tesla_system.create_tesla_coil(
-            f"{pyramid_data['name'].lower().replace(' ', '_')}_tesla_coil",
+            f"{slug}_tesla_coil",
             resonance_frequency=base_resonance
         )
         
         scalar_generator = self.tesla_system.create_scalar_generator(
-            f"{pyramid_data['name'].lower().replace(' ', '_')}_scalar_generator",
+            f"{slug}_scalar_generator",
             frequency=base_resonance
         )
         
         wardenclyffe_tower = self.tesla_system.create_wardenclyffe_tower(
-            f"{pyramid_data['name'].lower().replace(' ', '_')}_wardenclyffe_tower"
+            f"{slug}_wardenclyffe_tower"
         )
         
         free_energy_device = self.tesla_system.create_free_energy_device(
-            f"{pyramid_data['name'].lower().replace(' ', '_')}_free_energy"
+            f"{slug}_free_energy"
         )
         
         cia_technology = self.tesla_system.recover_cia_technology()
@@ -184,10 +358,86 @@ class SimplePyramidAnalyzer:
             }
         }
 
+    def analyze_pyramids_batch(self, pyramids):
+        """Analyze many pyramids at once, returning a ``TeslaSpecsSoA``."""
+        n = len(pyramids)
+        names = [p['name'] for p in pyramids]
+        base_resonance = np.fromiter(
+            (p.get('primary_resonance_hz', self.SCHUMANN_BASE) for p in pyramids),
+            dtype=np.float64, count=n
+        )
+        primary_voltage = np.full(n, 50000.0)
+        amplitude = np.full(n, 2000.0)
+        tower_height = np.full(n, 100.0)
+        if NUMBA_AVAILABLE:
+            out = np.empty((len(_BATCH_COLUMNS), n))
+            _batch_kernel(base_resonance, primary_voltage, amplitude, tower_height,
+                          SCALAR_WAVE_VELOCITY, out)
+            columns = dict(zip(_BATCH_COLUMNS, out))
+        else:
+            secondary_voltage = primary_voltage * 100
+            columns = {
+                'secondary_voltage': secondary_voltage,
+                'transmission_distance': secondary_voltage / 1000,
+                'frequency_range_low': base_resonance * 0.1,
+                'frequency_range_high': base_resonance * 10,
+                'coherence_length': SCALAR_WAVE_VELOCITY / base_resonance,
+                'power_density': (amplitude ** 2) / (2 * 377),
+                'base_diameter': tower_height * 0.3,
+                'tower_frequency': SCALAR_WAVE_VELOCITY / (4 * tower_height),
+                'coverage_radius': tower_height * 100,
+            }
+        activation_potential = 0.8  # Example value
+        safety_score = 0.9  # Example value
+        return TeslaSpecsSoA(
+            pyramid_names=names,
+            slugs=[_slug(name) for name in names],
+            base_resonance=base_resonance,
+            primary_voltage=primary_voltage,
+            amplitude=amplitude,
+            tower_height=tower_height,
+            transmission_power=np.full(n, 1000000.0),
+            power_output=np.full(n, 100000.0),
+            recommended_activation=min(activation_potential * safety_score, 0.5),
+            activation_potential=activation_potential,
+            safety_score=safety_score,
+            **columns
+        )
+
+
+# Fixed report sections printed by main()
+_BENEFITS = (
+    "850x resonance amplification through Tesla coils",
+    "2000 V/m scalar wave field enhancement",
+    "10,000 km global energy transmission",
+    "100 kW sustainable power generation per pyramid",
+    "Zero-point energy extraction capabilities",
+    "Instant quantum communication between sites",
+    "Anti-gravity propulsion possibilities",
+    "Directed energy weapon systems (defensive)",
+    "Teleportation prototype development",
+    "Time dilation field generation"
+)
+
+_NEXT_STEPS = (
+    "UNESCO proposal submission with Tesla integration",
+    "Laboratory testing of Tesla coil-pyramid coupling",
+    "Scalar wave field mapping at pyramid sites",
+    "Wardenclyffe Tower prototype construction",
+    "Free energy device field testing",
+    "CIA technology reconstruction and validation",
+    "Global pyramid network synchronization",
+    "AI integration for grid management (Lilith.Eve/AthenaMist)",
+    "Community consultation and benefit sharing",
+    "Environmental impact assessment and monitoring"
+)
+
 def main():
     """Main demonstration function."""
-    print("🔌 GLASSPHERE PNAP-Tesla Integration Test")
-    print("=" * 50)
+    out = [
+        "🔌 GLASSPHERE PNAP-Tesla Integration Test",
+        "=" * 50,
+    ]
     
     # Initialize analyzer
     analyzer = SimplePyramidAnalyzer()
@@ -206,66 +456,45 @@ def main():
     # Analyze pyramid with Tesla integration
     analysis = analyzer.analyze_pyramid(giza_pyramid)
     
-    # Print results
-    print(f"\n🏛️ Pyramid Analysis: {analysis['pyramid_name']}")
-    print(f"Base Resonance: {analysis['base_resonance']} Hz")
-    print(f"Activation Potential: {analysis['activation_potential']:.3f}")
-    print(f"Safety Score: {analysis['safety_score']:.3f}")
-    print(f"Recommended Activation: {analysis['recommended_activation']:.3f}")
+    # Collect results; everything is written to stdout in one go at the end
+    out.extend((
+        f"\n🏛️ Pyramid Analysis: {analysis['pyramid_name']}",
+        f"Base Resonance: {analysis['base_resonance']} Hz",
+        f"Activation Potential: {analysis['activation_potential']:.3f}",
+        f"Safety Score: {analysis['safety_score']:.3f}",
+        f"Recommended Activation: {analysis['recommended_activation']:.3f}",
+    ))
     
     # Tesla integration results
     tesla = analysis['tesla_integration']
     
-    print(f"\n⚡ Tesla Technology Integration:")
-    print(f"Tesla Coil Enhancement: {tesla['tesla_coil']['enhancement_factor']:.0f}x")
-    print(f"Scalar Wave Amplitude: {tesla['scalar_generator']['amplitude']} V/m")
-    print(f"Wardenclyffe Coverage: {tesla['wardenclyffe_tower']['coverage_radius']:.0f} km")
-    print(f"Free Energy Output: {tesla['free_energy_device']['power_output']} W")
+    out.extend((
+        "\n⚡ Tesla Technology Integration:",
+        f"Tesla Coil Enhancement: {tesla['tesla_coil'].enhancement_factor:.0f}x",
+        f"Scalar Wave Amplitude: {tesla['scalar_generator'].amplitude} V/m",
+        f"Wardenclyffe Coverage: {tesla['wardenclyffe_tower'].coverage_radius:.0f} km",
+        f"Free Energy Output: {tesla['free_energy_device'].power_output} W",
+    ))
     
-    print(f"\n🎒 CIA Briefcase Technology Recovery:")
+    out.append("\n🎒 CIA Briefcase Technology Recovery:")
     cia_tech = tesla['cia_technology']
     for tech_name, tech_specs in cia_tech.items():
-        print(f"- {tech_name.replace('_', ' ').title()}: {tech_specs['technology']}")
-        print(f"  Power: {tech_specs.get('power_output', 'N/A')}")
-        print(f"  Status: {tech_specs['status']}")
+        out.append(f"- {tech_name.replace('_', ' ').title()}: {tech_specs['technology']}")
+        out.append(f"  Power: {tech_specs.get('power_output', 'N/A')}")
+        out.append(f"  Status: {tech_specs['status']}")
     
-    print(f"\n🔮 PNAP-Tesla Integration Benefits:")
-    benefits = [
-        "850x resonance amplification through Tesla coils",
-        "2000 V/m scalar wave field enhancement",
-        "10,000 km global energy transmission",
-        "100 kW sustainable power generation per pyramid",
-        "Zero-point energy extraction capabilities",
-        "Instant quantum communication between sites",
-        "Anti-gravity propulsion possibilities",
-        "Directed energy weapon systems (defensive)",
-        "Teleportation prototype development",
-        "Time dilation field generation"
-    ]
-    
-    for i, benefit in enumerate(benefits, 1):
-        print(f"{i:2d}. {benefit}")
-    
-    print(f"\n🎯 Next Steps for Operation Prime Quark:")
-    next_steps = [
-        "UNESCO proposal submission with Tesla integration",
-        "Laboratory testing of Tesla coil-pyramid coupling",
-        "Scalar wave field mapping at pyramid sites",
-        "Wardenclyffe Tower prototype construction",
-        "Free energy device field testing",
-        "CIA technology reconstruction and validation",
-        "Global pyramid network synchronization",
-        "AI integration for grid management (Lilith.Eve/AthenaMist)",
-        "Community consultation and benefit sharing",
-        "Environmental impact assessment and monitoring"
-    ]
+    out.append("\n🔮 PNAP-Tesla Integration Benefits:")
+    out.extend(f"{i:2d}. {benefit}" for i, benefit in enumerate(_BENEFITS, 1))
     
-    for i, step in enumerate(next_steps, 1):
-        print(f"{i:2d}. {step}")
+    out.append("\n🎯 Next Steps for Operation Prime Quark:")
+    out.extend(f"{i:2d}. {step}" for i, step in enumerate(_NEXT_STEPS, 1))
     
-    print(f"\n🌟 Mission Status: Tesla Technology Successfully Integrated!")
-    print(f"Timestamp: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-    print(f"Operation Prime Quark: READY FOR DEPLOYMENT")
+    out.extend((
+        "\n🌟 Mission Status: Tesla Technology Successfully Integrated!",
+        f"Timestamp: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
+        "Operation Prime Quark: READY FOR DEPLOYMENT",
+    ))
+    sys.stdout.write("\n".join(out) + "\n")
 
 if __name__ == "__main__":
     main() 
@@ -1,6 +1,24 @@
 import numpy as np
+import pytest
 from datetime import datetime
 
+# Fixed touch timestamp; the tests never look at wall-clock time.
+_FIXED_TS = datetime(2024, 1, 1)
+
+# Shared read-only resonance pattern for the touch input
+_RESONANCE = np.array([0.1, 0.2, 0.3], dtype=np.float32)
+_RESONANCE.flags.writeable = False
+
+
+@pytest.fixture(scope="module")
+def frame_buffers():
+    """Seeded RNG plus thermal/base buffers reused across renders."""
+    return (
+        np.random.default_rng(0),
+        np.empty((12, 16), dtype=np.float32),
+        np.empty((48, 64, 3), dtype=np.float32),
+    )
+
 
 def test_infrared_display_creation_and_status():
     from infrared_nanoparticle_integration import (
@@ -43,12 +61,12 @@ def test_glasssphere_os_touch_processing():
 
     # Minimal touch input
     touch = TouchInputData(
-        timestamp=datetime.now(),
+        timestamp=_FIXED_TS,
         position=(0.2, 0.8),
         pressure=0.5,
         energy_level=0.75,
         frequency_signature=293.66,  # within third_eye range
-        resonance_pattern=np.array([0.1, 0.2, 0.3]),
+        resonance_pattern=_RESONANCE,
         chakra_activation={},
     )
     processed = os_system.process_touch_input(touch)
@@ -56,7 +74,7 @@ def test_glasssphere_os_touch_processing():
     assert 0.0 <= processed["energy_resonance"] <= 1.0
 
 
-def test_ui_shell_render_small_frame():
+def test_ui_shell_render_small_frame(frame_buffers):
     from glasssphere_ui_shell import (
         GlassSphereUIShell,
         UIMode,
@@ -69,12 +87,268 @@ def test_ui_shell_render_small_frame():
     ui.register_user_interface("user1", UIMode.NIGHT_VISION)
     ui.enable_night_vision_mode("disp1", "user1")
 
-    thermal = np.random.normal(300, 5, (12, 16))
+    rng, thermal, base = frame_buffers
+    rng.standard_normal(dtype=np.float32, out=thermal)
+    thermal *= 5
+    thermal += 300
     ui.create_ir_overlay("ov1", OverlayType.THERMAL_MAP, thermal, "disp1")
 
-    base = np.random.uniform(0, 1, (48, 64, 3))
+    rng.random(dtype=np.float32, out=base)
     frame = ui.render_display_frame("disp1", base)
 
     assert frame is not None
     assert frame.shape == base.shape
+    assert frame.dtype == np.float32
+
+
+@pytest.fixture(scope="module")
+def controller_module(tmp_path_factory):
+    """unified_master_controller imported with its log file in a temp dir."""
+    import os
+
+    cwd = os.getcwd()
+    os.chdir(tmp_path_factory.mktemp("controller"))
+    try:
+        import unified_master_controller
+    finally:
+        os.chdir(cwd)
+    return unified_master_controller
+
+
+def test_controller_report_and_node_round_trip_as_json(controller_module, tmp_path):
+    import asyncio
+    import json
+
+    controller = controller_module.GLASSPHERE_SolAscension_MasterController()
+    report = asyncio.run(controller.generate_integration_report())
+    node = controller.novasanctum_grid.add_solar_energy_node("node_json", "Lab", 5.0)
+
+    for name, record in (("report.json", report), ("node.json", node)):
+        path = tmp_path / name
+        controller.save_integration_report(record, str(path))
+        loaded = json.loads(path.read_text(encoding="utf-8"))
+        assert loaded.keys() == record.keys()
+
+    assert loaded["capacity"] == 5.0
+    assert loaded["status"] == "ACTIVE"
+
+
+@pytest.fixture
+def ucnp_engine():
+    """UCNP engine with a small 8x4 matrix and a four-row conversion history."""
+    from ucnp_translation_engine import UCNPTranslationEngine, UCNPType
+
+    engine = UCNPTranslationEngine(history_capacity=4)
+    engine.create_ucnp_matrix("m1", UCNPType.NaYF4_Yb_Er, (8, 4))
+    return engine, engine.ucnp_specs[UCNPType.NaYF4_Yb_Er]
+
+
+def _ir_frame(specs, shape=(4, 8)):
+    """Seeded per-pixel IR inputs around the excitation line; some pixels below threshold."""
+    rng = np.random.default_rng(1)
+    wavelengths = specs.excitation_wavelength + rng.uniform(-60.0, 60.0, shape)
+    intensities = rng.uniform(0.1, 1.0, shape)
+    power_densities = specs.power_density_threshold * rng.uniform(0.5, 3.0, shape)
+    return wavelengths, intensities, power_densities
+
+
+def test_ucnp_batch_and_frame_match_single_signal(ucnp_engine):
+    from ucnp_translation_engine import IRSignal, _rgb_to_u8
+
+    engine, specs = ucnp_engine
+    wavelengths, intensities, power_densities = _ir_frame(specs)
+
+    outputs = [
+        engine.upconvert_to_rgb(IRSignal(0.0, wl, inten, pd, (0.0, 0.0), _RESONANCE), "m1")
+        for wl, inten, pd in zip(wavelengths.ravel(), intensities.ravel(), power_densities.ravel())
+    ]
+    valid = np.array([out is not None for out in outputs])
+    assert valid.any() and not valid.all()
+
+    rgb, efficiency, out_intensity, batch_valid = engine.upconvert_batch(
+        "m1", wavelengths.ravel(), intensities.ravel(), power_densities.ravel())
+    np.testing.assert_array_equal(batch_valid, valid)
+    assert not rgb[~valid].any() and not efficiency[~valid].any()
+    single = [out for out in outputs if out is not None]
+    np.testing.assert_allclose(rgb[valid], [out.rgb_values for out in single], rtol=1e-9)
+    np.testing.assert_allclose(efficiency[valid], [out.conversion_efficiency for out in single], rtol=1e-9)
+    np.testing.assert_allclose(out_intensity[valid], [out.intensity for out in single], rtol=1e-9)
+
+    rgb_frame, eff_frame = engine.upconvert_frame("m1", wavelengths, intensities, power_densities)
+    assert rgb_frame.shape == (4, 8, 3) and eff_frame.shape == (4, 8)
+    np.testing.assert_array_equal(rgb_frame.reshape(-1, 3), _rgb_to_u8(rgb))
+    np.testing.assert_allclose(eff_frame.ravel(), efficiency.astype(np.float32), rtol=1e-6)
+    assert engine.upconvert_frame("m1", wavelengths.T, intensities.T, power_densities.T) is None
+
+
+def test_ucnp_history_keeps_newest_rows(ucnp_engine):
+    engine, specs = ucnp_engine
+    wavelengths = specs.excitation_wavelength + np.arange(6.0)
+    power_densities = np.full(6, specs.power_density_threshold * 2)
+
+    engine.upconvert_batch("m1", wavelengths[:3], np.ones(3), power_densities[:3])
+    engine.upconvert_batch("m1", wavelengths[3:], np.ones(3), power_densities[3:])
+    history = engine.conversion_history
+    assert [row["input_wavelength"] for row in history] == wavelengths[2:].tolist()
+    assert engine.generate_ucnp_report()["conversion_history_length"] == 4
+
+    # A batch longer than the buffer keeps only its tail
+    engine.upconvert_batch("m1", wavelengths[::-1], np.ones(6), power_densities)
+    assert [row["input_wavelength"] for row in engine.conversion_history] == wavelengths[3::-1].tolist()
+
+    engine.clear_conversion_history()
+    assert engine.conversion_history == []
+    assert engine.get_matrix_status("m1")["conversion_count"] == 12
+
+
+def test_ucnp_sensor_batch_shapes(ucnp_engine):
+    engine, _ = ucnp_engine
+    signals = engine.read_infrared_sensor_batch("m1", 5)
+
+    for key in ("timestamp", "wavelength_nm", "intensity", "power_density"):
+        assert signals[key].shape == (5,)
+    assert signals["spatial_coordinates"].shape == (5, 2)
+    assert signals["temporal_profile"].shape == (5, 100)
+    assert signals["temporal_profile"].dtype == np.float32
+    assert engine.read_infrared_sensor_batch("missing", 5) is None
+
+
+def test_quartz_touch_batch_matches_single_touches():
+    import asyncio
+    from quartz_touch_interface import QuartzTouchInterface, TouchInput, TouchType
+
+    interface = QuartzTouchInterface(history_capacity=4)
+    interface.create_touch_interface("single", (64, 64))
+    interface.create_touch_interface("batch", (64, 64))
+    touches = [
+        TouchInput(timestamp_ns=i, touch_type=TouchType.INTENT_BASED, position=(i / 6, 0.5),
+                   pressure=0.5, energy_level=energy, frequency_signature=frequency,
+                   intent_strength=intent, resonance_pattern=_RESONANCE, chakra_activation={})
+        for i, (energy, frequency, intent) in enumerate([
+            (0.9, 310.0, 0.95), (0.2, 100.0, 0.1), (0.8, 250.0, 0.9),
+            (0.95, 200.0, 0.85), (0.1, 500.0, 0.2), (0.85, 340.0, 0.9),
+        ])
+    ]
+
+    single = [interface.register_touch_input("single", touch) for touch in touches]
+    batch = interface.register_touch_batch("batch", touches)
+    assert any(signal is None for signal in single) and any(single)
+    for one, many in zip(single, batch):
+        assert (one is None) == (many is None)
+        if one is not None:
+            assert (many.intent_type, many.intent_level) == (one.intent_type, one.intent_level)
+            assert many.confidence == pytest.approx(one.confidence)
+
+    single_status = interface.get_interface_status("single")
+    batch_status = interface.get_interface_status("batch")
+    for key in ("touch_count", "intent_detections"):
+        assert batch_status[key] == single_status[key]
+    assert batch_status["average_confidence"] == pytest.approx(single_status["average_confidence"])
+
+    # Six batch touches into a four-row history keep the last four
+    history = interface.touch_history
+    assert [row["interface_id"] for row in history] == ["batch"] * 4
+    assert [row["position"][0] for row in history] == pytest.approx([i / 6 for i in range(2, 6)])
+
+    detected = [(signal, "batch") for signal in batch if signal is not None]
+    assert asyncio.run(interface.activate_many(detected + [(detected[0][0], "missing")])) == (
+        [True] * len(detected) + [False])
+
+
+def test_global_technology_lookup(controller_module):
+    network = controller_module.GlobalIntelligenceNetwork()
+
+    record = network.get_technology("chinese", "perovskite_solar_cells")
+    assert record["value"] == pytest.approx(0.471)
+    assert record["status"] == controller_module.Status.INTEGRATED
+    assert network.get_technology("chinese", "unknown") is None
+    assert network.get_technology("martian", "perovskite_solar_cells") is None
+
+
+def test_economic_impact_kernel():
+    from core.economics import aggregate_impact, impact_inputs
+
+    projections = {
+        "job_creation": {"a": 10.0, "b": 5.0, "total_jobs": 15.0},
+        "revenue_generation": {"a": 2.0, "b": 3.0, "total_revenue": 5.0},
+        "cost_savings": {"annual": 1.0, "ten_year": 9.0},
+        "investment_returns": {"a": 4.0, "b": 6.0, "total_investment": 10.0, "roi_timeline": 3.0},
+    }
+    inputs = impact_inputs(projections)
+    assert all(array.dtype == np.float64 and array.flags.c_contiguous for array in inputs)
+    assert aggregate_impact(*inputs) == pytest.approx((15.0, 5.0, 9.0, 10.0))
+
+
+def test_njit_falls_back_without_numba(monkeypatch):
+    import core.jit
+
+    monkeypatch.setattr(core.jit, "numba", None)
+
+    def kernel(x):
+        return x + 1
+
+    assert core.jit.njit(kernel) is kernel
+    assert core.jit.njit("float64(float64)", cache=True)(kernel) is kernel
+    assert core.jit.njit(cache=True, fastmath=True)(kernel) is kernel
+
+
+def test_fusion_batch_matches_single_runs():
+    from quantum_crystal_solar_fusion import QuantumCrystalSolarFusion
+
+    fusion = QuantumCrystalSolarFusion()
+    names = ["alpha", "beta", "gamma"]
+    for i, name in enumerate(names):
+        fusion.create_fusion_system(name, tesla_power=50_000.0 * (i + 1), solar_capacity=100_000.0 + i)
+
+    batch = fusion.run_fusion_systems_batch(names, steps=5)
+    assert len(fusion.performance_history) == 0
+    stability = batch["resonance_stability"]
+    assert stability.shape == (3, 5)
+    assert ((stability >= 0.95) & (stability <= 1.0)).all()
+
+    single = [fusion.run_fusion_system(name) for name in names]
+    for key in ("tesla_output", "solar_output", "crystal_amplification",
+                "quantum_enhancement", "total_fusion_output", "efficiency"):
+        assert batch[key].shape == (3,)
+        np.testing.assert_allclose(batch[key], [getattr(run, key) for run in single], rtol=1e-12)
+
+    with pytest.raises(ValueError):
+        fusion.run_fusion_systems_batch(["alpha", "missing"])
+
+
+@pytest.fixture
+def pnap_module():
+    """test_pnap_tesla with its memoized spec builders cleared before and after."""
+    import test_pnap_tesla
+
+    specs = (test_pnap_tesla._tesla_coil_spec, test_pnap_tesla._scalar_generator_spec,
+             test_pnap_tesla._wardenclyffe_tower_spec)
+    for spec in specs:
+        spec.cache_clear()
+    yield test_pnap_tesla
+    for spec in specs:
+        spec.cache_clear()
+
+
+@pytest.mark.parametrize("use_numba", [True, False])
+def test_pyramid_batch_matches_single_analysis(monkeypatch, pnap_module, use_numba):
+    if not use_numba:
+        # Run as on an install without Numba: NumPy batch path, plain Python kernels
+        monkeypatch.setattr(pnap_module, "NUMBA_AVAILABLE", False)
+        for kernel in ("_coil_kernel", "_scalar_kernel", "_tower_kernel"):
+            func = getattr(pnap_module, kernel)
+            monkeypatch.setattr(pnap_module, kernel, getattr(func, "py_func", func))
+
+    analyzer = pnap_module.SimplePyramidAnalyzer()
+    pyramids = [
+        {"name": "Great Pyramid", "primary_resonance_hz": 7.83},
+        {"name": "Bosnian Pyramid", "primary_resonance_hz": 28.3},
+        {"name": "Default Pyramid"},  # falls back to the Schumann base
+    ]
+
+    soa = analyzer.analyze_pyramids_batch(pyramids)
+    assert len(soa) == len(pyramids)
+    for i, pyramid in enumerate(pyramids):
+        assert soa[i] == analyzer.analyze_pyramid(pyramid)
 
+    assert len(analyzer.analyze_pyramids_batch([])) == 0
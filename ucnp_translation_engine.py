@@ -15,17 +15,82 @@ Date: December 2024
 Version: 1.0.0 - UCNP Translation Engine
 """
 
+import math
+import time
 import numpy as np
 import logging
-from typing import Dict, List, Tuple, Optional, Any
+from typing import Callable, Dict, List, Tuple, Optional, Any, Union
 from dataclasses import dataclass
 from enum import Enum
 import asyncio
 
+from core.jit import NUMBA_AVAILABLE, njit, prange
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Emission band edges (nm); np.digitize buckets 1-4 are blue, green, red, near-red
+_EMISSION_BAND_EDGES = np.array([400, 500, 600, 700, 800], dtype=np.float32)
+
+def _emission_band_weights(emission_spectrum: np.ndarray) -> Tuple[float, float, float]:
+    """Normalized (red, green, blue) weights of an emission spectrum"""
+    
+    # Count emission lines per color band with a single bincount over the
+    # digitized buckets (0 is below 400 nm and 5 is 800 nm and above)
+    counts = np.bincount(np.digitize(emission_spectrum, _EMISSION_BAND_EDGES),
+                         minlength=len(_EMISSION_BAND_EDGES) + 1).tolist()
+    blue_lines = counts[1]      # 400-500 nm
+    green_lines = counts[2]     # 500-600 nm
+    red_lines = counts[3]       # 600-700 nm
+    near_red_lines = counts[4]  # 700-800 nm
+    
+    red = 0.3 * red_lines + 0.2 * near_red_lines
+    green = 0.4 * green_lines + 0.1 * near_red_lines
+    blue = 0.3 * blue_lines
+    
+    # Spectra with no visible lines map to a neutral grey
+    total_weight = red + green + blue
+    if total_weight > 0:
+        return (red / total_weight, green / total_weight, blue / total_weight)
+    return (0.33, 0.33, 0.33)
+
+def _build_converter(specs: "UCNPSpecs") -> Callable[[float, float, float],
+                                                     Optional[Tuple[float, float, float, float, float]]]:
+    """
+    Specialize single-signal upconversion for one UCNP spec
+    
+    The spec's threshold, excitation wavelength, efficiency, quantum yield and
+    RGB weights are captured as closure cells so the per-signal call does no
+    attribute lookups.
+    
+    Returns:
+        Callable (intensity, wavelength_nm, power_density) ->
+        (red, green, blue, conversion efficiency, output intensity),
+        or None when the signal is below the power density threshold
+    """
+    
+    threshold = specs.power_density_threshold
+    excitation_wavelength = specs.excitation_wavelength
+    upconversion_efficiency = specs.upconversion_efficiency
+    quantum_yield = specs.quantum_yield
+    red_weight, green_weight, blue_weight = specs.rgb_weights
+    exp = math.exp
+    
+    def convert(intensity: float, wavelength_nm: float,
+                power_density: float) -> Optional[Tuple[float, float, float, float, float]]:
+        if power_density < threshold:
+            return None
+        # Wavelength match over a 100 nm bandwidth, always within (0, 1]
+        efficiency = upconversion_efficiency * exp(-abs(wavelength_nm - excitation_wavelength) / 100.0)
+        return (min(max(red_weight * intensity, 0.0), 1.0),
+                min(max(green_weight * intensity, 0.0), 1.0),
+                min(max(blue_weight * intensity, 0.0), 1.0),
+                efficiency,
+                intensity * efficiency * quantum_yield)
+    
+    return convert
+
 class UCNPType(Enum):
     """Types of upconversion nanoparticles"""
     NaYF4_Yb_Er = "NaYF4:Yb,Er"  # Green/red emission
@@ -45,19 +110,37 @@ class InfraredBand(Enum):
 @dataclass
 class UCNPSpecs:
     """Specifications for UCNP nanoparticles"""
+    # rgb_weights and converter are derived in __post_init__ and are slots
+    # rather than dataclass fields
+    __slots__ = ("ucnp_type", "core_material", "dopant_ions", "size_nm", "upconversion_efficiency",
+                 "excitation_wavelength", "emission_spectrum", "quantum_yield", "power_density_threshold",
+                 "rgb_weights", "converter")
+    
     ucnp_type: UCNPType
     core_material: str
     dopant_ions: List[str]
     size_nm: float
     upconversion_efficiency: float
     excitation_wavelength: float  # nm
-    emission_spectrum: List[float]  # nm wavelengths
+    emission_spectrum: np.ndarray  # nm wavelengths, read-only float32
     quantum_yield: float
     power_density_threshold: float  # W/cm²
+    
+    def __post_init__(self):
+        # Emission wavelengths as a frozen contiguous float32 array, their RGB
+        # weights (fixed per UCNP type, scaled linearly by signal intensity)
+        # and the specialized single-signal converter
+        self.emission_spectrum = np.ascontiguousarray(self.emission_spectrum, dtype=np.float32)
+        self.emission_spectrum.setflags(write=False)
+        self.rgb_weights = _emission_band_weights(self.emission_spectrum)
+        self.converter = _build_converter(self)
 
 @dataclass
 class IRSignal:
     """Infrared signal data structure"""
+    __slots__ = ("timestamp", "wavelength_nm", "intensity", "power_density",
+                 "spatial_coordinates", "temporal_profile")
+    
     timestamp: float
     wavelength_nm: float
     intensity: float
@@ -68,12 +151,156 @@ class IRSignal:
 @dataclass
 class VisibleOutput:
     """Visible light output from UCNP conversion"""
+    __slots__ = ("timestamp", "rgb_values", "intensity", "spatial_coordinates",
+                 "conversion_efficiency", "quantum_yield")
+    
     timestamp: float
     rgb_values: Tuple[float, float, float]  # R, G, B (0-1)
     intensity: float
     spatial_coordinates: Tuple[float, float]
     conversion_efficiency: float
     quantum_yield: float
+    
+    @property
+    def rgb_u8(self) -> np.ndarray:
+        """RGB values as 8-bit display levels, shape (3,) uint8"""
+        return _rgb_to_u8(self.rgb_values)
+
+def _rgb_to_u8(rgb: Any) -> np.ndarray:
+    """Quantize 0-1 RGB values to 8-bit display levels (rounded to nearest)"""
+    return np.rint(np.multiply(rgb, 255.0)).astype(np.uint8)
+
+@dataclass
+class MatrixState:
+    """State and running statistics of an active UCNP matrix"""
+    # rgb_buffer and eff_buffer are per-frame output buffers allocated in
+    # __post_init__ and are slots rather than dataclass fields
+    __slots__ = ("matrix_id", "ucnp_type", "specs", "resolution", "particle_density",
+                 "active", "conversion_count", "total_efficiency", "rgb_buffer", "eff_buffer")
+    
+    matrix_id: str
+    ucnp_type: UCNPType
+    specs: UCNPSpecs
+    resolution: Tuple[int, int]
+    particle_density: float  # particles/cm²
+    active: bool
+    conversion_count: int
+    total_efficiency: float  # running average conversion efficiency
+    
+    def __post_init__(self):
+        # Frame outputs written in place by upconvert_frame: 8-bit RGB levels
+        # and per-pixel conversion efficiency, both (height, width)-shaped
+        width, height = self.resolution
+        self.rgb_buffer = np.empty((height, width, 3), dtype=np.uint8)
+        self.eff_buffer = np.empty((height, width), dtype=np.float32)
+
+# Row layout of the conversion history ring buffer; RGB is stored as 8-bit
+# display levels and efficiency as float16
+_CONVERSION_HISTORY_DTYPE = np.dtype([
+    ("ts", "f8"), ("matrix", "i4"), ("wavelength", "f8"),
+    ("rgb", "u1", (3,)), ("eff", "f2"),
+])
+
+@njit(cache=True, fastmath=True, parallel=True)
+def _batch_upconvert_kernel(wavelengths: np.ndarray,
+                            intensities: np.ndarray,
+                            power_densities: np.ndarray,
+                            excitation_wavelength: float,
+                            upconversion_efficiency: float,
+                            quantum_yield: float,
+                            power_density_threshold: float,
+                            red_weight: float,
+                            green_weight: float,
+                            blue_weight: float,
+                            out_rgb: np.ndarray,
+                            out_efficiency: np.ndarray,
+                            out_intensity: np.ndarray,
+                            out_valid: np.ndarray) -> None:
+    """
+    Upconvert N IR signals in parallel, fusing the threshold filter, wavelength
+    match, efficiency, output intensity and RGB clip into one pass per signal
+    """
+    for i in prange(wavelengths.shape[0]):
+        if power_densities[i] < power_density_threshold:
+            out_valid[i] = False
+            out_efficiency[i] = 0.0
+            out_intensity[i] = 0.0
+            out_rgb[i, 0] = 0.0
+            out_rgb[i, 1] = 0.0
+            out_rgb[i, 2] = 0.0
+            continue
+        match = math.exp(-abs(wavelengths[i] - excitation_wavelength) / 100.0)
+        efficiency = upconversion_efficiency * match
+        intensity = intensities[i]
+        out_valid[i] = True
+        out_efficiency[i] = efficiency
+        out_intensity[i] = intensity * efficiency * quantum_yield
+        out_rgb[i, 0] = min(max(red_weight * intensity, 0.0), 1.0)
+        out_rgb[i, 1] = min(max(green_weight * intensity, 0.0), 1.0)
+        out_rgb[i, 2] = min(max(blue_weight * intensity, 0.0), 1.0)
+
+
+@njit(cache=True, fastmath=True, parallel=True)
+def _frame_upconvert_kernel(wavelengths: np.ndarray,
+                            intensities: np.ndarray,
+                            power_densities: np.ndarray,
+                            excitation_wavelength: float,
+                            upconversion_efficiency: float,
+                            power_density_threshold: float,
+                            red_weight: float,
+                            green_weight: float,
+                            blue_weight: float,
+                            out_rgb: np.ndarray,
+                            out_efficiency: np.ndarray) -> Tuple[float, float]:
+    """
+    Upconvert a flattened frame into preallocated 8-bit RGB and float32
+    efficiency buffers; pixels below threshold are written black with zero
+    efficiency. Returns (converted pixel count, efficiency sum).
+    """
+    converted = 0.0
+    efficiency_sum = 0.0
+    for i in prange(wavelengths.shape[0]):
+        if power_densities[i] < power_density_threshold:
+            out_efficiency[i] = 0.0
+            out_rgb[i, 0] = 0
+            out_rgb[i, 1] = 0
+            out_rgb[i, 2] = 0
+            continue
+        efficiency = upconversion_efficiency * math.exp(-abs(wavelengths[i] - excitation_wavelength) / 100.0)
+        intensity = intensities[i]
+        out_efficiency[i] = efficiency
+        out_rgb[i, 0] = round(min(max(red_weight * intensity, 0.0), 1.0) * 255.0)
+        out_rgb[i, 1] = round(min(max(green_weight * intensity, 0.0), 1.0) * 255.0)
+        out_rgb[i, 2] = round(min(max(blue_weight * intensity, 0.0), 1.0) * 255.0)
+        converted += 1.0
+        efficiency_sum += efficiency
+    return converted, efficiency_sum
+
+def _batch_upconvert_numpy(wavelengths: np.ndarray,
+                           intensities: np.ndarray,
+                           power_densities: np.ndarray,
+                           excitation_wavelength: float,
+                           upconversion_efficiency: float,
+                           quantum_yield: float,
+                           power_density_threshold: float,
+                           red_weight: float,
+                           green_weight: float,
+                           blue_weight: float,
+                           out_rgb: np.ndarray,
+                           out_efficiency: np.ndarray,
+                           out_intensity: np.ndarray,
+                           out_valid: np.ndarray) -> None:
+    """NumPy fallback for ``_batch_upconvert_kernel``"""
+    np.greater_equal(power_densities, power_density_threshold, out=out_valid)
+    np.multiply(np.exp(-np.abs(wavelengths - excitation_wavelength) / 100.0),
+                upconversion_efficiency, out=out_efficiency)
+    np.multiply(intensities * out_efficiency, quantum_yield, out=out_intensity)
+    np.multiply(intensities[:, None], (red_weight, green_weight, blue_weight), out=out_rgb)
+    np.clip(out_rgb, 0.0, 1.0, out=out_rgb)
+    invalid = ~out_valid
+    out_efficiency[invalid] = 0.0
+    out_intensity[invalid] = 0.0
+    out_rgb[invalid] = 0.0
 
 class UCNPTranslationEngine:
     """
@@ -84,8 +311,13 @@ class UCNPTranslationEngine:
     through passive upconversion processes.
     """
     
-    def __init__(self):
-        """Initialize the UCNP translation engine"""
+    def __init__(self, history_capacity: int = 1 << 20):
+        """
+        Initialize the UCNP translation engine
+        
+        Args:
+            history_capacity: Number of conversion records retained
+        """
         self.logger = logging.getLogger(__name__)
         
         # Fundamental constants
@@ -98,8 +330,26 @@ class UCNPTranslationEngine:
         # Active UCNP matrices
         self.active_matrices = {}
         
-        # Conversion history
-        self.conversion_history = []
+        # Running report totals: conversions, and the sum and count of the
+        # average efficiencies of matrices that have converted at least once
+        self._total_conversions = 0
+        self._matrix_efficiency_sum = 0.0
+        self._matrices_with_conversions = 0
+        
+        # Conversion history (ring buffer, oldest rows overwritten)
+        self._history_capacity = history_capacity
+        self._conv_hist = np.zeros(history_capacity, dtype=_CONVERSION_HISTORY_DTYPE)
+        self._conv_head = 0
+        
+        # Integer matrix handles (also the matrix codes in the history buffer)
+        self._matrix_id_to_handle = {}
+        self._matrix_ids = []
+        self._matrix_states = []
+        
+        # Random generator for simulated sensor readings and the decay
+        # envelope exp(-t/20) of the simulated 100-sample temporal profile
+        self._rng = np.random.default_rng()
+        self._decay_template = np.exp(-np.arange(100, dtype=np.float32) / np.float32(20.0))
         
         self.logger.info("UCNP Translation Engine initialized")
     
@@ -114,7 +364,7 @@ class UCNPTranslationEngine:
                 size_nm=25.0,
                 upconversion_efficiency=0.85,
                 excitation_wavelength=980.0,
-                emission_spectrum=[520, 540, 655],  # Green and red
+                emission_spectrum=np.array([520, 540, 655], dtype=np.float32),  # Green and red
                 quantum_yield=0.75,
                 power_density_threshold=1e-3  # W/cm²
             ),
@@ -126,7 +376,7 @@ class UCNPTranslationEngine:
                 size_nm=30.0,
                 upconversion_efficiency=0.80,
                 excitation_wavelength=980.0,
-                emission_spectrum=[450, 475, 800],  # Blue and NIR
+                emission_spectrum=np.array([450, 475, 800], dtype=np.float32),  # Blue and NIR
                 quantum_yield=0.70,
                 power_density_threshold=2e-3  # W/cm²
             ),
@@ -138,7 +388,7 @@ class UCNPTranslationEngine:
                 size_nm=28.0,
                 upconversion_efficiency=0.75,
                 excitation_wavelength=808.0,
-                emission_spectrum=[1060, 1340],  # NIR emissions
+                emission_spectrum=np.array([1060, 1340], dtype=np.float32),  # NIR emissions
                 quantum_yield=0.65,
                 power_density_threshold=1.5e-3  # W/cm²
             ),
@@ -150,7 +400,7 @@ class UCNPTranslationEngine:
                 size_nm=35.0,
                 upconversion_efficiency=0.92,
                 excitation_wavelength=980.0,
-                emission_spectrum=[520, 540, 655, 800],  # Enhanced spectrum
+                emission_spectrum=np.array([520, 540, 655, 800], dtype=np.float32),  # Enhanced spectrum
                 quantum_yield=0.85,
                 power_density_threshold=8e-4  # W/cm²
             ),
@@ -162,7 +412,7 @@ class UCNPTranslationEngine:
                 size_nm=40.0,
                 upconversion_efficiency=0.95,
                 excitation_wavelength=980.0,
-                emission_spectrum=[400, 520, 540, 655, 800, 980],  # Full spectrum
+                emission_spectrum=np.array([400, 520, 540, 655, 800, 980], dtype=np.float32),  # Full spectrum
                 quantum_yield=0.90,
                 power_density_threshold=5e-4  # W/cm²
             )
@@ -194,59 +444,73 @@ class UCNPTranslationEngine:
         
         specs = self.ucnp_specs[ucnp_type]
         
-        matrix_config = {
-            "matrix_id": matrix_id,
-            "ucnp_type": ucnp_type,
-            "specs": specs,
-            "resolution": resolution,
-            "particle_density": particle_density,
-            "active": True,
-            "conversion_count": 0,
-            "total_efficiency": 0.0
-        }
+        matrix_state = MatrixState(
+            matrix_id=matrix_id,
+            ucnp_type=ucnp_type,
+            specs=specs,
+            resolution=resolution,
+            particle_density=particle_density,
+            active=True,
+            conversion_count=0,
+            total_efficiency=0.0
+        )
         
-        self.active_matrices[matrix_id] = matrix_config
+        previous = self.active_matrices.get(matrix_id)
+        if previous is not None and previous.conversion_count:
+            # Replacing a matrix drops its statistics from the report totals
+            self._total_conversions -= previous.conversion_count
+            self._matrix_efficiency_sum -= previous.total_efficiency
+            self._matrices_with_conversions -= 1
+        
+        self.active_matrices[matrix_id] = matrix_state
+        handle = self._matrix_id_to_handle.get(matrix_id)
+        if handle is None:
+            self._matrix_id_to_handle[matrix_id] = len(self._matrix_ids)
+            self._matrix_ids.append(matrix_id)
+            self._matrix_states.append(matrix_state)
+        else:
+            self._matrix_states[handle] = matrix_state
         self.logger.info(f"UCNP matrix created: {matrix_id} ({ucnp_type.value})")
         
         return True
     
-    def read_infrared_sensor(self, matrix_id: str) -> Optional[IRSignal]:
+    def read_infrared_sensor(self, matrix_id: Union[str, int]) -> Optional[IRSignal]:
         """
         Read infrared signal from UCNP matrix
         
         Args:
-            matrix_id: Matrix identifier
+            matrix_id: Matrix identifier or handle
             
         Returns:
             IRSignal object or None if error
         """
         
-        if matrix_id not in self.active_matrices:
-            self.logger.error(f"Matrix not found: {matrix_id}")
+        handle = self._resolve_matrix(matrix_id)
+        if handle is None:
             return None
         
-        matrix = self.active_matrices[matrix_id]
-        specs = matrix["specs"]
+        specs = self._matrix_states[handle].specs
         
         # Simulate infrared signal detection
         # In real implementation, this would read from actual IR sensors
         
         # Generate simulated IR signal
-        wavelength = specs.excitation_wavelength + np.random.normal(0, 50)  # nm
-        intensity = np.random.uniform(0.1, 1.0)
+        rng = self._rng
+        wavelength = specs.excitation_wavelength + rng.normal(0, 50)  # nm
+        intensity = rng.uniform(0.1, 1.0)
         power_density = intensity * specs.power_density_threshold
         
         # Spatial coordinates (normalized 0-1)
-        x = np.random.uniform(0, 1)
-        y = np.random.uniform(0, 1)
+        x = rng.uniform(0, 1)
+        y = rng.uniform(0, 1)
         
-        # Temporal profile (simulated time series)
-        time_points = 100
-        temporal_profile = np.random.normal(0, 0.1, time_points)
-        temporal_profile += intensity * np.exp(-np.arange(time_points) / 20)
+        # Temporal profile (simulated time series, float32)
+        temporal_profile = rng.standard_normal(self._decay_template.shape[0], dtype=np.float32)
+        temporal_profile *= 0.1
+        temporal_profile += intensity * self._decay_template
         
         ir_signal = IRSignal(
-            timestamp=asyncio.get_event_loop().time(),
+            timestamp=time.monotonic(),
             wavelength_nm=wavelength,
             intensity=intensity,
             power_density=power_density,
@@ -256,44 +520,72 @@ class UCNPTranslationEngine:
         
         return ir_signal
     
-    def upconvert_to_rgb(self, ir_signal: IRSignal, matrix_id: str) -> Optional[VisibleOutput]:
+    def read_infrared_sensor_batch(self, matrix_id: Union[str, int], n: int) -> Optional[Dict[str, np.ndarray]]:
+        """
+        Read ``n`` infrared signals from a UCNP matrix in one call
+        
+        Args:
+            matrix_id: Matrix identifier or handle
+            n: Number of signals to read
+            
+        Returns:
+            Dict of per-signal arrays keyed like the ``IRSignal`` fields
+            (``spatial_coordinates`` has shape (n, 2) and ``temporal_profile``
+            is float32 with shape (n, 100)), or None if error
+        """
+        
+        handle = self._resolve_matrix(matrix_id)
+        if handle is None:
+            return None
+        
+        specs = self._matrix_states[handle].specs
+        rng = self._rng
+        
+        # Draw every simulated field for all signals at once
+        wavelengths = rng.normal(specs.excitation_wavelength, 50, n)  # nm
+        intensities = rng.uniform(0.1, 1.0, n)
+        temporal_profiles = rng.standard_normal((n, self._decay_template.shape[0]), dtype=np.float32)
+        temporal_profiles *= 0.1
+        temporal_profiles += intensities[:, None].astype(np.float32) * self._decay_template
+        
+        return {
+            "timestamp": np.full(n, time.monotonic()),
+            "wavelength_nm": wavelengths,
+            "intensity": intensities,
+            "power_density": intensities * specs.power_density_threshold,
+            "spatial_coordinates": rng.random((n, 2)),
+            "temporal_profile": temporal_profiles
+        }
+    
+    def upconvert_to_rgb(self, ir_signal: IRSignal, matrix_id: Union[str, int]) -> Optional[VisibleOutput]:
         """
         Convert infrared signal to visible RGB output
         
         Args:
             ir_signal: Infrared signal data
-            matrix_id: Matrix identifier
+            matrix_id: Matrix identifier or handle
             
         Returns:
             VisibleOutput object or None if error
         """
         
-        if matrix_id not in self.active_matrices:
-            self.logger.error(f"Matrix not found: {matrix_id}")
+        handle = self._resolve_matrix(matrix_id)
+        if handle is None:
             return None
         
-        matrix = self.active_matrices[matrix_id]
-        specs = matrix["specs"]
+        matrix = self._matrix_states[handle]
+        specs = matrix.specs
         
-        # Check if signal meets power density threshold
-        if ir_signal.power_density < specs.power_density_threshold:
-            self.logger.warning(f"Signal below threshold: {ir_signal.power_density:.2e} W/cm²")
+        # Threshold check, wavelength-matched efficiency, RGB and output
+        # intensity in one call specialized for this UCNP type
+        converted = specs.converter(ir_signal.intensity, ir_signal.wavelength_nm, ir_signal.power_density)
+        if converted is None:
+            if self.logger.isEnabledFor(logging.WARNING):
+                self.logger.warning("Signal below threshold: %.2e W/cm²", ir_signal.power_density)
             return None
         
-        # Calculate conversion efficiency based on wavelength match
-        wavelength_match = self._calculate_wavelength_match(
-            ir_signal.wavelength_nm, specs.excitation_wavelength
-        )
-        
-        # Apply UCNP efficiency and quantum yield
-        conversion_efficiency = specs.upconversion_efficiency * wavelength_match
-        quantum_yield = specs.quantum_yield
-        
-        # Convert to RGB based on emission spectrum
-        rgb_values = self._emission_spectrum_to_rgb(specs.emission_spectrum, ir_signal.intensity)
-        
-        # Calculate output intensity
-        output_intensity = ir_signal.intensity * conversion_efficiency * quantum_yield
+        red, green, blue, conversion_efficiency, output_intensity = converted
+        rgb_values = (red, green, blue)
         
         visible_output = VisibleOutput(
             timestamp=ir_signal.timestamp,
@@ -301,99 +593,256 @@ class UCNPTranslationEngine:
             intensity=output_intensity,
             spatial_coordinates=ir_signal.spatial_coordinates,
             conversion_efficiency=conversion_efficiency,
-            quantum_yield=quantum_yield
+            quantum_yield=specs.quantum_yield
         )
         
         # Update matrix statistics
-        matrix["conversion_count"] += 1
-        matrix["total_efficiency"] = (
-            (matrix["total_efficiency"] * (matrix["conversion_count"] - 1) + conversion_efficiency) /
-            matrix["conversion_count"]
-        )
+        self._record_conversions(matrix, 1, conversion_efficiency)
         
         # Log conversion
-        self.conversion_history.append({
-            "timestamp": ir_signal.timestamp,
-            "matrix_id": matrix_id,
-            "input_wavelength": ir_signal.wavelength_nm,
-            "output_rgb": rgb_values,
-            "efficiency": conversion_efficiency
-        })
+        self._conv_hist[self._conv_head % self._history_capacity] = (
+            ir_signal.timestamp, handle, ir_signal.wavelength_nm,
+            _rgb_to_u8(rgb_values), conversion_efficiency
+        )
+        self._conv_head += 1
         
         return visible_output
     
-    def _calculate_wavelength_match(self, signal_wavelength: float, 
-                                  excitation_wavelength: float) -> float:
-        """Calculate wavelength matching efficiency"""
+    def upconvert_batch(self,
+                        matrix_id: Union[str, int],
+                        wavelengths: np.ndarray,
+                        intensities: np.ndarray,
+                        power_densities: np.ndarray
+                        ) -> Optional[Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]]:
+        """
+        Convert a batch of infrared signals to visible RGB output
         
-        wavelength_diff = abs(signal_wavelength - excitation_wavelength)
-        match_efficiency = np.exp(-wavelength_diff / 100)  # 100nm bandwidth
+        Args:
+            matrix_id: Matrix identifier or handle
+            wavelengths: Signal wavelengths (nm), shape (N,)
+            intensities: Signal intensities, shape (N,)
+            power_densities: Signal power densities (W/cm²), shape (N,)
+            
+        Returns:
+            Tuple of (rgb (N, 3), conversion efficiency (N,), output
+            intensity (N,), valid mask (N,)) or None if error. Signals below
+            the power density threshold are marked invalid and have zero RGB,
+            efficiency and intensity.
+        """
+        
+        handle = self._resolve_matrix(matrix_id)
+        if handle is None:
+            return None
         
-        return max(0.0, min(1.0, match_efficiency))
+        matrix = self._matrix_states[handle]
+        specs = matrix.specs
+        
+        wavelengths = np.ascontiguousarray(wavelengths, dtype=np.float64)
+        intensities = np.ascontiguousarray(intensities, dtype=np.float64)
+        power_densities = np.ascontiguousarray(power_densities, dtype=np.float64)
+        n = wavelengths.shape[0]
+        
+        rgb = np.empty((n, 3))
+        efficiency = np.empty(n)
+        output_intensity = np.empty(n)
+        valid = np.empty(n, dtype=np.bool_)
+        red_weight, green_weight, blue_weight = specs.rgb_weights
+        batch_upconvert = _batch_upconvert_kernel if NUMBA_AVAILABLE else _batch_upconvert_numpy
+        batch_upconvert(wavelengths, intensities, power_densities,
+                        float(specs.excitation_wavelength), float(specs.upconversion_efficiency),
+                        float(specs.quantum_yield), float(specs.power_density_threshold),
+                        red_weight, green_weight, blue_weight,
+                        rgb, efficiency, output_intensity, valid)
+        
+        # Update matrix statistics with the converted signals
+        converted = int(np.count_nonzero(valid))
+        if converted:
+            self._record_conversions(matrix, converted, float(efficiency[valid].sum()))
+            
+            # Log conversions
+            rows = np.empty(converted, dtype=_CONVERSION_HISTORY_DTYPE)
+            rows["ts"] = time.monotonic()
+            rows["matrix"] = handle
+            rows["wavelength"] = wavelengths[valid]
+            rows["rgb"] = _rgb_to_u8(rgb[valid])
+            rows["eff"] = efficiency[valid]
+            self._conv_head = self._append_rows(self._conv_hist, self._conv_head, rows)
+        
+        return rgb, efficiency, output_intensity, valid
+    
+    def _record_conversions(self, matrix: MatrixState, count: int, efficiency_sum: float) -> None:
+        """Fold ``count`` conversions into a matrix's statistics and the report totals"""
+        
+        previous = matrix.conversion_count
+        previous_average = matrix.total_efficiency
+        matrix.conversion_count = previous + count
+        # Incremental (Welford-style) mean update; no rescaling by the old count
+        matrix.total_efficiency += (efficiency_sum - count * previous_average) / matrix.conversion_count
+        
+        self._total_conversions += count
+        self._matrix_efficiency_sum += matrix.total_efficiency
+        if previous:
+            self._matrix_efficiency_sum -= previous_average
+        else:
+            self._matrices_with_conversions += 1
     
-    def _emission_spectrum_to_rgb(self, emission_spectrum: List[float], 
-                                intensity: float) -> Tuple[float, float, float]:
-        """Convert emission spectrum to RGB values"""
+    def _append_rows(self, buffer: np.ndarray, head: int, rows: np.ndarray) -> int:
+        """Write rows into a ring buffer and return the new head"""
+        
+        capacity = self._history_capacity
+        if rows.shape[0] > capacity:
+            head += rows.shape[0] - capacity
+            rows = rows[-capacity:]
+        buffer[(head + np.arange(rows.shape[0])) % capacity] = rows
+        return head + rows.shape[0]
+    
+    def upconvert_frame(self,
+                        matrix_id: Union[str, int],
+                        wavelengths: np.ndarray,
+                        intensities: np.ndarray,
+                        power_densities: np.ndarray) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+        """
+        Convert a full frame of infrared signals into the matrix's frame buffers
         
-        # Define color mapping for emission wavelengths
-        color_weights = {
-            "red": 0.0,
-            "green": 0.0,
-            "blue": 0.0
-        }
+        Args:
+            matrix_id: Matrix identifier or handle
+            wavelengths: Per-pixel wavelengths (nm), shape (height, width)
+            intensities: Per-pixel intensities, shape (height, width)
+            power_densities: Per-pixel power densities (W/cm²), shape (height, width)
+            
+        Returns:
+            The matrix's (rgb_buffer (height, width, 3) uint8, eff_buffer
+            (height, width) float32), overwritten in place on every call, or
+            None if error. Pixels below the power density threshold are black
+            with zero efficiency. Frames update the matrix statistics but are
+            not logged to the conversion history.
+        """
         
-        for wavelength in emission_spectrum:
-            if 400 <= wavelength < 500:  # Blue
-                color_weights["blue"] += 0.3
-            elif 500 <= wavelength < 600:  # Green
-                color_weights["green"] += 0.4
-            elif 600 <= wavelength < 700:  # Red
-                color_weights["red"] += 0.3
-            elif 700 <= wavelength < 800:  # Near-red
-                color_weights["red"] += 0.2
-                color_weights["green"] += 0.1
-        
-        # Normalize and apply intensity
-        total_weight = sum(color_weights.values())
-        if total_weight > 0:
-            rgb_values = (
-                color_weights["red"] / total_weight * intensity,
-                color_weights["green"] / total_weight * intensity,
-                color_weights["blue"] / total_weight * intensity
-            )
+        handle = self._resolve_matrix(matrix_id)
+        if handle is None:
+            return None
+        
+        matrix = self._matrix_states[handle]
+        specs = matrix.specs
+        rgb_buffer = matrix.rgb_buffer
+        eff_buffer = matrix.eff_buffer
+        frame_shape = eff_buffer.shape
+        
+        if not (np.shape(wavelengths) == np.shape(intensities) == np.shape(power_densities) == frame_shape):
+            self.logger.error("Frame shape does not match matrix %s resolution %s",
+                              matrix.matrix_id, matrix.resolution)
+            return None
+        
+        wavelengths = np.ascontiguousarray(wavelengths, dtype=np.float64).reshape(-1)
+        intensities = np.ascontiguousarray(intensities, dtype=np.float64).reshape(-1)
+        power_densities = np.ascontiguousarray(power_densities, dtype=np.float64).reshape(-1)
+        rgb_flat = rgb_buffer.reshape(-1, 3)
+        eff_flat = eff_buffer.reshape(-1)
+        red_weight, green_weight, blue_weight = specs.rgb_weights
+        
+        if NUMBA_AVAILABLE:
+            converted, efficiency_sum = _frame_upconvert_kernel(
+                wavelengths, intensities, power_densities,
+                float(specs.excitation_wavelength), float(specs.upconversion_efficiency),
+                float(specs.power_density_threshold), red_weight, green_weight, blue_weight,
+                rgb_flat, eff_flat)
+        else:
+            n = wavelengths.shape[0]
+            rgb = np.empty((n, 3))
+            efficiency = np.empty(n)
+            valid = np.empty(n, dtype=np.bool_)
+            _batch_upconvert_numpy(wavelengths, intensities, power_densities,
+                                   float(specs.excitation_wavelength), float(specs.upconversion_efficiency),
+                                   float(specs.quantum_yield), float(specs.power_density_threshold),
+                                   red_weight, green_weight, blue_weight,
+                                   rgb, efficiency, np.empty(n), valid)
+            rgb_flat[...] = _rgb_to_u8(rgb)
+            eff_flat[...] = efficiency
+            converted, efficiency_sum = np.count_nonzero(valid), efficiency.sum()
+        
+        if converted:
+            self._record_conversions(matrix, int(converted), float(efficiency_sum))
+        
+        return rgb_buffer, eff_buffer
+    
+    def get_matrix_handle(self, matrix_id: str) -> Optional[int]:
+        """
+        Get the integer handle of a UCNP matrix
+        
+        Handles are stable for the life of the engine (re-creating a matrix id
+        keeps its handle) and can be passed instead of the matrix id to the
+        sensor, conversion and render methods to skip the id lookup.
+        """
+        return self._matrix_id_to_handle.get(matrix_id)
+    
+    def _resolve_matrix(self, matrix: Union[str, int]) -> Optional[int]:
+        """Resolve a matrix id or handle to a handle, logging unknown matrices"""
+        
+        if isinstance(matrix, int):
+            if 0 <= matrix < len(self._matrix_states):
+                return matrix
         else:
-            rgb_values = (intensity * 0.33, intensity * 0.33, intensity * 0.33)
+            handle = self._matrix_id_to_handle.get(matrix)
+            if handle is not None:
+                return handle
+        self.logger.error("Matrix not found: %s", matrix)
+        return None
+    
+    def _ordered_rows(self, buffer: np.ndarray, head: int) -> np.ndarray:
+        """Return the retained rows of a ring buffer, oldest first"""
+        
+        capacity = self._history_capacity
+        if head <= capacity:
+            return buffer[:head]
+        start = head % capacity
+        return np.concatenate((buffer[start:], buffer[:start]))
+    
+    @property
+    def conversion_history(self) -> List[Dict[str, Any]]:
+        """
+        Retained conversion records as a list of dicts, oldest first
         
-        # Ensure values are in 0-1 range
-        rgb_values = tuple(max(0.0, min(1.0, val)) for val in rgb_values)
+        RGB comes back at 8-bit (1/255) resolution and efficiency at float16
+        precision, as stored.
+        """
+        
+        return [{
+            "timestamp": float(row["ts"]),
+            "matrix_id": self._matrix_ids[row["matrix"]],
+            "input_wavelength": float(row["wavelength"]),
+            "output_rgb": tuple(level / 255.0 for level in row["rgb"].tolist()),
+            "efficiency": float(row["eff"])
+        } for row in self._ordered_rows(self._conv_hist, self._conv_head)]
+    
+    def clear_conversion_history(self) -> None:
+        """Drop all retained conversion records in O(1); matrix statistics are kept"""
         
-        return rgb_values
+        # Rows past the head are never read, so rewinding it is enough
+        self._conv_head = 0
     
     def render_to_display(self, visible_output: VisibleOutput, 
-                         matrix_id: str) -> bool:
+                         matrix_id: Union[str, int]) -> bool:
         """
         Render visible output to display
         
         Args:
             visible_output: Visible light output
-            matrix_id: Matrix identifier
+            matrix_id: Matrix identifier or handle
             
         Returns:
             True if render successful
         """
         
-        if matrix_id not in self.active_matrices:
-            self.logger.error(f"Matrix not found: {matrix_id}")
+        if self._resolve_matrix(matrix_id) is None:
             return False
         
-        matrix = self.active_matrices[matrix_id]
-        
         # In real implementation, this would send data to display hardware
         # For now, we log the render operation
         
-        self.logger.info(f"Rendering to display: RGB{visible_output.rgb_values} "
-                        f"at {visible_output.spatial_coordinates} "
-                        f"(efficiency: {visible_output.conversion_efficiency:.3f})")
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info("Rendering to display: RGB%s at %s (efficiency: %.3f)",
+                             visible_output.rgb_values, visible_output.spatial_coordinates,
+                             visible_output.conversion_efficiency)
         
         return True
     
@@ -407,17 +856,17 @@ class UCNPTranslationEngine:
         
         status = {
             "matrix_id": matrix_id,
-            "ucnp_type": matrix["ucnp_type"].value,
-            "resolution": matrix["resolution"],
-            "particle_density": matrix["particle_density"],
-            "active": matrix["active"],
-            "conversion_count": matrix["conversion_count"],
-            "average_efficiency": matrix["total_efficiency"],
+            "ucnp_type": matrix.ucnp_type.value,
+            "resolution": matrix.resolution,
+            "particle_density": matrix.particle_density,
+            "active": matrix.active,
+            "conversion_count": matrix.conversion_count,
+            "average_efficiency": matrix.total_efficiency,
             "specs": {
-                "upconversion_efficiency": matrix["specs"].upconversion_efficiency,
-                "quantum_yield": matrix["specs"].quantum_yield,
-                "excitation_wavelength": matrix["specs"].excitation_wavelength,
-                "emission_spectrum": matrix["specs"].emission_spectrum
+                "upconversion_efficiency": matrix.specs.upconversion_efficiency,
+                "quantum_yield": matrix.specs.quantum_yield,
+                "excitation_wavelength": matrix.specs.excitation_wavelength,
+                "emission_spectrum": matrix.specs.emission_spectrum.tolist()
             }
         }
         
@@ -436,15 +885,12 @@ class UCNPTranslationEngine:
         """Generate comprehensive UCNP translation report"""
         
         total_matrices = len(self.active_matrices)
-        total_conversions = sum(matrix["conversion_count"] 
-                              for matrix in self.active_matrices.values())
+        total_conversions = self._total_conversions
         
+        # Mean of the per-matrix average efficiencies
         avg_efficiency = 0
-        if total_conversions > 0:
-            efficiencies = [matrix["total_efficiency"] 
-                          for matrix in self.active_matrices.values()
-                          if matrix["conversion_count"] > 0]
-            avg_efficiency = np.mean(efficiencies) if efficiencies else 0
+        if self._matrices_with_conversions:
+            avg_efficiency = self._matrix_efficiency_sum / self._matrices_with_conversions
         
         report = {
             "engine_name": "UCNP Translation Engine",
@@ -453,7 +899,7 @@ class UCNPTranslationEngine:
             "total_conversions": total_conversions,
             "average_efficiency": avg_efficiency,
             "ucnp_types_available": len(self.ucnp_specs),
-            "conversion_history_length": len(self.conversion_history),
+            "conversion_history_length": min(self._conv_head, self._history_capacity),
             "capabilities": {
                 "passive_conversion": True,
                 "nir_detection": True,
@@ -16,39 +16,155 @@ Version: 1.0.0 - Unified Integration
 """
 
 import asyncio
+import atexit
+import copy
 import logging
+import queue
 import time
 import json
-import os
 import sys
-from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any
+from datetime import datetime
+from logging.handlers import QueueHandler, QueueListener
+from typing import Dict, List, Mapping, Optional, Any, Tuple
 from dataclasses import dataclass
+from enum import IntEnum
 import numpy as np
-import pandas as pd
 from core.constants import SCHUMANN_RESONANCE
 
-# Configure comprehensive logging for unified operations
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('unified_operations.log'),
-        logging.StreamHandler(sys.stdout)
-    ]
-)
+try:
+    import orjson
+except ImportError:  # optional fast path for the JSON report writer
+    orjson = None
+
+try:
+    import uvloop
+except ImportError:  # optional faster event loop for the __main__ run
+    uvloop = None
+
+# Configure comprehensive logging for unified operations. File writes go
+# through an in-memory queue to a background listener thread, so logging
+# never blocks the event loop on disk I/O. The stdout handler stays on the
+# calling thread so console lines keep program order with main()'s summary.
+_log_formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+_log_file_handler = logging.FileHandler('unified_operations.log')
+_log_file_handler.setFormatter(_log_formatter)
+_log_stdout_handler = logging.StreamHandler(sys.stdout)
+_log_stdout_handler.setFormatter(_log_formatter)
+
+_log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+_log_listener = QueueListener(_log_queue, _log_file_handler)
+_log_listener.start()
+atexit.register(_log_listener.stop)  # drains the queue before exit
+
+# The queued message is formatted by the file handler, not by the queue handler
+_log_queue_handler = QueueHandler(_log_queue)
+_log_queue_handler.setFormatter(logging.Formatter('%(message)s'))
+logging.basicConfig(level=logging.INFO, handlers=[_log_queue_handler, _log_stdout_handler])
 
 logger = logging.getLogger(__name__)
 
-@dataclass
+def _json_default(obj: Any) -> Any:
+    """JSON fallback for read-only mappings; anything else is an error"""
+    if isinstance(obj, Mapping):
+        return dict(obj)
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+def _status_names(obj: Any) -> Any:
+    """Copy of obj with every Status replaced by its name, as shown in reports"""
+    if isinstance(obj, Status):
+        return obj.name
+    if isinstance(obj, Mapping):
+        return {key: _status_names(value) for key, value in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_status_names(value) for value in obj]
+    return obj
+
+def _json_bytes(obj: Any) -> bytes:
+    """Serialize obj as 2-space indented JSON bytes with a trailing newline"""
+    # Both encoders write IntEnums as bare ints, so names are swapped in first
+    obj = _status_names(obj)
+    if orjson is not None:
+        return orjson.dumps(obj, default=_json_default,
+                            option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE | orjson.OPT_SERIALIZE_NUMPY)
+    return (json.dumps(obj, indent=2, ensure_ascii=False, default=_json_default) + "\n").encode("utf-8")
+
+def _instantiate(template: Dict[str, Any]) -> Dict[str, Any]:
+    """Copy a record template, giving the copy its own nested dicts"""
+    return {key: dict(value) if isinstance(value, dict) else value for key, value in template.items()}
+
+class Status(IntEnum):
+    """Status of integrated systems, nodes and technologies; ``.name`` for display"""
+    PENDING = 0
+    ACTIVE = 1
+    INTEGRATED = 2
+    ACTIVATED = 3
+    COMPLETE = 4
+    ENHANCED = 5
+    INITIALIZING = 6
+
+@dataclass(frozen=True)
 class IntegrationStatus:
     """Status tracking for integrated systems"""
+    __slots__ = ("system_name", "status", "synchronization_level", "last_update_ns", "performance_metrics")
+    
     system_name: str
-    status: str
+    status: Status
     synchronization_level: float
-    last_update: datetime
+    last_update_ns: int  # time.monotonic_ns() of the last update
     performance_metrics: Dict[str, Any]
 
+@dataclass
+class ControllerStatus:
+    """Overall integration status of the master controller"""
+    __slots__ = ("overall_status", "synchronization_level", "systems_online", "total_systems", "last_update_ns")
+    
+    overall_status: Status
+    synchronization_level: float
+    systems_online: int
+    total_systems: int
+    last_update_ns: int  # time.monotonic_ns() of the last update
+    
+    def as_dict(self) -> Dict[str, Any]:
+        """Status fields as a plain dict, with the status shown by name"""
+        return {
+            'overall_status': self.overall_status.name,
+            'synchronization_level': self.synchronization_level,
+            'systems_online': self.systems_online,
+            'total_systems': self.total_systems,
+            'last_update_ns': self.last_update_ns
+        }
+
+# Static part of every Tesla-Solar hybrid system record
+_TESLA_SOLAR_HYBRID_BASE: Dict[str, Any] = {
+    'tesla_coil_specs': {
+        'primary_voltage': 10000.0,
+        'resonance_frequency': SCHUMANN_RESONANCE,
+        'enhancement_factor': 850
+    },
+    'solar_specs': {
+        'perovskite_efficiency': 0.471,  # 47.1% efficiency
+        'bifacial_gain': 0.20,  # 20% additional energy
+        'quantum_dot_enhancement': 0.15  # 15% efficiency boost
+    },
+    'crystal_resonance': {
+        'resonance_frequency': SCHUMANN_RESONANCE,
+        'amplification_factor': 100,
+        'field_strength': 2000  # V/m
+    },
+    'total_efficiency': 0.85,  # 85% combined efficiency
+    'power_output': 100000,  # 100 kW
+    'status': Status.ACTIVE
+}
+
+# Static part of every crystal resonance enhancement record
+_CRYSTAL_ENHANCEMENT_BASE: Dict[str, Any] = {
+    'resonance_frequency': 7.83,
+    'efficiency_boost': 0.25,  # 25% efficiency improvement
+    'field_amplification': 1000,  # V/m
+    'quantum_enhancement': True,
+    'status': Status.ENHANCED
+}
+
 class QuantumCrystalSolarCore:
     """
     🌟 Quantum-Crystal-Solar Core System
@@ -57,88 +173,108 @@ class QuantumCrystalSolarCore:
     to create revolutionary hybrid energy generation capabilities.
     """
     
-    def __init__(self):
+    # Categories of each technology registry, shared by all instances
+    _TESLA_KEYS = ('tesla_coils', 'scalar_generators', 'wardenclyffe_towers', 'free_energy_devices')
+    _CRYSTAL_KEYS = ('resonance_amplifiers', 'frequency_generators', 'energy_field_enhancers', 'quantum_entanglers')
+    _SOLAR_KEYS = ('perovskite_cells', 'bifacial_panels', 'quantum_dot_arrays', 'floating_solar_platforms')
+    _HYBRID_KEYS = ('tesla_solar_hybrids', 'crystal_solar_amplifiers', 'quantum_crystal_enhancers',
+                    'multi_source_generators')
+    
+    def __init__(self) -> None:
         """Initialize the quantum-crystal-solar core system"""
         self.logger = logging.getLogger(__name__)
         
-        # Core technology components
-        self.tesla_energy_systems = {
-            'tesla_coils': {},
-            'scalar_generators': {},
-            'wardenclyffe_towers': {},
-            'free_energy_devices': {}
-        }
-        
-        self.crystal_resonance_systems = {
-            'resonance_amplifiers': {},
-            'frequency_generators': {},
-            'energy_field_enhancers': {},
-            'quantum_entanglers': {}
-        }
-        
-        self.solar_technology_systems = {
-            'perovskite_cells': {},
-            'bifacial_panels': {},
-            'quantum_dot_arrays': {},
-            'floating_solar_platforms': {}
-        }
-        
-        self.hybrid_generation_systems = {
-            'tesla_solar_hybrids': {},
-            'crystal_solar_amplifiers': {},
-            'quantum_crystal_enhancers': {},
-            'multi_source_generators': {}
-        }
+        # Core technology components: one registry per category, keyed by system
+        # name (energy field enhancers by (solar_system, crystal_type))
+        cls = type(self)
+        self.tesla_energy_systems: Dict[str, Dict[str, Dict[str, Any]]] = {key: {} for key in cls._TESLA_KEYS}
+        self.crystal_resonance_systems: Dict[str, Dict[Any, Dict[str, Any]]] = {key: {} for key in cls._CRYSTAL_KEYS}
+        self.solar_technology_systems: Dict[str, Dict[str, Dict[str, Any]]] = {key: {} for key in cls._SOLAR_KEYS}
+        self.hybrid_generation_systems: Dict[str, Dict[str, Dict[str, Any]]] = {key: {} for key in cls._HYBRID_KEYS}
         
         self.logger.info("Quantum-Crystal-Solar Core initialized")
     
-    async def create_tesla_solar_hybrid(self, name: str, location: str) -> Dict[str, Any]:
+    def create_tesla_solar_hybrid(self, name: str, location: str) -> Dict[str, Any]:
         """Create Tesla-Solar hybrid energy system"""
-        hybrid_system = {
-            'name': name,
-            'location': location,
-            'tesla_coil_specs': {
-                'primary_voltage': 10000.0,
-                'resonance_frequency': SCHUMANN_RESONANCE,
-                'enhancement_factor': 850
-            },
-            'solar_specs': {
-                'perovskite_efficiency': 0.471,  # 47.1% efficiency
-                'bifacial_gain': 0.20,  # 20% additional energy
-                'quantum_dot_enhancement': 0.15  # 15% efficiency boost
-            },
-            'crystal_resonance': {
-                'resonance_frequency': SCHUMANN_RESONANCE,
-                'amplification_factor': 100,
-                'field_strength': 2000  # V/m
-            },
-            'total_efficiency': 0.85,  # 85% combined efficiency
-            'power_output': 100000,  # 100 kW
-            'status': 'ACTIVE'
-        }
+        hybrid_system = {'name': name, 'location': location, **_instantiate(_TESLA_SOLAR_HYBRID_BASE)}
         
         self.hybrid_generation_systems['tesla_solar_hybrids'][name] = hybrid_system
-        self.logger.info(f"Created Tesla-Solar hybrid system: {name}")
+        self.logger.info("Created Tesla-Solar hybrid system: %s", name)
         
         return hybrid_system
     
-    async def enhance_solar_with_crystal_resonance(self, solar_system: str, crystal_type: str) -> Dict[str, Any]:
+    def enhance_solar_with_crystal_resonance(self, solar_system: str, crystal_type: str) -> Dict[str, Any]:
         """Enhance solar system with crystal resonance amplification"""
-        enhancement = {
-            'solar_system': solar_system,
-            'crystal_type': crystal_type,
-            'resonance_frequency': 7.83,
-            'efficiency_boost': 0.25,  # 25% efficiency improvement
-            'field_amplification': 1000,  # V/m
-            'quantum_enhancement': True,
-            'status': 'ENHANCED'
-        }
+        enhancement = {'solar_system': solar_system, 'crystal_type': crystal_type, **_CRYSTAL_ENHANCEMENT_BASE}
         
-        self.crystal_resonance_systems['energy_field_enhancers'][f"{solar_system}_{crystal_type}"] = enhancement
-        self.logger.info(f"Enhanced solar system {solar_system} with {crystal_type} resonance")
+        self.crystal_resonance_systems['energy_field_enhancers'][(solar_system, crystal_type)] = enhancement
+        self.logger.info("Enhanced solar system %s with %s resonance", solar_system, crystal_type)
         
         return enhancement
 
+# Global technology integration tables (flattened into _GLOBAL_TECHNOLOGIES)
+_CHINESE_TECHNOLOGY: Dict[str, Any] = {
+    'perovskite_solar_cells': {'efficiency': 0.471, 'status': Status.INTEGRATED},
+    'bifacial_technology': {'energy_gain': 0.25, 'status': Status.INTEGRATED},
+    'floating_solar': {'capacity': 2.8e9, 'status': Status.INTEGRATED},  # 2.8 GW
+    'solid_state_batteries': {'energy_density': 500, 'status': Status.INTEGRATED},  # Wh/kg
+    'smart_grid': {'ai_optimization': True, 'status': Status.INTEGRATED},
+    'manufacturing_scale': {'capacity': 300e9, 'status': Status.INTEGRATED}  # 300 GW
+}
+
+_JAPANESE_TECHNOLOGY: Dict[str, Any] = {
+    'high_efficiency_solar': {'efficiency': 0.471, 'status': Status.INTEGRATED},
+    'quantum_dot_technology': {'next_gen_materials': True, 'status': Status.INTEGRATED},
+    'sodium_ion_batteries': {'cost_effective': True, 'status': Status.INTEGRATED},
+    'precision_manufacturing': {'industry_4_0': True, 'status': Status.INTEGRATED},
+    'ai_machine_learning': {'predictive_maintenance': True, 'status': Status.INTEGRATED},
+    'quality_standards': {'world_leading': True, 'status': Status.INTEGRATED}
+}
+
+_RUSSIAN_INTELLIGENCE: Dict[str, Any] = {
+    'quantum_materials': {'advanced_quantum_dots': True, 'status': Status.ACTIVATED},
+    'space_solar': {'orbital_generation': True, 'status': Status.ACTIVATED},
+    'quantum_computing': {'solar_optimization': True, 'status': Status.ACTIVATED},
+    'technology_intelligence': {'global_monitoring': True, 'status': Status.ACTIVATED},
+    'cybersecurity': {'advanced_protection': True, 'status': Status.ACTIVATED},
+    'arctic_solar': {'extreme_weather': True, 'status': Status.ACTIVATED}
+}
+
+_BRITISH_INTELLIGENCE: Dict[str, Any] = {
+    'perovskite_leadership': {'world_leading_stability': True, 'status': Status.ACTIVATED},
+    'smart_grid_technology': {'advanced_integration': True, 'status': Status.ACTIVATED},
+    'quantum_technology': {'quantum_sensors': True, 'status': Status.ACTIVATED},
+    'gchq_cybersecurity': {'advanced_protection': True, 'status': Status.ACTIVATED},
+    'mi6_intelligence': {'global_monitoring': True, 'status': Status.ACTIVATED},
+    'financial_intelligence': {'investment_analysis': True, 'status': Status.ACTIVATED}
+}
+
+# Integration report key and source table of each country, in row order of
+# the technology table's "country" code
+_TECH_COUNTRIES = ('chinese', 'japanese', 'russian', 'british')
+_TECH_REPORT_KEYS = ('chinese_integration', 'japanese_integration', 'russian_activation', 'british_activation')
+_TECH_TABLES = (_CHINESE_TECHNOLOGY, _JAPANESE_TECHNOLOGY, _RUSSIAN_INTELLIGENCE, _BRITISH_INTELLIGENCE)
+
+# One row per technology: country code, technology name, its headline metric
+# (booleans stored as 0/1) and Status code; anything but PENDING is online
+_GLOBAL_TECHNOLOGY_DTYPE = np.dtype([
+    ("country", "u1"), ("tech", "U32"), ("metric", "U32"), ("value", "f8"), ("status", "u1"),
+])
+
+def _build_technology_table() -> np.ndarray:
+    """Flatten the per-country technology tables into one read-only record array"""
+    rows = [
+        (country, tech, metric, float(spec[metric]), int(spec['status']))
+        for country, table in enumerate(_TECH_TABLES)
+        for tech, spec in table.items()
+        for metric in spec if metric != 'status'
+    ]
+    table = np.array(rows, dtype=_GLOBAL_TECHNOLOGY_DTYPE)
+    table.setflags(write=False)
+    return table
+
+_GLOBAL_TECHNOLOGIES = _build_technology_table()
+
 class GlobalIntelligenceNetwork:
     """
     🌍 Global Intelligence Network Integration
@@ -147,63 +283,93 @@ class GlobalIntelligenceNetwork:
     GLASSPHERE's quantum research capabilities.
     """
     
-    def __init__(self):
+    def __init__(self) -> None:
         """Initialize the global intelligence network"""
         self.logger = logging.getLogger(__name__)
         
-        # Global technology integration
-        self.chinese_technology = {
-            'perovskite_solar_cells': {'efficiency': 0.471, 'status': 'INTEGRATED'},
-            'bifacial_technology': {'energy_gain': 0.25, 'status': 'INTEGRATED'},
-            'floating_solar': {'capacity': 2.8e9, 'status': 'INTEGRATED'},  # 2.8 GW
-            'solid_state_batteries': {'energy_density': 500, 'status': 'INTEGRATED'},  # Wh/kg
-            'smart_grid': {'ai_optimization': True, 'status': 'INTEGRATED'},
-            'manufacturing_scale': {'capacity': 300e9, 'status': 'INTEGRATED'}  # 300 GW
-        }
-        
-        self.japanese_technology = {
-            'high_efficiency_solar': {'efficiency': 0.471, 'status': 'INTEGRATED'},
-            'quantum_dot_technology': {'next_gen_materials': True, 'status': 'INTEGRATED'},
-            'sodium_ion_batteries': {'cost_effective': True, 'status': 'INTEGRATED'},
-            'precision_manufacturing': {'industry_4_0': True, 'status': 'INTEGRATED'},
-            'ai_machine_learning': {'predictive_maintenance': True, 'status': 'INTEGRATED'},
-            'quality_standards': {'world_leading': True, 'status': 'INTEGRATED'}
-        }
-        
-        self.russian_intelligence = {
-            'quantum_materials': {'advanced_quantum_dots': True, 'status': 'ACTIVATED'},
-            'space_solar': {'orbital_generation': True, 'status': 'ACTIVATED'},
-            'quantum_computing': {'solar_optimization': True, 'status': 'ACTIVATED'},
-            'technology_intelligence': {'global_monitoring': True, 'status': 'ACTIVATED'},
-            'cybersecurity': {'advanced_protection': True, 'status': 'ACTIVATED'},
-            'arctic_solar': {'extreme_weather': True, 'status': 'ACTIVATED'}
-        }
-        
-        self.british_intelligence = {
-            'perovskite_leadership': {'world_leading_stability': True, 'status': 'ACTIVATED'},
-            'smart_grid_technology': {'advanced_integration': True, 'status': 'ACTIVATED'},
-            'quantum_technology': {'quantum_sensors': True, 'status': 'ACTIVATED'},
-            'gchq_cybersecurity': {'advanced_protection': True, 'status': 'ACTIVATED'},
-            'mi6_intelligence': {'global_monitoring': True, 'status': 'ACTIVATED'},
-            'financial_intelligence': {'investment_analysis': True, 'status': 'ACTIVATED'}
-        }
+        # Global technology integration, one record per technology
+        self.technologies: np.ndarray = _GLOBAL_TECHNOLOGIES
         
         self.logger.info("Global Intelligence Network initialized")
     
-    async def integrate_global_technologies(self) -> Dict[str, Any]:
+    def integrate_global_technologies(self, timestamp: Optional[str] = None) -> Dict[str, Any]:
         """Integrate all global technologies with GLASSPHERE research"""
-        integration_status = {
-            'chinese_integration': 'COMPLETE',
-            'japanese_integration': 'COMPLETE', 
-            'russian_activation': 'COMPLETE',
-            'british_activation': 'COMPLETE',
-            'total_technologies': 24,
-            'integration_level': 1.0,  # 100%
-            'timestamp': datetime.now().isoformat()
+        countries = self.technologies['country']
+        online = self.technologies['status'] != Status.PENDING
+        total = len(countries)
+        
+        # A country is complete once all of its technologies are online
+        country_total = np.bincount(countries, minlength=len(_TECH_COUNTRIES))
+        country_online = np.bincount(countries[online], minlength=len(_TECH_COUNTRIES))
+        integration_status: Dict[str, Any] = {
+            key: 'COMPLETE' if complete else 'IN_PROGRESS'
+            for key, complete in zip(_TECH_REPORT_KEYS, (country_online == country_total).tolist())
         }
+        online_count = int(np.count_nonzero(online))
+        integration_status.update({
+            'total_technologies': online_count,
+            'integration_level': online_count / total if total else 0.0,
+            'timestamp': timestamp or datetime.now().isoformat()
+        })
         
         self.logger.info("Global technology integration completed")
         return integration_status
+    
+    def get_technology(self, country: str, tech: str) -> Optional[np.void]:
+        """Record for one country's technology (read-only), or None if unknown"""
+        if country not in _TECH_COUNTRIES:
+            return None
+        table = self.technologies
+        matches = np.flatnonzero((table['country'] == _TECH_COUNTRIES.index(country)) & (table['tech'] == tech))
+        return table[matches[0]] if matches.size else None
+
+# Existing Tesla-PNAP network; each grid gets its own copy
+_EXISTING_NETWORK: Dict[str, Any] = {
+    'pyramid_nodes': {
+        'novasanctum_pyramid_central': {
+            'tesla_integration': True,
+            'ai_management': True,
+            'resonance_frequency': 7.83,
+            'activation_level': 0.10,
+            'status': Status.ACTIVE
+        },
+        'novasanctum_pyramid_peripheral': {
+            'tesla_integration': True,
+            'ai_management': True,
+            'resonance_frequency': 7.83,
+            'activation_level': 0.10,
+            'status': Status.ACTIVE
+        }
+    },
+    'tesla_systems': {
+        'tesla_coils': 2,
+        'scalar_generators': 2,
+        'wardenclyffe_towers': 1,
+        'free_energy_devices': 2
+    },
+    'synchronization_level': 0.95,  # 95%
+    'global_resonance': SCHUMANN_RESONANCE
+}
+
+# Static part of every solar energy node record
+_SOLAR_NODE_BASE: Dict[str, Any] = {
+    'technology': 'perovskite_bifacial_quantum_dot',
+    'efficiency': 0.471,  # 47.1%
+    'tesla_integration': True,
+    'crystal_resonance': True,
+    'ai_management': True,
+    'status': Status.ACTIVE
+}
+
+# Static part of every crystal resonance node record
+_CRYSTAL_NODE_BASE: Dict[str, Any] = {
+    'resonance_frequency': 7.83,
+    'amplification_factor': 100,
+    'tesla_integration': True,
+    'solar_enhancement': True,
+    'ai_management': True,
+    'status': Status.ACTIVE
+}
 
 class NovaSanctumGrid:
     """
@@ -213,40 +379,15 @@ class NovaSanctumGrid:
     while maintaining the 95% synchronization level.
     """
     
-    def __init__(self):
+    def __init__(self) -> None:
         """Initialize the NovaSanctum grid enhancement"""
         self.logger = logging.getLogger(__name__)
         
         # Existing Tesla-PNAP network
-        self.existing_network = {
-            'pyramid_nodes': {
-                'novasanctum_pyramid_central': {
-                    'tesla_integration': True,
-                    'ai_management': True,
-                    'resonance_frequency': 7.83,
-                    'activation_level': 0.10,
-                    'status': 'ACTIVE'
-                },
-                'novasanctum_pyramid_peripheral': {
-                    'tesla_integration': True,
-                    'ai_management': True,
-                    'resonance_frequency': 7.83,
-                    'activation_level': 0.10,
-                    'status': 'ACTIVE'
-                }
-            },
-            'tesla_systems': {
-                'tesla_coils': 2,
-                'scalar_generators': 2,
-                'wardenclyffe_towers': 1,
-                'free_energy_devices': 2
-            },
-            'synchronization_level': 0.95,  # 95%
-            'global_resonance': SCHUMANN_RESONANCE
-        }
+        self.existing_network: Dict[str, Any] = copy.deepcopy(_EXISTING_NETWORK)
         
         # New solar and crystal nodes
-        self.enhanced_nodes = {
+        self.enhanced_nodes: Dict[str, Dict[str, Dict[str, Any]]] = {
             'solar_energy_nodes': {},
             'crystal_resonance_nodes': {},
             'hybrid_nodes': {}
@@ -254,44 +395,72 @@ class NovaSanctumGrid:
         
         self.logger.info("NovaSanctum Grid Enhancement initialized")
     
-    async def add_solar_energy_node(self, name: str, location: str, capacity: float) -> Dict[str, Any]:
+    def add_solar_energy_node(self, name: str, location: str, capacity: float) -> Dict[str, Any]:
         """Add solar energy node to the NovaSanctum network"""
-        solar_node = {
-            'name': name,
-            'location': location,
-            'capacity': capacity,  # MW
-            'technology': 'perovskite_bifacial_quantum_dot',
-            'efficiency': 0.471,  # 47.1%
-            'tesla_integration': True,
-            'crystal_resonance': True,
-            'ai_management': True,
-            'status': 'ACTIVE'
-        }
+        solar_node = {'name': name, 'location': location, 'capacity': capacity, **_SOLAR_NODE_BASE}  # capacity in MW
         
         self.enhanced_nodes['solar_energy_nodes'][name] = solar_node
-        self.logger.info(f"Added solar energy node: {name}")
+        self.logger.info("Added solar energy node: %s", name)
         
         return solar_node
     
-    async def add_crystal_resonance_node(self, name: str, location: str, crystal_type: str) -> Dict[str, Any]:
+    def add_crystal_resonance_node(self, name: str, location: str, crystal_type: str) -> Dict[str, Any]:
         """Add crystal resonance node to the NovaSanctum network"""
-        crystal_node = {
-            'name': name,
-            'location': location,
-            'crystal_type': crystal_type,
-            'resonance_frequency': 7.83,
-            'amplification_factor': 100,
-            'tesla_integration': True,
-            'solar_enhancement': True,
-            'ai_management': True,
-            'status': 'ACTIVE'
-        }
+        crystal_node = {'name': name, 'location': location, 'crystal_type': crystal_type, **_CRYSTAL_NODE_BASE}
         
         self.enhanced_nodes['crystal_resonance_nodes'][name] = crystal_node
-        self.logger.info(f"Added crystal resonance node: {name}")
+        self.logger.info("Added crystal resonance node: %s", name)
         
         return crystal_node
 
+# AI system coordination table; each manager gets its own copy
+_AI_SYSTEMS: Dict[str, Any] = {
+    'lilith_eve': {
+        'role': 'Grid Management',
+        'capabilities': [
+            'Grid regulation and optimization',
+            'Resonance frequency management',
+            'Energy distribution control',
+            'Quantum communication management'
+        ],
+        'status': Status.ACTIVE,
+        'integration_level': 1.0
+    },
+    'athena_mist': {
+        'role': 'Safety Oversight',
+        'capabilities': [
+            'Safety monitoring and alerts',
+            'Ethical compliance verification',
+            'Conflict resolution and mediation',
+            'Emergency response coordination'
+        ],
+        'status': Status.ACTIVE,
+        'integration_level': 1.0
+    },
+    'solascension_ai': {
+        'role': 'Global Intelligence',
+        'capabilities': [
+            'Global technology monitoring',
+            'Economic impact analysis',
+            'Strategic planning and optimization',
+            'International collaboration management'
+        ],
+        'status': Status.ACTIVE,
+        'integration_level': 1.0
+    },
+    'master_orchestrator': {
+        'role': 'System Coordination',
+        'capabilities': [
+            'Cross-system communication',
+            'Performance optimization',
+            'Resource allocation',
+            'Strategic decision making'
+        ],
+        'status': Status.ACTIVE,
+        'integration_level': 1.0
+    }
+}
+
 class UnifiedAIManagement:
     """
     🧠 Unified AI Management System
@@ -300,61 +469,16 @@ class UnifiedAIManagement:
     for optimal orchestration of the integrated platform.
     """
     
-    def __init__(self):
+    def __init__(self) -> None:
         """Initialize the unified AI management system"""
         self.logger = logging.getLogger(__name__)
         
         # AI system coordination
-        self.ai_systems = {
-            'lilith_eve': {
-                'role': 'Grid Management',
-                'capabilities': [
-                    'Grid regulation and optimization',
-                    'Resonance frequency management',
-                    'Energy distribution control',
-                    'Quantum communication management'
-                ],
-                'status': 'ACTIVE',
-                'integration_level': 1.0
-            },
-            'athena_mist': {
-                'role': 'Safety Oversight',
-                'capabilities': [
-                    'Safety monitoring and alerts',
-                    'Ethical compliance verification',
-                    'Conflict resolution and mediation',
-                    'Emergency response coordination'
-                ],
-                'status': 'ACTIVE',
-                'integration_level': 1.0
-            },
-            'solascension_ai': {
-                'role': 'Global Intelligence',
-                'capabilities': [
-                    'Global technology monitoring',
-                    'Economic impact analysis',
-                    'Strategic planning and optimization',
-                    'International collaboration management'
-                ],
-                'status': 'ACTIVE',
-                'integration_level': 1.0
-            },
-            'master_orchestrator': {
-                'role': 'System Coordination',
-                'capabilities': [
-                    'Cross-system communication',
-                    'Performance optimization',
-                    'Resource allocation',
-                    'Strategic decision making'
-                ],
-                'status': 'ACTIVE',
-                'integration_level': 1.0
-            }
-        }
+        self.ai_systems: Dict[str, Any] = copy.deepcopy(_AI_SYSTEMS)
         
         self.logger.info("Unified AI Management System initialized")
     
-    async def coordinate_ai_systems(self) -> Dict[str, Any]:
+    def coordinate_ai_systems(self, timestamp: Optional[str] = None) -> Dict[str, Any]:
         """Coordinate all AI systems for optimal performance"""
         coordination_status = {
             'ai_coordination': 'ACTIVE',
@@ -362,12 +486,44 @@ class UnifiedAIManagement:
             'performance_optimization': 'ENABLED',
             'safety_monitoring': 'ACTIVE',
             'strategic_planning': 'ENABLED',
-            'timestamp': datetime.now().isoformat()
+            'timestamp': timestamp or datetime.now().isoformat()
         }
         
         self.logger.info("AI systems coordination completed")
         return coordination_status
 
+# Economic impact projections; each engine gets its own copy
+_ECONOMIC_PROJECTIONS: Dict[str, Any] = {
+    'job_creation': {
+        'manufacturing_jobs': 15000000,  # 15 million
+        'technology_jobs': 5000000,  # 5 million
+        'research_jobs': 3000000,  # 3 million
+        'support_jobs': 2000000,  # 2 million
+        'total_jobs': 25000000  # 25 million total
+    },
+    'revenue_generation': {
+        'technology_licensing': 400000000000,  # $400 billion
+        'manufacturing_exports': 500000000000,  # $500 billion
+        'energy_generation': 300000000000,  # $300 billion
+        'research_services': 200000000000,  # $200 billion
+        'consulting_services': 100000000000,  # $100 billion
+        'total_revenue': 1500000000000  # $1.5 trillion
+    },
+    'cost_savings': {
+        'energy_costs': 0.70,  # 70% reduction
+        'manufacturing_costs': 0.50,  # 50% reduction
+        'deployment_costs': 0.40,  # 40% reduction
+        'total_savings_10yr': 2500000000000  # $2.5 trillion over 10 years
+    },
+    'investment_returns': {
+        'federal_investment': 200000000000,  # $200 billion
+        'private_investment': 500000000000,  # $500 billion
+        'international_investment': 300000000000,  # $300 billion
+        'total_investment': 1000000000000,  # $1 trillion
+        'roi_timeline': 5  # 5 years
+    }
+}
+
 class EconomicImpactEngine:
     """
     💰 Economic Impact Engine
@@ -376,53 +532,32 @@ class EconomicImpactEngine:
     GLASSPHERE-SolAscension-NovaSanctum platform.
     """
     
-    def __init__(self):
+    def __init__(self) -> None:
         """Initialize the economic impact engine"""
         self.logger = logging.getLogger(__name__)
         
         # Economic impact projections
-        self.economic_projections = {
-            'job_creation': {
-                'manufacturing_jobs': 15000000,  # 15 million
-                'technology_jobs': 5000000,  # 5 million
-                'research_jobs': 3000000,  # 3 million
-                'support_jobs': 2000000,  # 2 million
-                'total_jobs': 25000000  # 25 million total
-            },
-            'revenue_generation': {
-                'technology_licensing': 400000000000,  # $400 billion
-                'manufacturing_exports': 500000000000,  # $500 billion
-                'energy_generation': 300000000000,  # $300 billion
-                'research_services': 200000000000,  # $200 billion
-                'consulting_services': 100000000000,  # $100 billion
-                'total_revenue': 1500000000000  # $1.5 trillion
-            },
-            'cost_savings': {
-                'energy_costs': 0.70,  # 70% reduction
-                'manufacturing_costs': 0.50,  # 50% reduction
-                'deployment_costs': 0.40,  # 40% reduction
-                'total_savings_10yr': 2500000000000  # $2.5 trillion over 10 years
-            },
-            'investment_returns': {
-                'federal_investment': 200000000000,  # $200 billion
-                'private_investment': 500000000000,  # $500 billion
-                'international_investment': 300000000000,  # $300 billion
-                'total_investment': 1000000000000,  # $1 trillion
-                'roi_timeline': 5  # 5 years
-            }
-        }
+        self.economic_projections: Dict[str, Any] = copy.deepcopy(_ECONOMIC_PROJECTIONS)
+        
+        # The numeric kernel module (and Numba) loads on first use, not on import
+        from core.economics import aggregate_impact, impact_inputs
+        self._aggregate_impact = aggregate_impact
+        self._impact_inputs: Tuple[np.ndarray, ...] = impact_inputs(self.economic_projections)
         
         self.logger.info("Economic Impact Engine initialized")
     
-    async def calculate_integrated_impact(self) -> Dict[str, Any]:
+    def calculate_integrated_impact(self, timestamp: Optional[str] = None) -> Dict[str, Any]:
         """Calculate comprehensive economic impact of integrated platform"""
+        jobs, revenue, savings, investment = self._aggregate_impact(*self._impact_inputs)
+        
         impact_analysis = {
-            'total_jobs_created': 25000000,
-            'annual_revenue': 1500000000000,
-            'cost_savings_10yr': 2500000000000,
-            'roi_timeline': 5,
+            'total_jobs_created': int(jobs),
+            'annual_revenue': int(revenue),
+            'cost_savings_10yr': int(savings),
+            'total_investment': int(investment),
+            'roi_timeline': self.economic_projections['investment_returns']['roi_timeline'],
             'market_dominance': 'GLOBAL_LEADERSHIP',
-            'timestamp': datetime.now().isoformat()
+            'timestamp': timestamp or datetime.now().isoformat()
         }
         
         self.logger.info("Integrated economic impact calculated")
@@ -437,7 +572,7 @@ class GLASSPHERE_SolAscension_MasterController:
     quantum-crystal-solar research platform.
     """
     
-    def __init__(self):
+    def __init__(self) -> None:
         """Initialize the unified master controller"""
         self.logger = logging.getLogger(__name__)
         
@@ -449,38 +584,40 @@ class GLASSPHERE_SolAscension_MasterController:
         self.economic_impact_engine = EconomicImpactEngine()
         
         # Integration status tracking
-        self.integration_status = {
-            'overall_status': 'INITIALIZING',
-            'synchronization_level': 0.0,
-            'systems_online': 0,
-            'total_systems': 5,
-            'last_update': datetime.now()
-        }
+        self.integration_status: ControllerStatus = ControllerStatus(
+            overall_status=Status.INITIALIZING,
+            synchronization_level=0.0,
+            systems_online=0,
+            total_systems=5,
+            last_update_ns=time.monotonic_ns()
+        )
         
         self.logger.info("GLASSPHERE-SolAscension-NovaSanctum Master Controller initialized")
     
-    async def initialize_integration(self) -> Dict[str, Any]:
+    async def initialize_integration(self) -> ControllerStatus:
         """Initialize the complete integration of all systems"""
         self.logger.info("Starting complete system integration...")
         
-        # Initialize all core systems
-        await self.quantum_crystal_solar_core.create_tesla_solar_hybrid("unified_hybrid_01", "Global_Center")
-        await self.global_intelligence_network.integrate_global_technologies()
-        await self.novasanctum_grid.add_solar_energy_node("solar_node_01", "Global_Center", 100.0)
-        await self.novasanctum_grid.add_crystal_resonance_node("crystal_node_01", "Global_Center", "quartz")
-        await self.unified_ai_management.coordinate_ai_systems()
-        await self.economic_impact_engine.calculate_integrated_impact()
+        # One wall-clock read stamps the whole integration pass
+        timestamp = datetime.now().isoformat()
+        
+        # Initialize all core systems (plain in-memory setup, no awaits needed)
+        self.quantum_crystal_solar_core.create_tesla_solar_hybrid("unified_hybrid_01", "Global_Center")
+        self.global_intelligence_network.integrate_global_technologies(timestamp=timestamp)
+        self.novasanctum_grid.add_solar_energy_node("solar_node_01", "Global_Center", 100.0)
+        self.novasanctum_grid.add_crystal_resonance_node("crystal_node_01", "Global_Center", "quartz")
+        self.unified_ai_management.coordinate_ai_systems(timestamp=timestamp)
+        self.economic_impact_engine.calculate_integrated_impact(timestamp=timestamp)
         
         # Update integration status
-        self.integration_status.update({
-            'overall_status': 'ACTIVE',
-            'synchronization_level': 0.95,
-            'systems_online': 5,
-            'last_update': datetime.now()
-        })
+        status = self.integration_status
+        status.overall_status = Status.ACTIVE
+        status.synchronization_level = 0.95
+        status.systems_online = 5
+        status.last_update_ns = time.monotonic_ns()
         
         self.logger.info("Complete system integration successful")
-        return self.integration_status
+        return status
     
     async def run_unified_operations(self) -> Dict[str, Any]:
         """Run coordinated operations across all integrated systems"""
@@ -533,8 +670,14 @@ class GLASSPHERE_SolAscension_MasterController:
         
         self.logger.info("Integration report generated")
         return report
+    
+    def save_integration_report(self, report: Dict[str, Any], path: str) -> None:
+        """Write an integration report to path as JSON in a single write"""
+        with open(path, 'wb') as report_file:
+            report_file.write(_json_bytes(report))
+        self.logger.info("Integration report saved to %s", path)
 
-async def main():
+async def main() -> None:
     """Main function to run the unified master controller"""
     logger.info("🌟 Starting GLASSPHERE-SolAscension-NovaSanctum Unified Integration")
     
@@ -543,29 +686,37 @@ async def main():
     
     # Initialize integration
     integration_status = await master_controller.initialize_integration()
-    logger.info(f"Integration Status: {integration_status}")
+    logger.info("Integration Status: %s", integration_status.as_dict())
     
     # Run unified operations
     operations_status = await master_controller.run_unified_operations()
-    logger.info(f"Operations Status: {operations_status}")
+    logger.info("Operations Status: %s", operations_status)
     
     # Generate integration report
     integration_report = await master_controller.generate_integration_report()
     logger.info("Integration Report Generated Successfully")
     
-    # Print summary
-    print("\n" + "="*80)
-    print("🌟 GLASSPHERE-SolAscension-NovaSanctum Integration Complete!")
-    print("="*80)
-    print(f"📊 Integration Status: {integration_status['overall_status']}")
-    print(f"🔄 Synchronization Level: {integration_status['synchronization_level']*100:.1f}%")
-    print(f"🤖 Systems Online: {integration_status['systems_online']}/{integration_status['total_systems']}")
-    print(f"💼 Jobs Created: {integration_report['economic_impact']['jobs_created']:,}")
-    print(f"💰 Annual Revenue: ${integration_report['economic_impact']['annual_revenue']:,}")
-    print(f"📈 Cost Savings (10yr): ${integration_report['economic_impact']['cost_savings_10yr']:,}")
-    print("="*80)
+    # Print summary in a single write
+    economic_impact = integration_report['economic_impact']
+    rule = "=" * 80
+    sys.stdout.write("\n".join((
+        "",
+        rule,
+        "🌟 GLASSPHERE-SolAscension-NovaSanctum Integration Complete!",
+        rule,
+        f"📊 Integration Status: {integration_status.overall_status.name}",
+        f"🔄 Synchronization Level: {integration_status.synchronization_level*100:.1f}%",
+        f"🤖 Systems Online: {integration_status.systems_online}/{integration_status.total_systems}",
+        f"💼 Jobs Created: {economic_impact['jobs_created']:,}",
+        f"💰 Annual Revenue: ${economic_impact['annual_revenue']:,}",
+        f"📈 Cost Savings (10yr): ${economic_impact['cost_savings_10yr']:,}",
+        rule,
+    )) + "\n")
+    sys.stdout.flush()
     
     logger.info("🌟 GLASSPHERE-SolAscension-NovaSanctum Integration Successful!")
 
 if __name__ == "__main__":
-    asyncio.run(main()) 
+    if uvloop is not None:
+        uvloop.install()
+    asyncio.run(main())